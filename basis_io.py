@@ -0,0 +1,46 @@
+import os
+import numpy as np
+from typing import Dict, Union
+
+
+def save_basis(path: Union[str, os.PathLike], basis: Dict):
+    """
+    Guardar una base en un archivo .npz compacto
+
+    El archivo tiene tres arreglos enteros: las variables básicas por
+    fila, las variables no básicas en su cota superior y la forma del
+    problema (n variables, m restricciones), que load_basis usa para
+    adaptar la base si el problema cambió de tamaño.
+
+    Args:
+        path: Ruta del archivo; se usa tal cual (sin agregar .npz), así
+            load_basis y initial_basis la encuentran con el mismo nombre
+        basis: Diccionario de SimplexSolver.current_basis o result['basis']
+    """
+    with open(path, 'wb') as f:
+        np.savez(f,
+                 basic_vars=np.asarray(basis['basic_vars'], dtype=np.int32),
+                 at_upper=np.asarray(basis.get('at_upper', []), dtype=np.int32),
+                 shape=np.array([basis.get('n_vars', -1), basis.get('n_constraints', -1)],
+                                dtype=np.int64))
+
+
+def load_basis(path: Union[str, os.PathLike]) -> Dict:
+    """
+    Leer una base guardada con save_basis
+
+    Args:
+        path: Ruta del archivo .npz
+
+    Returns:
+        Diccionario con 'basic_vars', 'at_upper', 'n_vars' y
+        'n_constraints' (-1 si no se conocían), listo para initial_basis
+    """
+    with np.load(path) as data:
+        n_vars, n_constraints = (int(v) for v in data['shape'])
+        return {
+            'basic_vars': data['basic_vars'].tolist(),
+            'at_upper': data['at_upper'].tolist(),
+            'n_vars': n_vars,
+            'n_constraints': n_constraints
+        }
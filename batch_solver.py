@@ -0,0 +1,158 @@
+import numpy as np
+from typing import Dict, Optional
+from simplex_solver import SimplexSolver
+
+# Pivoteos degenerados seguidos tras los cuales un problema sale del lote
+DEGENERATE_WINDOW = 20
+
+
+def solve_batch(C: np.ndarray, A: np.ndarray, B: np.ndarray,
+                max_iterations: Optional[int] = None, tolerance: float = 1e-10) -> Dict:
+    """
+    Resolver muchos problemas de maximización de la misma forma a la vez
+
+    Los tableaus se apilan en un arreglo 3-D de (k, m+1, n+m+1) y todos los
+    problemas pivotean en paralelo con la misma regla que SimplexSolver
+    (Dantzig y prueba del cociente mínimo). Los problemas que terminan
+    (óptimos o no acotados) se retiran del arreglo de trabajo, de modo que
+    cada iteración solo opera sobre los que siguen activos.
+
+    Los problemas con algún lado derecho negativo necesitan fase 1 y se
+    resuelven uno por uno con SimplexSolver.solve. Un problema que lleva
+    DEGENERATE_WINDOW pivoteos degenerados seguidos (paso cero, posible
+    ciclo) también sale del lote y se termina con SimplexSolver.solve desde
+    su base actual, que tiene protección contra ciclos; así no arrastra a
+    los demás hasta el límite de iteraciones.
+
+    Args:
+        C: Coeficientes objetivo, (k, n)
+        A: Matriz de restricciones compartida (m, n) o una por problema (k, m, n)
+        B: Lados derechos, (k, m) o (m,) si es el mismo para todos
+        max_iterations: Límite de pivoteos por problema (por defecto
+            max(100, 10·(m + n)), igual que SimplexSolver.solve)
+        tolerance: Tolerancia numérica
+
+    Returns:
+        Diccionario con arreglos por problema: 'status' ('optimal',
+        'unbounded', 'infeasible' o 'iteration_limit'), 'solution' (k, n; NaN si no es
+        óptimo), 'optimal_value' (k,; NaN si no es óptimo) e
+        'iteration_count' (k,)
+    """
+    C = np.atleast_2d(np.asarray(C, dtype=float))
+    n_problems, n_vars = C.shape
+    A = np.asarray(A, dtype=float)
+    if A.ndim == 2:
+        A = np.broadcast_to(A, (n_problems,) + A.shape)
+    n_constraints = A.shape[1]
+    B = np.broadcast_to(np.asarray(B, dtype=float), (n_problems, n_constraints))
+
+    status = np.full(n_problems, 'iteration_limit', dtype=object)
+    if max_iterations is None:
+        max_iterations = max(100, 10 * (n_constraints + n_vars))
+    solution = np.full((n_problems, n_vars), np.nan)
+    optimal_value = np.full(n_problems, np.nan)
+    iteration_count = np.zeros(n_problems, dtype=int)
+
+    # Tableaus apilados: [A | I | b] y fila Z [-c | 0 | 0]
+    n_cols = n_vars + n_constraints
+    tableau = np.zeros((n_problems, n_constraints + 1, n_cols + 1))
+    tableau[:, :n_constraints, :n_vars] = A
+    tableau[:, :n_constraints, n_vars:n_cols] = np.eye(n_constraints)
+    tableau[:, :n_constraints, -1] = B
+    tableau[:, -1, :n_vars] = -C
+    basic_vars = np.tile(np.arange(n_vars, n_cols), (n_problems, 1))
+
+    # Los problemas con b < 0 no parten de una base factible
+    needs_phase_one = np.any(B < -tolerance, axis=1)
+    for k in np.flatnonzero(needs_phase_one):
+        result = SimplexSolver().solve(C[k], A[k], B[k], history='none',
+                                       max_iterations=max_iterations)
+        status[k] = result['status']
+        iteration_count[k] = result.get('iteration_count', 0)
+        if result['status'] == 'optimal':
+            solution[k] = result['solution']
+            optimal_value[k] = result['optimal_value']
+
+    active = np.flatnonzero(~needs_phase_one)
+    tableau = tableau[active]
+    basic_vars = basic_vars[active]
+    degenerate_streak = np.zeros(len(active), dtype=int)
+
+    for iteration in range(max_iterations + 1):
+        if len(active) == 0:
+            break
+        local = np.arange(len(active))
+
+        # Columna entrante: el costo reducido más negativo de cada problema
+        pivot_col = np.argmin(tableau[:, -1, :-1], axis=1)
+        finished = tableau[local, -1, pivot_col] >= -tolerance
+
+        # Prueba del cociente mínimo por problema
+        col = tableau[local, :-1, pivot_col]
+        rhs = tableau[:, :-1, -1]
+        positive = col > tolerance
+        ratios = np.full(col.shape, np.inf)
+        np.divide(rhs, col, out=ratios, where=positive)
+        np.maximum(ratios, 0.0, out=ratios)
+        pivot_row = np.argmin(ratios, axis=1)
+        unbounded = ~finished & ~np.any(positive, axis=1)
+
+        # Pasos de longitud cero seguidos: el problema puede estar ciclando
+        degenerate = ratios[local, pivot_row] <= tolerance
+        degenerate_streak = np.where(degenerate, degenerate_streak + 1, 0)
+        stalled = ~finished & ~unbounded & (degenerate_streak >= DEGENERATE_WINDOW)
+
+        done = finished | unbounded | stalled
+        if iteration == max_iterations:
+            done[:] = True
+
+        if np.any(done):
+            # Extraer resultados de los problemas terminados
+            for local_idx in np.flatnonzero(done):
+                k = active[local_idx]
+                iteration_count[k] = iteration
+                if finished[local_idx]:
+                    values = np.zeros(n_cols)
+                    values[basic_vars[local_idx]] = tableau[local_idx, :-1, -1]
+                    status[k] = 'optimal'
+                    solution[k] = values[:n_vars]
+                    optimal_value[k] = tableau[local_idx, -1, -1]
+                elif unbounded[local_idx]:
+                    status[k] = 'unbounded'
+                elif stalled[local_idx] and iteration < max_iterations:
+                    result = SimplexSolver().solve(
+                        C[k], A[k], B[k], history='none',
+                        max_iterations=max_iterations - iteration,
+                        initial_basis={'basic_vars': basic_vars[local_idx].tolist()})
+                    status[k] = result['status']
+                    iteration_count[k] = iteration + result.get('iteration_count', 0)
+                    if result['status'] == 'optimal':
+                        solution[k] = result['solution']
+                        optimal_value[k] = result['optimal_value']
+
+            keep = ~done
+            active = active[keep]
+            tableau = tableau[keep]
+            basic_vars = basic_vars[keep]
+            degenerate_streak = degenerate_streak[keep]
+            pivot_col = pivot_col[keep]
+            pivot_row = pivot_row[keep]
+            col = col[keep]
+            local = np.arange(len(active))
+            if len(active) == 0:
+                break
+
+        # Pivoteo simultáneo: fila pivote normalizada y actualización de rango 1
+        pivot_rows = tableau[local, pivot_row, :] / col[local, pivot_row][:, np.newaxis]
+        factors = tableau[local, :, pivot_col]
+        factors[local, pivot_row] = 0.0
+        tableau -= factors[:, :, np.newaxis] * pivot_rows[:, np.newaxis, :]
+        tableau[local, pivot_row, :] = pivot_rows
+        basic_vars[local, pivot_row] = pivot_col
+
+    return {
+        'status': status,
+        'solution': solution,
+        'optimal_value': optimal_value,
+        'iteration_count': iteration_count
+    }
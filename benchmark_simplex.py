@@ -0,0 +1,388 @@
+"""
+Benchmark del paso de pivoteo del método Simplex.
+
+Compara el ciclo original (prueba del cociente con una lista de tuplas y
+eliminación fila por fila) contra la versión vectorizada de SimplexSolver
+(prueba del cociente enmascarada y actualización de rango 1 sobre buffers
+preasignados) en tableaus altos de m = 100 ... 5000 restricciones.
+
+Con --threads compara el pivoteo en un hilo contra el reparto de filas
+entre hilos en tableaus alrededor de PARALLEL_PIVOT_SIZE elementos, para
+ver desde qué tamaño conviene usar hilos.
+
+Con --backends resuelve problemas generados de distintas formas (tamaño,
+densidad y proporción filas/columnas) con cada motor registrado en
+solver_registry y muestra cuál es el más rápido y cuál elige la selección
+automática; de ahí salen los umbrales de choose_backend.
+
+Con --revised compara el tableau denso contra el Simplex revisado (forma
+producto de la inversa) con A densa y con A dispersa, para ver en qué
+formas de problema el método revisado es más rápido.
+
+Uso:
+    python benchmark_simplex.py
+    python benchmark_simplex.py --sizes 100 500 1000 --pivots 20 --vars 50
+    python benchmark_simplex.py --threads 1 2 4 8
+    python benchmark_simplex.py --backends
+    python benchmark_simplex.py --revised
+"""
+import argparse
+import time
+from typing import List, Tuple
+
+import numpy as np
+
+from simplex_solver import SimplexSolver, PARALLEL_PIVOT_SIZE
+
+
+def build_tableau(n_constraints: int, n_vars: int, seed: int = 0) -> np.ndarray:
+    """
+    Construir un tableau inicial aleatorio con base de holguras
+
+    Args:
+        n_constraints: Número de restricciones (m)
+        n_vars: Número de variables de decisión (n)
+        seed: Semilla del generador aleatorio
+
+    Returns:
+        Tableau de (m+1) x (n+m+1)
+    """
+    rng = np.random.default_rng(seed)
+    tableau = np.zeros((n_constraints + 1, n_vars + n_constraints + 1))
+    tableau[:n_constraints, :n_vars] = rng.uniform(0.0, 10.0, (n_constraints, n_vars))
+    tableau[:n_constraints, n_vars:n_vars + n_constraints] = np.eye(n_constraints)
+    tableau[:n_constraints, -1] = rng.uniform(50.0, 100.0, n_constraints)
+    tableau[-1, :n_vars] = -rng.uniform(1.0, 10.0, n_vars)
+    return tableau
+
+
+def legacy_pivots(tableau: np.ndarray, n_pivots: int) -> List[Tuple[int, int]]:
+    """
+    Ejecutar pivoteos con el ciclo original en Python
+
+    Args:
+        tableau: Tableau a modificar en el lugar
+        n_pivots: Número máximo de pivoteos
+
+    Returns:
+        Lista de pivoteos (fila, columna) realizados
+    """
+    n_constraints = tableau.shape[0] - 1
+    pivots = []
+
+    for _ in range(n_pivots):
+        if np.all(tableau[-1, :-1] >= -1e-10):
+            break
+        pivot_col = np.argmin(tableau[-1, :-1])
+
+        ratios = []
+        for i in range(n_constraints):
+            if tableau[i, pivot_col] > 1e-10:
+                ratio = tableau[i, -1] / tableau[i, pivot_col]
+                ratios.append((ratio, i))
+            else:
+                ratios.append((float('inf'), i))
+
+        min_ratio = float('inf')
+        pivot_row = -1
+        for ratio, idx in ratios:
+            if 0 <= ratio < min_ratio:
+                min_ratio = ratio
+                pivot_row = idx
+
+        if pivot_row == -1:
+            break
+
+        pivot_element = tableau[pivot_row, pivot_col]
+        tableau[pivot_row, :] /= pivot_element
+        for i in range(n_constraints + 1):
+            if i != pivot_row:
+                factor = tableau[i, pivot_col]
+                tableau[i, :] -= factor * tableau[pivot_row, :]
+
+        pivots.append((pivot_row, int(pivot_col)))
+
+    return pivots
+
+
+def vectorized_pivots(tableau: np.ndarray, n_pivots: int,
+                      n_threads: int = 1) -> List[Tuple[int, int]]:
+    """
+    Ejecutar pivoteos con el núcleo vectorizado de SimplexSolver
+
+    Args:
+        tableau: Tableau a modificar en el lugar
+        n_pivots: Número máximo de pivoteos
+        n_threads: Hilos para la eliminación de filas (se usan aunque el
+            tableau sea menor que PARALLEL_PIVOT_SIZE)
+
+    Returns:
+        Lista de pivoteos (fila, columna) realizados
+    """
+    n_constraints = tableau.shape[0] - 1
+    n_columns = tableau.shape[1] - 1
+    solver = SimplexSolver()
+    solver._n_threads = n_threads
+    solver._parallel_pivot_size = 0
+    solver.column_upper = np.full(n_columns, np.inf)
+    solver.complemented = np.zeros(n_columns, dtype=bool)
+    basic_vars = list(range(n_columns - n_constraints, n_columns))
+    solver._prepare_workspace(tableau, basic_vars)
+    pivots = []
+
+    for _ in range(n_pivots):
+        pivot_col = int(np.argmin(tableau[-1, :-1]))
+        if tableau[-1, pivot_col] >= -1e-10:
+            break
+
+        pivot_row, _, _ = solver._ratio_test(tableau, pivot_col)
+        if pivot_row == -1:
+            break
+
+        solver._pivot(tableau, pivot_row, pivot_col)
+        basic_vars[pivot_row] = pivot_col
+        solver._set_basic_upper(pivot_row, pivot_col)
+        pivots.append((pivot_row, pivot_col))
+
+    return pivots
+
+
+def run_benchmark(sizes: List[int], n_vars: int, n_pivots: int, repeats: int):
+    """
+    Medir ambos núcleos e imprimir la tabla de resultados
+
+    Args:
+        sizes: Valores de m a medir
+        n_vars: Número de variables de decisión
+        n_pivots: Pivoteos por medición
+        repeats: Repeticiones (se reporta el mejor tiempo)
+    """
+    print(f"{'m':>6} {'columnas':>9} {'original (ms/piv)':>18} "
+          f"{'vectorizado (ms/piv)':>21} {'aceleración':>12}")
+    print("-" * 70)
+
+    for m in sizes:
+        base = build_tableau(m, n_vars)
+        best = {'legacy': float('inf'), 'vectorized': float('inf')}
+        done = {}
+
+        for name, kernel in (('legacy', legacy_pivots), ('vectorized', vectorized_pivots)):
+            for _ in range(repeats):
+                tableau = base.copy()
+                start = time.perf_counter()
+                pivots = kernel(tableau, n_pivots)
+                elapsed = time.perf_counter() - start
+                best[name] = min(best[name], elapsed / max(len(pivots), 1))
+                done[name] = (pivots, tableau)
+
+        # Ambos núcleos deben seguir exactamente la misma secuencia
+        if done['legacy'][0] != done['vectorized'][0] or \
+                not np.allclose(done['legacy'][1], done['vectorized'][1]):
+            print(f"{m:>6}  ADVERTENCIA: los resultados no coinciden")
+
+        speedup = best['legacy'] / best['vectorized']
+        print(f"{m:>6} {base.shape[1]:>9} {best['legacy'] * 1e3:>18.3f} "
+              f"{best['vectorized'] * 1e3:>21.3f} {speedup:>11.1f}x")
+
+
+def run_thread_benchmark(thread_counts: List[int], n_vars: int, n_pivots: int, repeats: int):
+    """
+    Medir el pivoteo con distintas cantidades de hilos
+
+    Los tableaus van de PARALLEL_PIVOT_SIZE / 8 a 8 · PARALLEL_PIVOT_SIZE
+    elementos. Los tiempos se reportan relativos a un hilo: por debajo de
+    1.0x el reparto entre hilos cuesta más de lo que gana.
+
+    Args:
+        thread_counts: Cantidades de hilos a comparar
+        n_vars: Número de variables de decisión
+        n_pivots: Pivoteos por medición
+        repeats: Repeticiones (se reporta el mejor tiempo)
+    """
+    counts = sorted(set([1] + thread_counts))
+    header = ''.join(f"{f'{k} hilos':>12}" for k in counts[1:])
+    print(f"{'m':>6} {'elementos':>11} {'1 hilo (ms/piv)':>16}{header}")
+    print("-" * (34 + 12 * (len(counts) - 1)))
+
+    for scale in (1 / 8, 1 / 4, 1 / 2, 1, 2, 4, 8):
+        # Tableau de (m+1) x (n+m+1) con unos scale · PARALLEL_PIVOT_SIZE elementos
+        target = scale * PARALLEL_PIVOT_SIZE
+        m = int((-(n_vars + 2) + np.sqrt((n_vars + 2) ** 2 + 4 * (target - n_vars - 1))) / 2)
+        base = build_tableau(m, n_vars)
+        best = {}
+        reference = None
+        for k in counts:
+            best[k] = float('inf')
+            for _ in range(repeats):
+                tableau = base.copy()
+                start = time.perf_counter()
+                pivots = vectorized_pivots(tableau, n_pivots, k)
+                elapsed = time.perf_counter() - start
+                best[k] = min(best[k], elapsed / max(len(pivots), 1))
+            if reference is None:
+                reference = tableau
+            elif not np.array_equal(reference, tableau):
+                print(f"{m:>6}  ADVERTENCIA: {k} hilos no da el mismo tableau")
+
+        speedups = ''.join(f"{best[1] / best[k]:>11.2f}x" for k in counts[1:])
+        print(f"{m:>6} {base.size:>11} {best[1] * 1e3:>16.3f}{speedups}")
+
+
+# Formas de problema para --backends: (m, n, densidad)
+BACKEND_PROFILES = [
+    (10, 20, 1.0), (30, 60, 1.0), (50, 100, 1.0), (100, 100, 1.0),
+    (150, 150, 1.0), (250, 250, 1.0), (400, 400, 1.0),
+    (100, 300, 0.03), (300, 600, 0.01), (600, 1200, 0.005),
+    (30, 300, 1.0), (40, 800, 1.0), (80, 1000, 0.2), (60, 600, 0.3),
+    (100, 1000, 1.0), (500, 500, 0.02), (1000, 2000, 0.003)
+]
+
+
+def build_problem(n_constraints: int, n_vars: int, density: float, seed: int = 0):
+    """
+    Construir un problema max c·x, A·x <= b acotado y factible en el origen
+
+    Args:
+        n_constraints: Número de restricciones (m)
+        n_vars: Número de variables (n)
+        density: Fracción de coeficientes no nulos de A
+        seed: Semilla del generador aleatorio
+
+    Returns:
+        Tuple con (c, A, b)
+    """
+    rng = np.random.default_rng(seed)
+    A = rng.uniform(0.1, 10.0, (n_constraints, n_vars))
+    A[rng.random((n_constraints, n_vars)) > density] = 0.0
+    # Cada variable aparece en alguna fila para que el problema sea acotado
+    empty = np.flatnonzero(~A.any(axis=0))
+    A[rng.integers(0, n_constraints, len(empty)), empty] = rng.uniform(0.1, 10.0, len(empty))
+    b = rng.uniform(50.0, 100.0, n_constraints)
+    c = rng.uniform(1.0, 10.0, n_vars)
+    return c, A, b
+
+
+def run_backend_benchmark(repeats: int):
+    """
+    Medir cada motor registrado sobre BACKEND_PROFILES
+
+    El motor exacto se omite (usa aritmética entera sin límite y nunca se
+    elige automáticamente).
+
+    Args:
+        repeats: Repeticiones (se reporta el mejor tiempo)
+    """
+    from solver_registry import BACKENDS, choose_backend, problem_profile, solve
+
+    names = [name for name in BACKENDS if name != 'exact']
+    header = ''.join(f"{name:>16}" for name in names)
+    print(f"{'m':>5} {'n':>5} {'dens.':>6}{header} {'más rápido':>15} {'elegido':>15}")
+    print("-" * (18 + 16 * len(names) + 32))
+
+    for m, n, density in BACKEND_PROFILES:
+        c, A, b = build_problem(m, n, density)
+        times = {}
+        values = {}
+        for name in names:
+            best = float('inf')
+            for _ in range(repeats):
+                start = time.perf_counter()
+                result = solve((c, A, b), method=name, history='none')
+                best = min(best, time.perf_counter() - start)
+            times[name] = best
+            values[name] = result.get('optimal_value')
+        reference = values['tableau']
+        cells = ''
+        for name in names:
+            ok = values[name] is not None and np.isclose(values[name], reference, rtol=1e-6)
+            cells += f"{times[name] * 1e3:>14.1f}{'  ' if ok else ' !'}"
+        fastest = min(times, key=times.get)
+        chosen, _ = choose_backend(problem_profile(A, b, None, None))
+        print(f"{m:>5} {n:>5} {density:>6.3f}{cells} {fastest:>15} {chosen:>15}")
+    print("Tiempos en ms; '!' marca un valor óptimo distinto del tableau")
+
+
+# Formas de problema para --revised: (m, n, densidad)
+REVISED_PROFILES = [
+    (100, 100, 1.0), (300, 300, 1.0), (100, 1000, 1.0),
+    (100, 1000, 0.05), (200, 2000, 0.01), (200, 5000, 0.01), (100, 10000, 0.005),
+    (300, 900, 0.01), (500, 1500, 0.005), (1000, 3000, 0.002), (2000, 2000, 0.002)
+]
+
+
+def run_revised_benchmark(repeats: int):
+    """
+    Medir el tableau denso contra el Simplex revisado sobre REVISED_PROFILES
+
+    Por pivoteo, el tableau actualiza (m+1)·(n+m+1) elementos; el método
+    revisado hace un ftran y un btran (un producto denso de la base
+    refactorizada más las etas desde la última refactorización) y calcula
+    precios con A^T·y, que con A dispersa solo recorre sus no ceros. Los
+    tres motores hacen los mismos pivoteos, así que la diferencia es el
+    costo por pivoteo.
+
+    Args:
+        repeats: Repeticiones (se reporta el mejor tiempo)
+    """
+    from revised_simplex import RevisedSimplexSolver
+    from sparse_matrix import SparseMatrix
+
+    print(f"{'m':>5} {'n':>6} {'dens.':>6} {'pivoteos':>9} {'tableau ms':>11} "
+          f"{'revisado ms':>12} {'disperso ms':>12} {'aceleración':>12}")
+    print("-" * 80)
+    for m, n, density in REVISED_PROFILES:
+        c, A, b = build_problem(m, n, density)
+        inputs = {'tableau': A, 'revisado': A, 'disperso': SparseMatrix.from_dense(A)}
+        times = {}
+        values = {}
+        for name, matrix in inputs.items():
+            best = float('inf')
+            for _ in range(repeats):
+                solver = SimplexSolver() if name == 'tableau' else RevisedSimplexSolver()
+                start = time.perf_counter()
+                result = solver.solve(c, matrix, b, history='none')
+                best = min(best, time.perf_counter() - start)
+            times[name] = best
+            values[name] = result.get('optimal_value')
+        pivots = result.get('iteration_count', 0)
+        ok = all(v is not None and np.isclose(v, values['tableau'], rtol=1e-6)
+                 for v in values.values())
+        speedup = times['tableau'] / min(times['revisado'], times['disperso'])
+        print(f"{m:>5} {n:>6} {density:>6.3f} {pivots:>9} {times['tableau'] * 1e3:>11.1f} "
+              f"{times['revisado'] * 1e3:>12.1f} {times['disperso'] * 1e3:>12.1f} "
+              f"{speedup:>11.2f}x{'' if ok else ' !'}")
+    print("Aceleración: tableau / mejor revisado; '!' marca un valor óptimo distinto del tableau")
+
+
+def main():
+    """Función principal"""
+    parser = argparse.ArgumentParser(description="Benchmark del pivoteo Simplex")
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=[100, 250, 500, 1000, 2000, 5000],
+                        help="Número de restricciones m a medir")
+    parser.add_argument('--vars', type=int, default=50,
+                        help="Número de variables de decisión n")
+    parser.add_argument('--pivots', type=int, default=10,
+                        help="Pivoteos por medición")
+    parser.add_argument('--repeats', type=int, default=3,
+                        help="Repeticiones por tamaño")
+    parser.add_argument('--threads', type=int, nargs='+',
+                        help="Comparar el pivoteo con estas cantidades de hilos")
+    parser.add_argument('--backends', action='store_true',
+                        help="Comparar los motores de solver_registry")
+    parser.add_argument('--revised', action='store_true',
+                        help="Comparar el tableau con el Simplex revisado")
+    args = parser.parse_args()
+
+    if args.backends:
+        run_backend_benchmark(args.repeats)
+    elif args.revised:
+        run_revised_benchmark(args.repeats)
+    elif args.threads:
+        run_thread_benchmark(args.threads, args.vars, args.pivots, args.repeats)
+    else:
+        run_benchmark(args.sizes, args.vars, args.pivots, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
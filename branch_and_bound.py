@@ -0,0 +1,511 @@
+import heapq
+import math
+import os
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from simplex_solver import SimplexSolver
+from lp_model import LPModel
+
+# Datos del problema en cada proceso trabajador (se envían una sola vez)
+_worker_problem = None
+_worker_incumbent = None
+
+
+def _init_worker(c: np.ndarray, A: np.ndarray, b: np.ndarray, options: Dict, incumbent):
+    """
+    Guardar el problema y la cota compartida en el proceso trabajador
+
+    Args:
+        c: Coeficientes de la función objetivo
+        A: Matriz de restricciones
+        b: Lado derecho
+        options: Opciones para SimplexSolver.solve
+        incumbent: multiprocessing.Value con el valor de la mejor solución entera
+    """
+    global _worker_problem, _worker_incumbent
+    _worker_problem = (c, A, b, options)
+    _worker_incumbent = incumbent
+
+
+def _solve_node(lower: np.ndarray, upper: np.ndarray, basis: Optional[Dict],
+                integer: np.ndarray, tolerance: float) -> Dict:
+    """
+    Resolver la relajación lineal de un nodo (en un proceso trabajador)
+
+    Si la relajación no mejora la mejor solución entera compartida se poda
+    sin devolver la solución; si es entera y la mejora, se actualiza la
+    cota compartida para que los demás procesos poden antes.
+
+    Args:
+        lower: Cotas inferiores del nodo
+        upper: Cotas superiores del nodo
+        basis: Base del nodo padre para arrancar en caliente
+        integer: Máscara de variables enteras
+        tolerance: Tolerancia de integralidad
+
+    Returns:
+        Diccionario con 'status', 'bound', 'solution', 'basis' e 'iterations'
+    """
+    c, A, b, options = _worker_problem
+    return _evaluate(c, A, b, lower, upper, basis, integer, tolerance, options, _worker_incumbent)
+
+
+def _evaluate(c: np.ndarray, A: np.ndarray, b: np.ndarray, lower: np.ndarray,
+              upper: np.ndarray, basis: Optional[Dict], integer: np.ndarray,
+              tolerance: float, options: Dict, incumbent) -> Dict:
+    """
+    Resolver un nodo y clasificarlo frente a la mejor solución entera
+
+    Args:
+        c: Coeficientes de la función objetivo
+        A: Matriz de restricciones
+        b: Lado derecho
+        lower: Cotas inferiores del nodo
+        upper: Cotas superiores del nodo
+        basis: Base de partida (o None)
+        integer: Máscara de variables enteras
+        tolerance: Tolerancia de integralidad
+        options: Opciones para SimplexSolver.solve
+        incumbent: multiprocessing.Value o lista de un elemento con el valor
+            de la mejor solución entera
+
+    Returns:
+        Diccionario con 'status' ('infeasible', 'unbounded', 'pruned',
+        'integer', 'fractional' o el estado del solver), 'bound',
+        'solution', 'basis' e 'iterations'
+    """
+    solver = SimplexSolver()
+    result = solver.solve(c, A, b, lower, upper, initial_basis=basis, **options)
+    return _classify(result, solver, integer, tolerance, incumbent)
+
+
+def _classify(result: Dict, solver: SimplexSolver, integer: np.ndarray,
+              tolerance: float, incumbent) -> Dict:
+    """
+    Clasificar la relajación de un nodo frente a la mejor solución entera
+
+    Args:
+        result: Resultado de SimplexSolver.solve
+        solver: Solver que lo produjo (para exportar la base)
+        integer: Máscara de variables enteras
+        tolerance: Tolerancia de integralidad
+        incumbent: Valor de la mejor solución entera (compartido o local)
+
+    Returns:
+        Diccionario del nodo (ver _evaluate)
+    """
+    node = {'status': result['status'], 'bound': -math.inf, 'solution': None,
+            'basis': None, 'iterations': result.get('iteration_count', 0)}
+    if result['status'] != 'optimal':
+        return node
+
+    bound = float(result['optimal_value'])
+    node['bound'] = bound
+    if bound <= _read(incumbent) + _gap_tolerance(bound):
+        node['status'] = 'pruned'
+        return node
+
+    solution = result['solution']
+    fractional = np.abs(solution - np.round(solution)) > tolerance
+    if not np.any(fractional & integer):
+        node['status'] = 'integer'
+        _offer(incumbent, bound)
+    else:
+        node['status'] = 'fractional'
+        node['basis'] = solver.current_basis()
+    node['solution'] = solution
+    return node
+
+
+def _gap_tolerance(value: float) -> float:
+    """Diferencia mínima para considerar que una cota mejora a otra"""
+    return 1e-9 * (1.0 + abs(value))
+
+
+def _read(incumbent) -> float:
+    """Leer la mejor solución entera (compartida o local)"""
+    return incumbent.value if hasattr(incumbent, 'value') else incumbent[0]
+
+
+def _offer(incumbent, value: float):
+    """Actualizar la mejor solución entera si value la mejora"""
+    if hasattr(incumbent, 'get_lock'):
+        with incumbent.get_lock():
+            if value > incumbent.value:
+                incumbent.value = value
+    elif value > incumbent[0]:
+        incumbent[0] = value
+
+
+class BranchAndBound:
+    """
+    Ramificación y acotamiento para problemas enteros mixtos.
+
+    Resuelve max c·x, A·x <= b, lower <= x <= upper con las variables
+    marcadas como enteras. Cada nodo es la relajación lineal con cotas más
+    ajustadas, resuelta con SimplexSolver.solve partiendo de la base del
+    nodo padre (pocos pivoteos del Simplex dual). Se ramifica sobre la
+    variable más fraccionaria: x_j <= floor(v) y x_j >= ceil(v).
+
+    Los nodos abiertos se evalúan en un pool de procesos. El valor de la
+    mejor solución entera se comparte entre procesos (multiprocessing.Value)
+    para que cada trabajador pode apenas resuelve un nodo que ya no puede
+    mejorarla. La selección de nodos es por mejor cota ('best_bound', cierra
+    la brecha) o en profundidad ('depth_first', encuentra soluciones enteras
+    antes y usa menos memoria).
+    """
+
+    NODE_SELECTION = ('best_bound', 'depth_first')
+
+    def __init__(self, n_workers: Optional[int] = None, node_selection: str = 'best_bound',
+                 max_nodes: int = 10000, tolerance: float = 1e-6,
+                 time_limit: Optional[float] = None):
+        """
+        Configurar la búsqueda
+
+        Args:
+            n_workers: Procesos del pool (por defecto os.cpu_count()); con 1
+                los nodos se resuelven en el proceso actual
+            node_selection: 'best_bound' o 'depth_first'
+            max_nodes: Límite de nodos evaluados
+            tolerance: Tolerancia de integralidad
+            time_limit: Segundos de reloj disponibles (None sin límite)
+        """
+        if node_selection not in self.NODE_SELECTION:
+            raise ValueError(f"Selección de nodos no válida: {node_selection}. "
+                             f"Opciones: {', '.join(self.NODE_SELECTION)}")
+        self.n_workers = n_workers or os.cpu_count() or 1
+        self.node_selection = node_selection
+        self.max_nodes = max_nodes
+        self.tolerance = tolerance
+        self.time_limit = time_limit
+
+    def solve(self, c: np.ndarray, A: np.ndarray, b: np.ndarray,
+              integer: Optional[np.ndarray] = None,
+              lower: Optional[np.ndarray] = None, upper: Optional[np.ndarray] = None,
+              split_pairs: Optional[List[Tuple[int, int]]] = None, **options) -> Dict:
+        """
+        Resolver el problema entero
+
+        Args:
+            c: Coeficientes de la función objetivo
+            A: Matriz de restricciones
+            b: Valores del lado derecho
+            integer: Máscara de variables enteras (por defecto todas)
+            lower: Cotas inferiores (por defecto 0)
+            upper: Cotas superiores (por defecto infinito)
+            split_pairs: Pares (parte positiva, parte negativa) de columnas
+                enteras que representan una misma variable libre; los nodos
+                con ambas partes >= 1 se descartan porque repiten puntos de
+                otras ramas (sin esto la búsqueda puede no terminar)
+            **options: Opciones para SimplexSolver.solve en cada nodo
+                (pricing, anti_cycling, max_iterations, ...); la relajación
+                de la raíz usa además history y history_size
+
+        Returns:
+            Diccionario con 'status' ('optimal', 'infeasible', 'unbounded',
+            'node_limit' o 'time_limit'), 'solution' y 'optimal_value' de la
+            mejor solución entera, 'iterations' de la relajación de la raíz y
+            'bnb' con nodos, podas, profundidad, cota de la raíz, brecha y tiempo
+        """
+        start = time.perf_counter()
+        self._split_pairs = np.asarray(split_pairs or [], dtype=np.int64).reshape(-1, 2)
+        c = np.asarray(c, dtype=float)
+        b = np.asarray(b, dtype=float)
+        A = np.asarray(A, dtype=float).reshape(len(b), len(c))
+        n_vars = len(c)
+        integer = np.ones(n_vars, dtype=bool) if integer is None else np.asarray(integer, dtype=bool)
+        lower = np.zeros(n_vars) if lower is None else np.maximum(np.asarray(lower, dtype=float), 0.0)
+        upper = np.full(n_vars, np.inf) if upper is None else np.asarray(upper, dtype=float)
+
+        # Las cotas de las variables enteras pueden redondearse hacia adentro
+        lower = np.where(integer, np.ceil(lower - self.tolerance), lower)
+        upper = np.where(integer & np.isfinite(upper), np.floor(upper + self.tolerance), upper)
+
+        # Relajación de la raíz en este proceso (con el historial pedido);
+        # los nodos no guardan historial
+        root_solver = SimplexSolver()
+        root = root_solver.solve(c, A, b, lower, upper, **options)
+        options['history'] = 'none'
+        options.pop('history_size', None)
+        stats = {'nodes': 1, 'pruned': 0, 'max_depth': 0,
+                 'lp_iterations': root.get('iteration_count', 0),
+                 'workers': self.n_workers, 'node_selection': self.node_selection,
+                 'root_bound': float(root.get('optimal_value', math.nan))}
+        if root['status'] != 'optimal':
+            stats['time'] = time.perf_counter() - start
+            root['bnb'] = stats
+            return root
+
+        incumbent = [-math.inf]
+        first = _classify(root, root_solver, integer, self.tolerance, incumbent)
+        if first['status'] == 'integer':
+            best_solution, status = first['solution'], 'optimal'
+            stats.update(time=time.perf_counter() - start, open_bound=-math.inf)
+        else:
+            open_nodes = self._branch(first, lower, upper, integer, depth=1, counter=0)
+            best_solution, status = self._search(c, A, b, integer, options, open_nodes, stats, start)
+
+        open_bound = stats.pop('open_bound')
+        result = {
+            'iterations': root['iterations'],
+            'variable_names': root_solver.variable_names,
+            'bnb': stats
+        }
+        if best_solution is None:
+            if status == 'optimal':
+                result.update(status='infeasible', message='El problema no tiene solución entera factible')
+            else:
+                result.update(status=status, message=self._limit_message(status))
+            return result
+
+        value = float(c @ best_solution)
+        stats['gap'] = max(0.0, open_bound - value)
+        result.update({
+            'status': status,
+            'message': 'Solución entera óptima' if status == 'optimal' else self._limit_message(status),
+            'solution': np.where(integer, np.round(best_solution), best_solution),
+            'optimal_value': value
+        })
+        return result
+
+    def solve_model(self, model: LPModel, **options) -> Dict:
+        """
+        Resolver un LPModel respetando model.integer
+
+        Las cotas de las variables enteras se redondean hacia adentro antes
+        de llevar el modelo a la forma estándar, así los traslados son
+        enteros y una columna es entera si y solo si lo es la variable
+        original (las partes de una variable libre también se piden enteras).
+
+        Args:
+            model: Modelo con la máscara de variables enteras
+            **options: Opciones para solve
+
+        Returns:
+            Diccionario de solve con la solución en el espacio del modelo
+        """
+        integer = model.integer
+        tightened = LPModel(model.c, model.A, model.row_lower, model.row_upper,
+                            np.where(integer, np.ceil(model.lower - self.tolerance), model.lower),
+                            np.where(integer, np.floor(model.upper + self.tolerance), model.upper),
+                            model.maximize, model.objective_constant, model.variable_names,
+                            model.constraint_names, integer, model.name)
+        invalid = tightened.check_bounds()
+        if invalid is not None:
+            return invalid
+        c, A, b, lower, upper = tightened.to_standard_form()
+        _, _, extra = tightened._column_map
+        std_integer = np.concatenate([integer, integer[extra]])
+        split_pairs = [(int(j), len(integer) + k) for k, j in enumerate(extra) if integer[j]]
+        result = self.solve(c, A, b, std_integer, lower, upper, split_pairs, **options)
+        return tightened.recover_result(result)
+
+    def _search(self, c: np.ndarray, A: np.ndarray, b: np.ndarray, integer: np.ndarray,
+                options: Dict, open_nodes: List, stats: Dict,
+                start: float) -> Tuple[Optional[np.ndarray], str]:
+        """
+        Evaluar los nodos abiertos hasta vaciar la cola o llegar a un límite
+
+        Args:
+            c: Coeficientes de la función objetivo
+            A: Matriz de restricciones
+            b: Lado derecho
+            integer: Máscara de variables enteras
+            options: Opciones para SimplexSolver.solve
+            open_nodes: Nodos iniciales (ver _branch)
+            stats: Estadísticas a completar (agrega 'open_bound', la mejor
+                cota de los nodos sin evaluar, y 'time')
+            start: Momento de inicio (perf_counter)
+
+        Returns:
+            Tuple con (mejor solución entera o None, estado)
+        """
+        queue = []
+        counter = len(open_nodes)
+        self._push_children(queue, open_nodes)
+
+        best_solution = None
+        best_value = -math.inf
+        pool = None
+        shared = [-math.inf]
+        if self.n_workers > 1:
+            shared = multiprocessing.Value('d', -math.inf)
+            pool = ProcessPoolExecutor(self.n_workers, initializer=_init_worker,
+                                       initargs=(c, A, b, options, shared))
+        pending = {}
+        status = 'optimal'
+        try:
+            while queue or pending:
+                if self.time_limit is not None and time.perf_counter() - start > self.time_limit:
+                    status = 'time_limit'
+                    break
+                # Llenar el pool con los mejores nodos abiertos
+                while queue and len(pending) < 2 * self.n_workers:
+                    if stats['nodes'] >= self.max_nodes:
+                        break
+                    node = self._pop(queue)
+                    if node['bound'] <= _read(shared) + _gap_tolerance(node['bound']):
+                        stats['pruned'] += 1
+                        continue
+                    stats['nodes'] += 1
+                    stats['max_depth'] = max(stats['max_depth'], node['depth'])
+                    args = (node['lower'], node['upper'], node['basis'], integer, self.tolerance)
+                    if pool is not None:
+                        pending[pool.submit(_solve_node, *args)] = node
+                        continue
+                    evaluated = _evaluate(c, A, b, *args, options, shared)
+                    counter = self._process(evaluated, node, queue, integer, stats, counter)
+                    if evaluated['status'] == 'integer' and evaluated['bound'] > best_value:
+                        best_solution, best_value = evaluated['solution'], evaluated['bound']
+                if not pending:
+                    if queue and stats['nodes'] >= self.max_nodes:
+                        status = 'node_limit'
+                        break
+                    continue
+
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    node = pending.pop(future)
+                    evaluated = future.result()
+                    counter = self._process(evaluated, node, queue, integer, stats, counter)
+                    if evaluated['status'] == 'integer' and evaluated['bound'] > best_value:
+                        best_solution, best_value = evaluated['solution'], evaluated['bound']
+        finally:
+            if pool is not None:
+                for future in pending:
+                    future.cancel()
+                pool.shutdown(wait=True, cancel_futures=True)
+
+        # Los trabajadores publican en el incumbente compartido el valor de
+        # cada solución entera apenas la encuentran, y otros nodos ya se
+        # podaron contra él: hay que guardar las soluciones de los nodos que
+        # terminaron (shutdown esperó a los que estaban corriendo)
+        for future in [f for f in pending if f.done() and not f.cancelled()]:
+            node = pending.pop(future)
+            evaluated = future.result()
+            counter = self._process(evaluated, node, queue, integer, stats, counter)
+            if evaluated['status'] == 'integer' and evaluated['bound'] > best_value:
+                best_solution, best_value = evaluated['solution'], evaluated['bound']
+
+        open_nodes = [entry[2] if isinstance(entry, tuple) else entry for entry in queue]
+        open_nodes += list(pending.values())
+        stats['open_bound'] = max((node['bound'] for node in open_nodes), default=-math.inf)
+        stats['time'] = time.perf_counter() - start
+        return best_solution, status
+
+    def _process(self, evaluated: Dict, node: Dict, queue: List, integer: np.ndarray,
+                 stats: Dict, counter: int) -> int:
+        """
+        Incorporar el resultado de un nodo: podar o ramificar
+
+        Args:
+            evaluated: Resultado de _evaluate
+            node: Nodo evaluado
+            queue: Cola de nodos abiertos
+            integer: Máscara de variables enteras
+            stats: Estadísticas
+            counter: Contador para desempatar la cola
+
+        Returns:
+            Contador actualizado
+        """
+        stats['lp_iterations'] += evaluated['iterations']
+        if evaluated['status'] == 'fractional':
+            children = self._branch(evaluated, node['lower'], node['upper'], integer,
+                                    node['depth'] + 1, counter)
+            self._push_children(queue, children)
+            counter += len(children)
+        elif evaluated['status'] != 'integer':
+            stats['pruned'] += 1
+        return counter
+
+    def _branch(self, evaluated: Dict, lower: np.ndarray, upper: np.ndarray,
+                integer: np.ndarray, depth: int, counter: int) -> List[Dict]:
+        """
+        Crear los dos hijos sobre la variable entera más fraccionaria
+
+        Args:
+            evaluated: Resultado del nodo padre (solución, cota y base)
+            lower: Cotas inferiores del padre
+            upper: Cotas superiores del padre
+            integer: Máscara de variables enteras
+            depth: Profundidad de los hijos
+            counter: Contador para desempatar la cola
+
+        Returns:
+            Lista con los nodos hijos, primero la rama más cercana al valor
+            fraccionario
+        """
+        solution = evaluated['solution']
+        fraction = np.abs(solution - np.floor(solution) - 0.5)
+        fraction[~integer] = np.inf
+        j = int(np.argmin(fraction))
+        value = solution[j]
+
+        down_upper = upper.copy()
+        down_upper[j] = math.floor(value)
+        up_lower = lower.copy()
+        up_lower[j] = math.ceil(value)
+        common = {'bound': evaluated['bound'], 'basis': evaluated['basis'], 'depth': depth}
+        down = dict(common, lower=lower, upper=down_upper)
+        up = dict(common, lower=up_lower, upper=upper)
+        children = [up, down] if value - math.floor(value) > 0.5 else [down, up]
+        pairs = self._split_pairs
+        if len(pairs):
+            # Un punto con ambas partes >= 1 equivale a restarles 1 a las dos
+            children = [child for child in children
+                        if not np.any((child['lower'][pairs[:, 0]] >= 1)
+                                      & (child['lower'][pairs[:, 1]] >= 1))]
+        for k, child in enumerate(children):
+            child['order'] = counter + k
+        return children
+
+    def _push_children(self, queue: List, children: List[Dict]):
+        """
+        Agregar los hijos de un nodo de modo que el primero se evalúe antes
+
+        Args:
+            queue: Cola de nodos abiertos
+            children: Hijos en orden de preferencia
+        """
+        ordered = reversed(children) if self.node_selection == 'depth_first' else children
+        for child in ordered:
+            self._push(queue, child)
+
+    def _push(self, queue: List, node: Dict):
+        """
+        Agregar un nodo abierto según la regla de selección
+
+        Args:
+            queue: Cola (montículo por cota o pila)
+            node: Nodo abierto
+        """
+        if self.node_selection == 'best_bound':
+            heapq.heappush(queue, (-node['bound'], node['order'], node))
+        else:
+            queue.append(node)
+
+    def _pop(self, queue: List) -> Dict:
+        """
+        Sacar el siguiente nodo a evaluar
+
+        Args:
+            queue: Cola de nodos abiertos
+
+        Returns:
+            Nodo con mejor cota o el último agregado (en profundidad)
+        """
+        if self.node_selection == 'best_bound':
+            return heapq.heappop(queue)[2]
+        return queue.pop()
+
+    @staticmethod
+    def _limit_message(status: str) -> str:
+        """Mensaje de una búsqueda detenida por un límite"""
+        if status == 'node_limit':
+            return 'Se alcanzó el límite de nodos; se devuelve la mejor solución entera encontrada'
+        return 'Se alcanzó el límite de tiempo; se devuelve la mejor solución entera encontrada'
@@ -0,0 +1,374 @@
+import numpy as np
+from fractions import Fraction
+from math import lcm
+from typing import Dict, List, Optional, Tuple
+from simplex_solver import SimplexSolver
+from iteration_history import IterationHistory
+
+
+def to_fraction(value) -> Fraction:
+    """
+    Convertir un dato del problema a fracción exacta
+
+    Los float se convierten desde su representación decimal más corta
+    (0.1 da 1/10 y no la fracción binaria exacta del float).
+
+    Args:
+        value: Entero, float, Fraction o string ('3/4', '0.25')
+
+    Returns:
+        Fracción equivalente
+    """
+    if isinstance(value, (float, np.floating)):
+        return Fraction(repr(float(value)))
+    if isinstance(value, np.integer):
+        return Fraction(int(value))
+    return Fraction(value)
+
+
+class ExactSimplexSolver(SimplexSolver):
+    """
+    Método Simplex en aritmética exacta con pivoteo de Bareiss.
+
+    El tableau se guarda como una matriz de enteros M y un denominador
+    común D (el tableau real es M / D). Al pivotear sobre M[r, k] todas las
+    filas i != r se actualizan con
+
+        M[i, j] = (M[r, k]·M[i, j] - M[i, k]·M[r, j]) / D
+
+    donde la división es exacta (identidad de Sylvester) y el nuevo
+    denominador es D = M[r, k]. Los enteros crecen como los determinantes
+    de la base y nunca hace falta calcular un máximo común divisor, así que
+    es mucho más rápido que operar con Fraction elemento por elemento.
+
+    Usa las mismas reglas que un cálculo a mano: entra la variable con el
+    costo reducido más negativo y sale la primera fila con el cociente
+    mínimo (Bland si se repite una base). Los lados derechos negativos se
+    resuelven con una fase 1 del Simplex dual con el objetivo en cero.
+
+    El historial guarda los tableaus como fracciones exactas y el resultado
+    tiene el mismo formato que SimplexSolver.solve, más 'exact' con la
+    solución y el valor óptimo como Fraction.
+    """
+
+    def __init__(self):
+        """Inicializar el solver exacto"""
+        super().__init__()
+        self.denominator = 1
+
+    def solve(self, c, A, b, history: str = 'full', history_size: int = 10,
+              max_iterations: Optional[int] = None) -> Dict:
+        """
+        Resolver max c·x, A·x <= b, x >= 0 en aritmética exacta
+
+        Args:
+            c: Coeficientes de la función objetivo (enteros, float, Fraction o strings)
+            A: Matriz de restricciones
+            b: Valores del lado derecho (pueden ser negativos)
+            history: Modo del historial ('none', 'summary', 'ring' o 'full')
+            history_size: Tamaño del anillo en 'ring'
+            max_iterations: Límite de pivoteos (por defecto escala con m + n)
+
+        Returns:
+            Diccionario con la solución (mismo formato que SimplexSolver.solve)
+            y 'exact' con 'solution' y 'optimal_value' como Fraction
+        """
+        if history == 'replay':
+            raise ValueError("El modo exacto no admite el historial 'replay'")
+        self._configure('dantzig', 'none')
+        c = [to_fraction(v) for v in np.ravel(np.asarray(c, dtype=object))]
+        b = [to_fraction(v) for v in np.ravel(np.asarray(b, dtype=object))]
+        n_vars = len(c)
+        n_constraints = len(b)
+        A = [[to_fraction(v) for v in row]
+             for row in np.asarray(A, dtype=object).reshape(n_constraints, n_vars)]
+
+        self.variable_names = [f'x{i+1}' for i in range(n_vars)]
+        self.slack_variable_names = [f's{i+1}' for i in range(n_constraints)]
+        self.iterations = IterationHistory(self.variable_names + self.slack_variable_names,
+                                           history, history_size)
+        self.column_upper = np.full(n_vars + n_constraints, np.inf)
+        self.complemented = np.zeros(n_vars + n_constraints, dtype=bool)
+        self.iterations.set_column_upper(self.column_upper)
+        self._problem = {
+            'c': np.array([float(v) for v in c]),
+            'A': np.array([[float(v) for v in row] for row in A]).reshape(n_constraints, n_vars),
+            'b': np.array([float(v) for v in b]),
+            'lower': np.zeros(n_vars),
+            'upper': np.full(n_vars, np.inf)
+        }
+        self._exact_c = c
+
+        # Cada fila se multiplica por el mínimo común múltiplo de sus
+        # denominadores; D es el determinante de la base inicial (la
+        # diagonal de esos factores, incluida la fila Z)
+        n_cols = n_vars + n_constraints + 1
+        M = np.zeros((n_constraints + 1, n_cols), dtype=object)
+        D = 1
+        for i in range(n_constraints):
+            scale = lcm(*(v.denominator for v in A[i]), b[i].denominator)
+            M[i, :n_vars] = [int(v * scale) for v in A[i]]
+            M[i, n_vars + i] = scale
+            M[i, -1] = int(b[i] * scale)
+            D *= scale
+        z_scale = lcm(*(v.denominator for v in c)) if c else 1
+        M[-1, :n_vars] = [int(-v * z_scale) for v in c]
+        D *= z_scale
+
+        # Llevar todas las filas al denominador común D
+        for i in range(n_constraints):
+            M[i] *= D // M[i, n_vars + i]
+        M[-1] *= D // z_scale
+
+        basic_vars = list(range(n_vars, n_vars + n_constraints))
+        return self._run_exact(M, D, basic_vars, self._iteration_limit(max_iterations))
+
+    def _run_exact(self, M: np.ndarray, D: int, basic_vars: List[int],
+                   max_iterations: int) -> Dict:
+        """
+        Ejecutar la fase 1 (Simplex dual) si hace falta y el Simplex primal
+
+        Args:
+            M: Tableau entero (se modifica en el lugar)
+            D: Denominador común (> 0)
+            basic_vars: Variables básicas por fila (se modifica en el lugar)
+            max_iterations: Límite de pivoteos
+
+        Returns:
+            Diccionario con la solución
+        """
+        self._pricing_stats = None
+        self.degenerate_pivots = 0
+        self.cycling_detected = False
+        iteration = 0
+        n_rows = len(basic_vars)
+
+        feasible = all(M[i, -1] >= 0 for i in range(n_rows))
+        phase_one = not feasible
+        if phase_one:
+            # Fase 1: objetivo en cero, cualquier base es dual factible
+            M[-1] = 0
+            self._in_phase_one = True
+        self._record(M, D, basic_vars, -1, -1, 0)
+
+        status = 'feasible'
+        while not feasible:
+            row = min(range(n_rows), key=lambda i: (M[i, -1], i))
+            if M[row, -1] >= 0:
+                break
+            if iteration >= max_iterations:
+                status = 'limit'
+                break
+            candidates = [j for j in range(M.shape[1] - 1) if M[row, j] < 0]
+            if not candidates:
+                status = 'infeasible'
+                break
+            # Cociente mínimo z_j / |a_rj|; el denominador común se cancela
+            col = candidates[0]
+            for j in candidates[1:]:
+                if M[-1, j] * -M[row, col] < M[-1, col] * -M[row, j]:
+                    col = j
+            iteration += 1
+            D = self._exact_pivot(M, D, basic_vars, row, col, iteration)
+
+        self._in_phase_one = False
+        if status != 'feasible':
+            return self._exact_result(status, M, D, basic_vars, iteration)
+        if phase_one:
+            self._restore_exact_objective(M, D, basic_vars)
+            self._record(M, D, basic_vars, -1, -1, iteration, phase_change=True)
+
+        status, iteration = self._exact_primal(M, D, basic_vars, iteration, max_iterations)
+        return self._exact_result(status, M, self.denominator, basic_vars, iteration)
+
+    def _exact_primal(self, M: np.ndarray, D: int, basic_vars: List[int],
+                      iteration: int, max_iterations: int) -> Tuple[str, int]:
+        """
+        Iteraciones del Simplex primal exacto
+
+        Args:
+            M: Tableau entero (se modifica en el lugar)
+            D: Denominador común
+            basic_vars: Variables básicas por fila
+            iteration: Iteraciones realizadas hasta ahora
+            max_iterations: Límite de pivoteos
+
+        Returns:
+            Tuple con (estado, iteraciones)
+        """
+        n_rows = len(basic_vars)
+        n_cols = M.shape[1] - 1
+        seen = set()
+        bland = False
+        self.denominator = D
+        while True:
+            z_row = M[-1, :-1]
+            if bland:
+                negative = [j for j in range(n_cols) if z_row[j] < 0]
+                col = negative[0] if negative else -1
+            else:
+                col = min(range(n_cols), key=lambda j: (z_row[j], j))
+                if z_row[col] >= 0:
+                    col = -1
+            if col < 0:
+                return 'optimal', iteration
+            if iteration >= max_iterations:
+                return 'limit', iteration
+
+            # Cociente mínimo b_i / a_ik con a_ik > 0 (comparación cruzada)
+            row = -1
+            for i in range(n_rows):
+                a = M[i, col]
+                if a <= 0:
+                    continue
+                if row < 0:
+                    row = i
+                    continue
+                lhs = M[i, -1] * M[row, col]
+                rhs = M[row, -1] * a
+                if lhs < rhs or (lhs == rhs and bland and basic_vars[i] < basic_vars[row]):
+                    row = i
+            if row < 0:
+                return 'unbounded', iteration
+
+            if M[row, -1] == 0:
+                self.degenerate_pivots += 1
+            iteration += 1
+            D = self._exact_pivot(M, D, basic_vars, row, col, iteration)
+            self.denominator = D
+
+            # Una base repetida indica un ciclo: seguir con la regla de Bland
+            key = frozenset(basic_vars)
+            if key in seen and not bland:
+                self.cycling_detected = True
+                bland = True
+            seen.add(key)
+
+    def _exact_pivot(self, M: np.ndarray, D: int, basic_vars: List[int],
+                     row: int, col: int, iteration: int) -> int:
+        """
+        Pivoteo de Bareiss sobre M[row, col]
+
+        Args:
+            M: Tableau entero (se modifica en el lugar)
+            D: Denominador común actual
+            basic_vars: Variables básicas por fila (se modifica en el lugar)
+            row: Fila pivote
+            col: Columna pivote
+            iteration: Número de iteración para el historial
+
+        Returns:
+            Nuevo denominador común (positivo)
+        """
+        pivot = M[row, col]
+        pivot_element = Fraction(pivot, D)
+        pivot_row = M[row].copy()
+        column = M[:, col].copy()
+        M[:] = (pivot * M - np.outer(column, pivot_row)) // D
+        M[row] = pivot_row
+        if pivot < 0:
+            # Mantener el denominador positivo para comparar sin divisiones
+            M *= -1
+            pivot = -pivot
+        leaving = basic_vars[row]
+        basic_vars[row] = col
+        self._record(M, pivot, basic_vars, row, col, iteration,
+                     leaving_var=leaving, pivot_element=float(pivot_element))
+        return pivot
+
+    def _restore_exact_objective(self, M: np.ndarray, D: int, basic_vars: List[int]):
+        """
+        Reconstruir la fila Z entera para la base actual (fin de la fase 1)
+
+        D·c_j es entero porque D conserva el factor de escala de la fila Z.
+
+        Args:
+            M: Tableau entero (se modifica en el lugar)
+            D: Denominador común
+            basic_vars: Variables básicas por fila
+        """
+        n_vars = len(self._exact_c)
+        z_row = np.zeros(M.shape[1], dtype=object)
+        for j, cost in enumerate(self._exact_c):
+            z_row[j] = int(-cost * D)
+        for i, var_idx in enumerate(basic_vars):
+            if var_idx < n_vars and self._exact_c[var_idx] != 0:
+                # z -= (-c_B)·fila, con la fila en denominador D
+                z_row += (self._exact_c[var_idx] * M[i]).astype(object)
+        M[-1] = [int(v) for v in z_row]
+
+    def _fraction_tableau(self, M: np.ndarray, D: int) -> np.ndarray:
+        """
+        Tableau real como arreglo de Fraction
+
+        Args:
+            M: Tableau entero
+            D: Denominador común
+
+        Returns:
+            Arreglo de objetos con M / D
+        """
+        tableau = np.empty(M.shape, dtype=object)
+        flat = tableau.reshape(-1)
+        flat[:] = [Fraction(int(v), D) for v in M.reshape(-1)]
+        return tableau
+
+    def _record(self, M: np.ndarray, D: int, basic_vars: List[int], pivot_row: int,
+                pivot_col: int, iteration: int, leaving_var: int = -1,
+                pivot_element: float = float('nan'), phase_change: bool = False):
+        """
+        Guardar una iteración en el historial (tableau como fracciones)
+
+        Args:
+            M: Tableau entero
+            D: Denominador común
+            basic_vars: Variables básicas actuales
+            pivot_row: Fila pivote (-1 si es inicial)
+            pivot_col: Columna pivote (-1 si es inicial)
+            iteration: Número de iteración
+            leaving_var: Variable que salió de la base
+            pivot_element: Elemento pivote antes de pivotear
+            phase_change: Si la entrada marca el fin de la fase 1
+        """
+        history = self.iterations
+        if history.mode == 'none':
+            history.record(None, basic_vars, self.complemented, iteration, pivot_row, pivot_col)
+            return
+        is_optimal = (iteration > 0 and not self._in_phase_one
+                      and all(v >= 0 for v in M[-1, :-1]) and all(v >= 0 for v in M[:-1, -1]))
+        tableau = self._fraction_tableau(M, D) if history.mode in ('ring', 'full') else None
+        history.record(tableau, basic_vars, self.complemented, iteration, pivot_row, pivot_col,
+                       leaving_var, pivot_element, is_optimal,
+                       objective=float(Fraction(int(M[-1, -1]), D)),
+                       phase_change=phase_change, phase_one=self._in_phase_one)
+
+    def _exact_result(self, status: str, M: np.ndarray, D: int, basic_vars: List[int],
+                      iteration: int) -> Dict:
+        """
+        Armar el resultado a partir del tableau entero final
+
+        Args:
+            status: Estado final
+            M: Tableau entero
+            D: Denominador común
+            basic_vars: Variables básicas por fila
+            iteration: Iteraciones realizadas
+
+        Returns:
+            Diccionario con la solución
+        """
+        self.denominator = D
+        exact_tableau = self._fraction_tableau(M, D)
+        result = self._build_result(status, exact_tableau.astype(float), basic_vars, iteration)
+        if result['status'] == 'optimal':
+            n_vars = len(self.variable_names)
+            solution = [Fraction(0)] * n_vars
+            for i, var_idx in enumerate(basic_vars):
+                if var_idx < n_vars:
+                    solution[var_idx] = exact_tableau[i, -1]
+            result['exact'] = {
+                'solution': solution,
+                'optimal_value': exact_tableau[-1, -1],
+                'tableau': exact_tableau
+            }
+        return result
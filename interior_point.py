@@ -0,0 +1,317 @@
+import time
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from simplex_solver import SimplexSolver
+from solve_control import STOP_STATUSES, make_control
+
+
+class InteriorPointSolver(SimplexSolver):
+    """
+    Método de punto interior primal-dual (predictor-corrector de Mehrotra)
+    con crossover a un vértice.
+
+    El problema max c·x, A·x <= b, x >= 0 se lleva a min -c·x, [A | I]·z = b,
+    z >= 0 y cada iteración resuelve las ecuaciones normales
+    A·D·A^T·dy = r con D = X·S^-1: una factorización por iteración en lugar
+    de un pivoteo por variable que entra, así que el número de iteraciones
+    casi no crece con el tamaño del problema.
+
+    Al converger, el crossover elige m columnas linealmente independientes
+    ordenadas por x_j / s_j (las variables claramente positivas primero),
+    lleva el tableau a esa base con una sola factorización y termina con
+    el Simplex de la clase base, que en pocos pivoteos llega a un vértice
+    óptimo. Así el resultado tiene el mismo formato que SimplexSolver.solve
+    (tableau final, historial y análisis de sensibilidad).
+
+    Si los residuos dejan de bajar (estancamiento) o se agotan las
+    iteraciones, el crossover parte del mejor iterado siempre que esté
+    cerca de la convergencia (crossover_tolerance). Si el punto interior
+    diverge (problema infactible o no acotado) o falla numéricamente, el
+    Simplex resuelve desde la base de holguras y es quien determina el
+    estado. Si se cancela o se agota el tiempo durante el punto interior,
+    el resultado queda en la base de holguras pero cuenta las iteraciones
+    hechas y 'ipm' guarda el objetivo del último iterado.
+    """
+
+    def __init__(self, tolerance: float = 1e-8, max_ipm_iterations: int = 100,
+                 stall_iterations: int = 5, crossover_tolerance: float = 1e-3):
+        """
+        Inicializar el solver
+
+        Args:
+            tolerance: Tolerancia relativa de residuos y brecha de dualidad
+            max_ipm_iterations: Límite de iteraciones del punto interior
+            stall_iterations: Iteraciones seguidas sin que el mayor de los
+                residuos relativos y la brecha baje al menos un 10% antes
+                de cortar por estancamiento (solo si el mejor iterado ya
+                está dentro de crossover_tolerance)
+            crossover_tolerance: Residuos y brecha máximos del mejor iterado
+                para hacer crossover cuando el punto interior no convergió
+        """
+        super().__init__()
+        self.tolerance = tolerance
+        self.max_ipm_iterations = max_ipm_iterations
+        self.stall_iterations = stall_iterations
+        self.crossover_tolerance = crossover_tolerance
+        self.ipm_stats = None
+        self._crossover_basis = None
+
+    def solve(self, c: np.ndarray, A: np.ndarray, b: np.ndarray,
+              lower: Optional[np.ndarray] = None, upper: Optional[np.ndarray] = None,
+              history: str = 'full', history_size: int = 10,
+              pricing='dantzig', anti_cycling: str = 'perturbation',
+              max_iterations: Optional[int] = None, cancel_token=None,
+              time_limit: Optional[float] = None, progress=None,
+              progress_interval: float = 0.5) -> Dict:
+        """
+        Resolver el problema con punto interior y crossover
+
+        Args:
+            c: Coeficientes de la función objetivo (de parse_problem)
+            A: Matriz de restricciones
+            b: Valores del lado derecho
+            lower: Cotas inferiores; con cotas distintas de [0, inf) se omite
+                el punto interior y resuelve solo el Simplex
+            upper: Cotas superiores (igual que lower)
+            history: Modo del historial de las iteraciones del crossover
+                (igual que en SimplexSolver.solve)
+            history_size: Tamaño del anillo o intervalo de control
+            pricing: Regla de la variable entrante del crossover
+            anti_cycling: Protección contra ciclos del crossover
+            max_iterations: Límite de pivoteos del crossover
+            cancel_token: CancellationToken (se revisa en cada iteración del
+                punto interior y del crossover)
+            time_limit: Segundos de reloj disponibles entre las dos etapas
+            progress: Callback de progreso (igual que en SimplexSolver.solve)
+            progress_interval: Segundos mínimos entre reportes
+
+        Returns:
+            Diccionario con la solución (mismo formato que SimplexSolver.solve)
+            e 'ipm' con iteraciones, residuos, brecha, objetivo del iterado,
+            tiempos y pivoteos del crossover
+        """
+        c = np.asarray(c, dtype=float)
+        b = np.asarray(b, dtype=float)
+        A = np.asarray(A, dtype=float).reshape(len(b), len(c))
+        n_constraints = len(b)
+
+        has_bounds = ((lower is not None and np.any(np.asarray(lower) > 0))
+                      or (upper is not None and np.any(np.isfinite(upper))))
+
+        start = time.perf_counter()
+        self._crossover_basis = None
+        self._control = make_control(cancel_token, time_limit, progress, progress_interval)
+        if n_constraints > 0 and not has_bounds:
+            # Forma estándar: min -c·x con holguras explícitas
+            A_full = np.hstack([A, np.eye(n_constraints)])
+            c_full = np.concatenate([-c, np.zeros(n_constraints)])
+            x, s, stats = self._mehrotra(c_full, A_full, b)
+            near_optimal = (stats['status'] in ('stalled', 'iteration_limit')
+                            and max(stats['primal_residual'], stats['dual_residual'],
+                                    stats['gap']) <= self.crossover_tolerance)
+            if stats['status'] == 'optimal' or near_optimal:
+                self._crossover_basis = self._select_basis(A_full, x, s)
+        else:
+            stats = {'status': 'skipped', 'iterations': 0}
+        stats['ipm_time'] = time.perf_counter() - start
+
+        # El crossover usa el tiempo que quede (si se agotó, termina en la
+        # base de holguras con estado 'time_limit')
+        control = self._control
+        if control is not None and control.deadline is not None:
+            time_limit = control.remaining()
+        start = time.perf_counter()
+        result = super().solve(c, A, b, lower, upper, history=history, history_size=history_size,
+                               pricing=pricing, anti_cycling=anti_cycling,
+                               max_iterations=max_iterations, cancel_token=cancel_token,
+                               time_limit=time_limit, progress=progress,
+                               progress_interval=progress_interval)
+        stats['crossover_time'] = time.perf_counter() - start
+        stats['crossover_pivots'] = result.get('iteration_count', 0)
+        if stats['status'] in STOP_STATUSES:
+            # Interrumpido en el punto interior: el trabajo hecho está ahí
+            result['iteration_count'] = stats['iterations'] + stats['crossover_pivots']
+        self.ipm_stats = stats
+        result['ipm'] = stats
+        return result
+
+    def _run_simplex(self, tableau: np.ndarray, basic_vars: List[int], max_iterations: int) -> Dict:
+        """
+        Partir de la base del crossover (si hay una) y seguir con el Simplex
+
+        Args:
+            tableau: Tableau inicial (se modifica en el lugar)
+            basic_vars: Variables básicas por fila (se modifica en el lugar)
+            max_iterations: Límite de iteraciones entre todas las fases
+
+        Returns:
+            Diccionario con la solución
+        """
+        basis, self._crossover_basis = self._crossover_basis, None
+        if basis is not None:
+            self._install_basis(tableau, basic_vars, basis)
+        return super()._run_simplex(tableau, basic_vars, max_iterations)
+
+    def _mehrotra(self, c: np.ndarray, A: np.ndarray,
+                  b: np.ndarray) -> Tuple[np.ndarray, np.ndarray, Dict]:
+        """
+        Predictor-corrector de Mehrotra para min c·x, A·x = b, x >= 0
+
+        Args:
+            c: Costos en forma estándar
+            A: Matriz con filas linealmente independientes (m x N)
+            b: Lado derecho
+
+        Returns:
+            Tuple con (x, s, estadísticas); el estado es 'optimal',
+            'diverged' (probable infactibilidad o no acotamiento),
+            'numerical_error', 'stalled', 'iteration_limit', 'cancelled' o
+            'time_limit'. Con 'stalled' o 'iteration_limit' se devuelve el
+            mejor iterado (menor máximo entre residuos y brecha) con sus
+            residuos y 'best_iteration'. 'objective' es el valor del
+            objetivo original (a maximizar) en el iterado
+        """
+        tol = self.tolerance
+        n_rows, n_cols = A.shape
+        b_norm = 1.0 + np.linalg.norm(b)
+        c_norm = 1.0 + np.linalg.norm(c)
+
+        # Punto inicial de Mehrotra
+        AAt = A @ A.T
+        x = A.T @ np.linalg.solve(AAt, b)
+        y = np.linalg.solve(AAt, A @ c)
+        s = c - A.T @ y
+        x += max(-1.5 * x.min(), 0.0)
+        s += max(-1.5 * s.min(), 0.0)
+        xs = x @ s
+        x += 0.5 * xs / max(s.sum(), 1e-300)
+        s += 0.5 * xs / max(x.sum(), 1e-300)
+        x = np.maximum(x, 1e-8)
+        s = np.maximum(s, 1e-8)
+
+        stats = {'status': 'iteration_limit', 'iterations': 0}
+        best = None
+        best_merit = progress_merit = np.inf
+        last_progress = 0
+        # Los problemas infactibles o no acotados divergen: se detecta abajo
+        with np.errstate(all='ignore'):
+            for iteration in range(1, self.max_ipm_iterations + 1):
+                r_primal = b - A @ x
+                r_dual = c - A.T @ y - s
+                mu = x @ s / n_cols
+                primal_obj = c @ x
+                dual_obj = b @ y
+                stats.update({
+                    'iterations': iteration - 1,
+                    'primal_residual': np.linalg.norm(r_primal) / b_norm,
+                    'dual_residual': np.linalg.norm(r_dual) / c_norm,
+                    'gap': abs(primal_obj - dual_obj) / (1.0 + abs(primal_obj)),
+                    'mu': mu,
+                    'objective': float(-primal_obj)
+                })
+                merit = max(stats['primal_residual'], stats['dual_residual'], stats['gap'])
+                if merit < best_merit:
+                    best_merit = merit
+                    best = (x, s, dict(stats, best_iteration=iteration - 1))
+                if merit < 0.9 * progress_merit:
+                    progress_merit = merit
+                    last_progress = iteration
+                if (stats['primal_residual'] < tol and stats['dual_residual'] < tol
+                        and stats['gap'] < tol):
+                    stats['status'] = 'optimal'
+                    break
+                if np.max(x) > 1e12 * b_norm or np.max(np.abs(y)) > 1e12 * c_norm:
+                    stats['status'] = 'diverged'
+                    break
+                if self._control is not None:
+                    stop = self._control.check(iteration - 1, -primal_obj)
+                    if stop is not None:
+                        stats['status'] = stop
+                        break
+                # Cerca de la convergencia, un estancamiento ya no se recupera:
+                # se corta y el crossover parte del mejor iterado
+                if (best_merit <= self.crossover_tolerance
+                        and iteration - last_progress >= self.stall_iterations):
+                    stats['status'] = 'stalled'
+                    break
+
+                # Ecuaciones normales: (A D A^T) dy = r, con D = X S^-1
+                d = x / s
+                M = (A * d) @ A.T
+                M[np.diag_indices_from(M)] += 1e-14 * np.trace(M) / n_rows
+
+                def newton(r_xs: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+                    # A dx = r_p, A^T dy + ds = r_d, S dx + X ds = r_xs
+                    base = (r_xs - x * r_dual) / s
+                    dy = np.linalg.solve(M, r_primal - A @ base)
+                    dx = base + d * (A.T @ dy)
+                    ds = r_dual - A.T @ dy
+                    return dx, dy, ds
+
+                try:
+                    # Predictor (dirección afín)
+                    dx_aff, _, ds_aff = newton(-x * s)
+                    alpha_p = self._max_step(x, dx_aff)
+                    alpha_d = self._max_step(s, ds_aff)
+                    mu_aff = (x + alpha_p * dx_aff) @ (s + alpha_d * ds_aff) / n_cols
+                    sigma = (mu_aff / mu) ** 3
+
+                    # Corrector con centrado
+                    dx, dy, ds = newton(-x * s - dx_aff * ds_aff + sigma * mu)
+                except np.linalg.LinAlgError:
+                    stats['status'] = 'numerical_error'
+                    break
+                if not (np.all(np.isfinite(dx)) and np.all(np.isfinite(dy)) and np.all(np.isfinite(ds))):
+                    stats['status'] = 'diverged'
+                    break
+
+                alpha_p = min(1.0, 0.99 * self._max_step(x, dx))
+                alpha_d = min(1.0, 0.99 * self._max_step(s, ds))
+                x = x + alpha_p * dx
+                y = y + alpha_d * dy
+                s = s + alpha_d * ds
+            else:
+                stats['iterations'] = self.max_ipm_iterations
+
+        if stats['status'] in ('stalled', 'iteration_limit') and best is not None:
+            x, s, best_stats = best
+            best_stats.update(status=stats['status'], iterations=stats['iterations'])
+            stats = best_stats
+        return x, s, stats
+
+    @staticmethod
+    def _max_step(v: np.ndarray, dv: np.ndarray) -> float:
+        """
+        Mayor paso que mantiene v + alpha·dv >= 0
+
+        Args:
+            v: Vector positivo
+            dv: Dirección
+
+        Returns:
+            Paso máximo (inf si ninguna componente decrece)
+        """
+        negative = dv < 0
+        if not np.any(negative):
+            return np.inf
+        return float(np.min(-v[negative] / dv[negative]))
+
+    def _select_basis(self, A: np.ndarray, x: np.ndarray, s: np.ndarray) -> List[int]:
+        """
+        Elegir la base del crossover
+
+        Se recorren las columnas de mayor a menor x_j / s_j y se aceptan las
+        linealmente independientes de las ya elegidas (_independent_columns)
+        hasta completar m. Las holguras forman una identidad, así que
+        siempre se completa una base.
+
+        Args:
+            A: Matriz [A | I] en forma estándar
+            x: Solución primal del punto interior
+            s: Holguras duales del punto interior
+
+        Returns:
+            Variable básica de cada fila
+        """
+        order = np.argsort(-(x / np.maximum(s, 1e-300)), kind='stable')
+        return self._independent_columns(A, order.tolist(), A.shape[0])
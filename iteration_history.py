@@ -0,0 +1,398 @@
+import copy
+import numpy as np
+from array import array
+from collections import deque
+from typing import List, Dict, Optional
+
+
+class IterationHistory:
+    """
+    Historial compacto de las iteraciones del método Simplex.
+
+    Modos disponibles:
+        'none':    no se guarda nada (solo se cuentan las iteraciones)
+        'summary': solo el resumen de cada pivoteo, sin tableaus
+        'ring':    resumen de todos los pivoteos y los últimos K tableaus
+        'full':    resumen y tableau de todas las iteraciones
+        'replay':  resumen de todos los pivoteos y un tableau de control cada
+                   K pivoteos; cualquier iteración se reconstruye repitiendo
+                   los pivoteos desde el control más cercano
+
+    El resumen se guarda en arreglos tipados (un elemento por iteración) y
+    los nombres de las columnas se comparten entre todas las entradas. Cada
+    entrada se reconstruye como diccionario solo cuando se accede a ella,
+    con las mismas claves que usa la interfaz gráfica.
+    """
+
+    MODES = ('none', 'summary', 'ring', 'full', 'replay')
+
+    def __init__(self, names: List[str], mode: str = 'full', ring_size: int = 10):
+        """
+        Inicializar el historial
+
+        Args:
+            names: Nombres de todas las columnas (variables y holguras), compartidos
+            mode: Modo de historial ('none', 'summary', 'ring', 'full' o 'replay')
+            ring_size: Número de tableaus que conserva el modo 'ring', o
+                pivoteos entre tableaus de control en el modo 'replay'
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Modo de historial no válido: {mode}. Opciones: {', '.join(self.MODES)}")
+
+        self.mode = mode
+        self.names = names
+        self.col_names = names + ['RHS']
+        self.ring_size = max(1, ring_size)
+        self.total_iterations = 0
+        self.column_upper = None
+
+        # Resumen por iteración en arreglos tipados
+        self._iteration = array('i')
+        self._pivot_row = array('i')
+        self._pivot_col = array('i')
+        self._leaving = array('i')
+        self._pivot_element = array('d')
+        self._objective = array('d')
+        self._flags = array('b')
+
+        # Tableaus guardados: número de entrada -> (tableau, básicas, complementadas)
+        if mode == 'ring':
+            self._snapshots = deque(maxlen=self.ring_size)
+        else:
+            self._snapshots = deque()
+
+        # Última iteración reconstruida en modo 'replay' (para recorridos secuenciales)
+        self._cursor = None
+
+    # Bits de _flags
+    _BOUND_FLIP = 1
+    _OPTIMAL = 2
+    _LEAVES_AT_UPPER = 4
+    _ROW_COMPLEMENT = 8
+    _PHASE_CHANGE = 16
+    _PHASE_ONE = 32
+    _PERTURBATION = 64
+
+    def set_column_upper(self, column_upper: np.ndarray):
+        """
+        Guardar las cotas superiores de las columnas (necesarias para repetir
+        cambios de cota en el modo 'replay')
+
+        Args:
+            column_upper: Cota superior de cada columna del tableau
+        """
+        self.column_upper = np.array(column_upper, dtype=float)
+
+    def record(self, tableau: Optional[np.ndarray], basic_vars: List[int], complemented: np.ndarray,
+               iteration_num: int, pivot_row: int, pivot_col: int, leaving_var: int = -1,
+               pivot_element: float = float('nan'), is_optimal: bool = False,
+               objective: Optional[float] = None, leaves_at_upper: bool = False,
+               checkpoint: bool = False, row_complement: bool = False,
+               phase_change: bool = False, phase_one: bool = False,
+               perturbation: bool = False):
+        """
+        Registrar una iteración
+
+        Args:
+            tableau: Tableau actual (se copia solo si el modo lo requiere);
+                None en solvers que no mantienen tableau
+            basic_vars: Variables básicas actuales
+            complemented: Columnas complementadas (en su cota superior)
+            iteration_num: Número de iteración
+            pivot_row: Fila pivote (-1 si es inicial o cambio de cota)
+            pivot_col: Columna pivote (-1 si es inicial)
+            leaving_var: Variable que sale de la base (-1 si no hubo pivoteo)
+            pivot_element: Valor del elemento pivote antes de pivotear
+            is_optimal: Si el tableau ya es óptimo
+            objective: Valor de Z (por defecto se toma del tableau)
+            leaves_at_upper: Si la variable que sale queda en su cota superior
+            checkpoint: Forzar un tableau de control en el modo 'replay' (para
+                cambios del tableau que no son pivoteos)
+            row_complement: Si la variable que sale (Simplex dual) se
+                complementó y su fila cambió de signo antes de pivotear
+            phase_change: Fin de la fase 1 (la fila Z se reconstruye; siempre
+                guarda un tableau de control en el modo 'replay')
+            phase_one: Si la iteración pertenece a la fase 1 (objetivo en cero)
+            perturbation: Cambio de los lados derechos por la protección contra
+                ciclos (siempre guarda un tableau de control en el modo 'replay')
+        """
+        self.total_iterations += 1
+        if self.mode == 'none':
+            return
+
+        flags = 0
+        if pivot_row < 0 and pivot_col >= 0:
+            flags |= self._BOUND_FLIP
+        if is_optimal:
+            flags |= self._OPTIMAL
+        if leaves_at_upper:
+            flags |= self._LEAVES_AT_UPPER
+        if row_complement:
+            flags |= self._ROW_COMPLEMENT
+        if phase_change:
+            flags |= self._PHASE_CHANGE
+            checkpoint = True
+        if phase_one:
+            flags |= self._PHASE_ONE
+        if perturbation:
+            flags |= self._PERTURBATION
+            checkpoint = True
+
+        entry = len(self._iteration)
+        self._iteration.append(iteration_num)
+        self._pivot_row.append(pivot_row)
+        self._pivot_col.append(pivot_col)
+        self._leaving.append(leaving_var)
+        self._pivot_element.append(pivot_element)
+        self._objective.append(float(tableau[-1, -1]) if objective is None else objective)
+        self._flags.append(flags)
+
+        if tableau is None:
+            return
+        if self.mode == 'replay':
+            # Control al inicio, cada K pivoteos y cuando se pide explícitamente
+            last = self._snapshots[-1][0] if self._snapshots else None
+            if not checkpoint and last is not None and entry - last < self.ring_size:
+                return
+        elif self.mode not in ('ring', 'full'):
+            return
+        self._snapshots.append((entry, tableau.copy(),
+                                np.array(basic_vars, dtype=np.int32),
+                                np.array(complemented, dtype=bool)))
+
+    def rename(self, structural_names: List[str]):
+        """
+        Cambiar los nombres de las variables estructurales (por ejemplo,
+        para mostrar los nombres originales después de un presolve)
+
+        Args:
+            structural_names: Nombres de las primeras columnas del tableau
+        """
+        self.names = list(structural_names) + self.names[len(structural_names):]
+        self.col_names = self.names + ['RHS']
+
+    def summary_copy(self) -> 'IterationHistory':
+        """
+        Copia del historial sin tableaus (como si se hubiera usado 'summary')
+
+        El resumen de los pivoteos se comparte con el original (no se
+        modifica después de resolver); solo se descartan los tableaus.
+
+        Returns:
+            Historial en modo 'summary' (o 'none' si el original no guardaba nada)
+        """
+        summary = copy.copy(self)
+        if self.mode != 'none':
+            summary.mode = 'summary'
+        summary._snapshots = deque()
+        summary._cursor = None
+        return summary
+
+    def mark_last_optimal(self):
+        """Marcar la última iteración registrada como óptima"""
+        if len(self._flags):
+            self._flags[-1] |= self._OPTIMAL
+
+    def __len__(self) -> int:
+        """Número de iteraciones disponibles en el historial"""
+        return len(self._iteration)
+
+    def __iter__(self):
+        """Recorrer las iteraciones como diccionarios"""
+        for idx in range(len(self)):
+            yield self[idx]
+
+    def _find_snapshot(self, idx: int) -> Optional[tuple]:
+        """
+        Buscar el tableau guardado de una entrada
+
+        Args:
+            idx: Número de entrada
+
+        Returns:
+            Tuple (entrada, tableau, básicas, complementadas) o None
+        """
+        if not self._snapshots:
+            return None
+        if self.mode == 'full' and len(self._snapshots) == len(self):
+            return self._snapshots[idx]
+        if self.mode == 'replay':
+            return self._replay(idx)
+        offset = idx - self._snapshots[0][0]
+        if 0 <= offset < len(self._snapshots):
+            return self._snapshots[offset]
+        return None
+
+    def _replay(self, idx: int) -> Optional[tuple]:
+        """
+        Reconstruir el tableau de una entrada repitiendo los pivoteos desde
+        el tableau de control más cercano anterior
+
+        Args:
+            idx: Número de entrada
+
+        Returns:
+            Tuple (entrada, tableau, básicas, complementadas) o None
+        """
+        # Control más cercano con número de entrada <= idx
+        start = None
+        for snapshot in reversed(self._snapshots):
+            if snapshot[0] <= idx:
+                start = snapshot
+                break
+        if start is None:
+            return None
+
+        cursor = self._cursor
+        if cursor is not None and start[0] <= cursor[0] <= idx:
+            # Continuar desde la última reconstrucción (recorrido secuencial)
+            entry, tableau, basic, complemented = cursor
+        else:
+            entry, tableau, basic, complemented = start
+            tableau = tableau.copy()
+            basic = basic.copy()
+            complemented = complemented.copy()
+
+        for step in range(entry + 1, idx + 1):
+            row = self._pivot_row[step]
+            col = self._pivot_col[step]
+            flags = self._flags[step]
+            if flags & self._BOUND_FLIP:
+                complemented[col] = not complemented[col]
+                _complement(tableau, col, self.column_upper[col])
+            elif row >= 0:
+                leaving = basic[row]
+                if flags & self._ROW_COMPLEMENT:
+                    complemented[leaving] = not complemented[leaving]
+                    _complement(tableau, leaving, self.column_upper[leaving])
+                    tableau[row] *= -1
+                _pivot(tableau, row, col)
+                basic[row] = col
+                if flags & self._LEAVES_AT_UPPER:
+                    complemented[leaving] = not complemented[leaving]
+                    _complement(tableau, leaving, self.column_upper[leaving])
+
+        self._cursor = (idx, tableau, basic, complemented)
+        return idx, tableau.copy(), basic.copy(), complemented.copy()
+
+    def __getitem__(self, idx: int) -> Dict:
+        """
+        Obtener una iteración con el formato de diccionario de SimplexSolver
+
+        Equivale a get_iteration(idx).
+
+        Args:
+            idx: Índice de la iteración (acepta índices negativos)
+
+        Returns:
+            Diccionario con los datos de la iteración
+        """
+        return self.get_iteration(idx)
+
+    def get_iteration(self, idx: int) -> Dict:
+        """
+        Obtener una iteración con el formato de diccionario de SimplexSolver
+
+        En el modo 'replay' el tableau se reconstruye bajo demanda. Si el
+        tableau de la iteración no está disponible, 'tableau', 'basic_vars'
+        y 'row_names' son None; el resumen del pivoteo siempre está.
+
+        Args:
+            idx: Índice de la iteración (acepta índices negativos)
+
+        Returns:
+            Diccionario con los datos de la iteración
+        """
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("Iteración fuera del historial")
+
+        snapshot = self._find_snapshot(idx)
+        tableau = basic_vars = row_names = None
+        col_names = self.col_names
+
+        if snapshot is not None:
+            _, tableau, basic, complemented = snapshot
+            if complemented.any():
+                col_names = [f"{name}'" if comp else name
+                             for name, comp in zip(self.names, complemented)] + ['RHS']
+            basic_vars = basic.tolist()
+            row_names = [col_names[var_idx] for var_idx in basic_vars] + ['Z']
+
+        leaving = self._leaving[idx]
+        flags = self._flags[idx]
+
+        return {
+            'iteration': self._iteration[idx],
+            'tableau': tableau,
+            'basic_vars': basic_vars,
+            'pivot_row': self._pivot_row[idx],
+            'pivot_col': self._pivot_col[idx],
+            'leaving_var': leaving,
+            'leaving_name': self.names[leaving] if leaving >= 0 else None,
+            'pivot_element': self._pivot_element[idx],
+            'objective': self._objective[idx],
+            'col_names': col_names,
+            'row_names': row_names,
+            'bound_flip': bool(flags & self._BOUND_FLIP),
+            'row_complement': bool(flags & self._ROW_COMPLEMENT),
+            'phase_change': bool(flags & self._PHASE_CHANGE),
+            'phase_one': bool(flags & self._PHASE_ONE),
+            'perturbation': bool(flags & self._PERTURBATION),
+            'is_optimal': bool(flags & self._OPTIMAL)
+        }
+
+    def pivots(self) -> np.ndarray:
+        """
+        Secuencia de pivoteos como arreglo (n, 2) de (fila, columna)
+
+        Returns:
+            Arreglo de enteros con los pivoteos registrados
+        """
+        rows = np.frombuffer(self._pivot_row, dtype=np.int32) if len(self) else np.empty(0, np.int32)
+        cols = np.frombuffer(self._pivot_col, dtype=np.int32) if len(self) else np.empty(0, np.int32)
+        return np.column_stack([rows, cols])
+
+    def memory_bytes(self) -> int:
+        """
+        Memoria aproximada usada por el historial
+
+        Returns:
+            Bytes ocupados por el resumen y los tableaus guardados
+        """
+        total = sum(buf.itemsize * len(buf) for buf in (
+            self._iteration, self._pivot_row, self._pivot_col, self._leaving,
+            self._pivot_element, self._objective, self._flags))
+        for _, tableau, basic, complemented in self._snapshots:
+            total += tableau.nbytes + basic.nbytes + complemented.nbytes
+        return total
+
+
+def _pivot(tableau: np.ndarray, pivot_row: int, pivot_col: int):
+    """
+    Pivoteo usado al repetir iteraciones (misma aritmética que SimplexSolver)
+
+    Args:
+        tableau: Tableau a modificar en el lugar
+        pivot_row: Fila pivote
+        pivot_col: Columna pivote
+    """
+    row = tableau[pivot_row]
+    np.divide(row, tableau[pivot_row, pivot_col], out=row)
+    col = tableau[:, pivot_col].copy()
+    col[pivot_row] = 0.0
+    tableau -= col[:, np.newaxis] * row[np.newaxis, :]
+
+
+def _complement(tableau: np.ndarray, col: int, upper: float):
+    """
+    Cambio de cota usado al repetir iteraciones
+
+    Args:
+        tableau: Tableau a modificar en el lugar
+        col: Columna no básica
+        upper: Cota superior de la columna
+    """
+    tableau[:, -1] -= upper * tableau[:, col]
+    tableau[:, col] *= -1
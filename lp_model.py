@@ -0,0 +1,238 @@
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from sparse_matrix import SparseMatrix
+
+
+class LPModel:
+    """
+    Problema lineal general leído desde un archivo (LP o MPS).
+
+    Guarda el problema tal como viene en el archivo:
+
+        max/min c·x + constante
+        row_lower <= A·x <= row_upper
+        lower <= x <= upper
+
+    con A en forma dispersa y cotas infinitas donde no hay límite. Un
+    "<=" tiene row_lower = -inf, un ">=" row_upper = inf y una igualdad
+    ambos extremos iguales; las restricciones de rango tienen los dos
+    extremos finitos.
+
+    to_standard_form lo lleva a la forma que aceptan los solvers
+    (maximización, filas "<=" y variables con cota inferior >= 0) y
+    recover_solution deshace la transformación.
+    """
+
+    def __init__(self, c: np.ndarray, A: SparseMatrix,
+                 row_lower: np.ndarray, row_upper: np.ndarray,
+                 lower: Optional[np.ndarray] = None, upper: Optional[np.ndarray] = None,
+                 maximize: bool = True, objective_constant: float = 0.0,
+                 variable_names: Optional[List[str]] = None,
+                 constraint_names: Optional[List[str]] = None,
+                 integer: Optional[np.ndarray] = None, name: str = ''):
+        """
+        Crear el modelo
+
+        Args:
+            c: Coeficientes de la función objetivo
+            A: Matriz de restricciones dispersa (m x n)
+            row_lower: Límite inferior de cada fila (-inf si no tiene)
+            row_upper: Límite superior de cada fila (inf si no tiene)
+            lower: Cotas inferiores de las variables (por defecto 0)
+            upper: Cotas superiores de las variables (por defecto infinito)
+            maximize: True para maximizar, False para minimizar
+            objective_constant: Término constante de la función objetivo
+            variable_names: Nombres de las variables (por defecto x1, x2, ...)
+            constraint_names: Nombres de las filas (por defecto R1, R2, ...)
+            integer: Máscara de variables enteras (por defecto ninguna)
+            name: Nombre del problema
+        """
+        n_rows, n_vars = A.shape
+        self.c = np.asarray(c, dtype=float)
+        self.A = A
+        self.row_lower = np.asarray(row_lower, dtype=float)
+        self.row_upper = np.asarray(row_upper, dtype=float)
+        self.lower = np.zeros(n_vars) if lower is None else np.asarray(lower, dtype=float)
+        self.upper = np.full(n_vars, np.inf) if upper is None else np.asarray(upper, dtype=float)
+        self.maximize = maximize
+        self.objective_constant = objective_constant
+        self.variable_names = variable_names or [f'x{j+1}' for j in range(n_vars)]
+        self.constraint_names = constraint_names or [f'R{i+1}' for i in range(n_rows)]
+        self.integer = np.zeros(n_vars, dtype=bool) if integer is None else np.asarray(integer, dtype=bool)
+        self.name = name
+
+    @property
+    def n_vars(self) -> int:
+        """Número de variables"""
+        return self.A.shape[1]
+
+    @property
+    def n_constraints(self) -> int:
+        """Número de restricciones"""
+        return self.A.shape[0]
+
+    def to_standard_form(self, sparse: bool = False) -> Tuple[np.ndarray, object, np.ndarray,
+                                                              np.ndarray, np.ndarray]:
+        """
+        Llevar el modelo a max c·x, A·x <= b, lower <= x <= upper con lower >= 0
+
+        Las filas con límite superior se agregan tal cual y las filas con
+        límite inferior cambiadas de signo (una igualdad o un rango dan dos
+        filas). Las variables con cota inferior negativa se trasladan
+        (x = l + x'), las que solo tienen cota superior se reflejan
+        (x = u - x') y las libres se dividen en x = x+ - x-.
+
+        Args:
+            sparse: Devolver A como SparseMatrix en lugar de arreglo denso
+
+        Returns:
+            Tuple con (c, A, b, lower, upper) en forma estándar
+        """
+        n_vars = self.n_vars
+        sign = 1.0 if self.maximize else -1.0
+        lower, upper = self.lower, self.upper
+
+        # Columnas: x_j = shift_j + scale_j · x'_k
+        free = np.isneginf(lower) & np.isposinf(upper)
+        mirrored = np.isneginf(lower) & np.isfinite(upper)
+        shifted = np.isfinite(lower) & (lower < 0)
+        shift = np.where(mirrored, upper, np.where(shifted, lower, 0.0))
+        col_sign = np.where(mirrored, -1.0, 1.0)
+        extra = np.flatnonzero(free)
+        self._column_map = (shift, col_sign, extra)
+
+        new_lower = np.where(mirrored | free, 0.0, np.where(shifted, 0.0, lower))
+        new_upper = np.where(mirrored | free, np.inf, np.where(shifted, upper - lower, upper))
+        new_lower = np.concatenate([new_lower, np.zeros(len(extra))])
+        new_upper = np.concatenate([new_upper, np.full(len(extra), np.inf)])
+
+        c = sign * self.c
+        c_std = np.concatenate([c * col_sign, -c[extra]])
+        self._offset = c @ shift
+
+        # Filas: A·x <= row_upper y -A·x <= -row_lower
+        rows, cols, vals = self.A.to_triplets()
+        vals = vals * col_sign[cols]
+        row_activity = self.A.matvec(shift)
+        extra_pos = np.full(n_vars, -1, dtype=np.int64)
+        extra_pos[extra] = n_vars + np.arange(len(extra))
+        split = extra_pos[cols] >= 0
+        rows = np.concatenate([rows, rows[split]])
+        cols = np.concatenate([cols, extra_pos[cols[split]]])
+        vals = np.concatenate([vals, -vals[split]])
+
+        upper_rows = np.flatnonzero(np.isfinite(self.row_upper))
+        lower_rows = np.flatnonzero(np.isfinite(self.row_lower))
+        self._row_map = (upper_rows, lower_rows)
+        position = np.full(self.n_constraints, -1, dtype=np.int64)
+        position[upper_rows] = np.arange(len(upper_rows))
+        take_upper = position[rows] >= 0
+        neg_position = np.full(self.n_constraints, -1, dtype=np.int64)
+        neg_position[lower_rows] = len(upper_rows) + np.arange(len(lower_rows))
+        take_lower = neg_position[rows] >= 0
+
+        std_rows = np.concatenate([position[rows[take_upper]], neg_position[rows[take_lower]]])
+        std_cols = np.concatenate([cols[take_upper], cols[take_lower]])
+        std_vals = np.concatenate([vals[take_upper], -vals[take_lower]])
+        b = np.concatenate([self.row_upper[upper_rows] - row_activity[upper_rows],
+                            -(self.row_lower[lower_rows] - row_activity[lower_rows])])
+
+        shape = (len(b), n_vars + len(extra))
+        A_std = SparseMatrix.from_triplets(std_rows, std_cols, std_vals, shape)
+        if not sparse:
+            A_std = A_std.to_dense()
+        return c_std, A_std, b, new_lower, new_upper
+
+    def recover_solution(self, solution: np.ndarray, optimal_value: float) -> Tuple[np.ndarray, float]:
+        """
+        Llevar una solución de la forma estándar al espacio del modelo
+
+        Args:
+            solution: Solución devuelta por el solver
+            optimal_value: Valor óptimo devuelto por el solver
+
+        Returns:
+            Tuple con (solución original, valor de la función objetivo original)
+        """
+        shift, col_sign, extra = self._column_map
+        n_vars = self.n_vars
+        x = shift + col_sign * solution[:n_vars]
+        x[extra] -= solution[n_vars:]
+        value = optimal_value + self._offset
+        if not self.maximize:
+            value = -value
+        return x, value + self.objective_constant
+
+    def recover_duals(self, shadow_prices: np.ndarray) -> np.ndarray:
+        """
+        Llevar los precios sombra de la forma estándar a las filas del modelo
+
+        Args:
+            shadow_prices: Precios sombra de las filas en forma estándar
+
+        Returns:
+            Precio sombra de cada fila original (en el sentido del objetivo
+            original)
+        """
+        upper_rows, lower_rows = self._row_map
+        duals = np.zeros(self.n_constraints)
+        duals[upper_rows] += shadow_prices[:len(upper_rows)]
+        duals[lower_rows] -= shadow_prices[len(upper_rows):]
+        return duals if self.maximize else -duals
+
+    def solve(self, solver=None, **options) -> Dict:
+        """
+        Resolver el modelo con un SimplexSolver y devolver la solución original
+
+        Args:
+            solver: Instancia del solver (por defecto SimplexSolver)
+            **options: Opciones adicionales para solver.solve
+
+        Returns:
+            Diccionario del solver con la solución, el valor óptimo y los
+            nombres de las variables del modelo
+        """
+        if solver is None:
+            from simplex_solver import SimplexSolver
+            solver = SimplexSolver()
+        invalid = self.check_bounds()
+        if invalid is not None:
+            return invalid
+        c, A, b, lower, upper = self.to_standard_form(sparse=solver.sparse_input)
+        result = solver.solve(c, A, b, lower, upper, **options)
+        return self.recover_result(result)
+
+    def recover_result(self, result: Dict) -> Dict:
+        """
+        Llevar el resultado de un solver (sobre la forma estándar) al modelo
+
+        Args:
+            result: Diccionario devuelto por solver.solve
+
+        Returns:
+            Diccionario con la solución y el valor originales, los nombres de
+            las variables del modelo y 'duals' en lugar de 'sensitivity'
+        """
+        if result['status'] == 'optimal':
+            solution, value = self.recover_solution(result['solution'], result['optimal_value'])
+            result = dict(result, solution=solution, optimal_value=value,
+                          variable_names=list(self.variable_names))
+            if 'sensitivity' in result:
+                result['duals'] = self.recover_duals(result['sensitivity']['shadow_prices'])
+                result.pop('sensitivity')
+        return result
+
+    def check_bounds(self) -> Optional[Dict]:
+        """
+        Detectar cotas de variables contradictorias
+
+        Returns:
+            Diccionario de resultado 'infeasible' o None si las cotas son válidas
+        """
+        if np.any(self.lower > self.upper) or np.any(np.isposinf(self.lower) | np.isneginf(self.upper)):
+            return {
+                'status': 'infeasible',
+                'message': 'Las cotas de alguna variable son contradictorias',
+                'iterations': []
+            }
+        return None
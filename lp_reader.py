@@ -0,0 +1,519 @@
+import re
+import numpy as np
+from array import array
+from typing import Dict, List
+from sparse_matrix import SparseMatrix
+from lp_model import LPModel
+
+
+# Caracteres válidos en nombres de variables y filas del formato LP de CPLEX
+_NAME_FIRST = r"A-Za-z_!\"#$%&()/,;?@`'{}|~"
+_NAME_REST = r"\w!\"#$%&()/,.;?@`'{}|~"
+
+_NUMBER = rf"(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?|inf(?:inity)?(?![{_NAME_REST}])"
+_NAME = rf"[{_NAME_FIRST}][{_NAME_REST}]*"
+
+# Tokenizador de una sola pasada; los espacios no coinciden con ningún grupo
+# y finditer los salta. Las palabras clave solo cuentan al inicio de línea y
+# un término completo ([signo] [coeficiente] variable) es un solo token
+# salvo que el nombre vaya seguido de ':' (etiqueta de fila).
+_TOKEN = re.compile(rf"""
+    (?P<comment>\\[^\n]*)
+  | (?P<keyword>^[ \t]*(?:maximi[sz]e|maximum|max|minimi[sz]e|minimum|min
+        |subject[ \t]+to|such[ \t]+that|s\.t\.?|st\.?|bounds?|generals?|gen
+        |integers?|binary|binaries|bin|semi-continuous|semis?|end)(?=\s|\\|$))
+  | (?P<term>(?:(?P<tsign>[+-])[ \t]*)?(?:(?P<tcoef>{_NUMBER})(?![eE][+-]?\d)[ \t]*)?(?P<tname>(?!inf(?:inity)?(?![{_NAME_REST}])){_NAME})(?![{_NAME_REST}]|[ \t]*:))
+  | (?P<number>{_NUMBER})
+  | (?P<name>{_NAME})
+  | (?P<op><=|=<|>=|=>|<|>|=)
+  | (?P<colon>:)
+  | (?P<sign>[+-])
+  | (?P<error>\S)
+""", re.VERBOSE | re.MULTILINE | re.IGNORECASE)
+
+_SECTIONS = {
+    'maximize': 'max', 'maximise': 'max', 'maximum': 'max', 'max': 'max',
+    'minimize': 'min', 'minimise': 'min', 'minimum': 'min', 'min': 'min',
+    'subject to': 'constraints', 'such that': 'constraints', 's.t.': 'constraints',
+    's.t': 'constraints', 'st': 'constraints', 'st.': 'constraints',
+    'bound': 'bounds', 'bounds': 'bounds',
+    'general': 'general', 'generals': 'general', 'gen': 'general',
+    'integer': 'general', 'integers': 'general',
+    'binary': 'binary', 'binaries': 'binary', 'bin': 'binary',
+    'semi-continuous': 'semi', 'semi': 'semi', 'semis': 'semi',
+    'end': 'end'
+}
+
+_SENSES = {'<=': 'L', '=<': 'L', '<': 'L', '>=': 'G', '=>': 'G', '>': 'G', '=': 'E'}
+
+# Valores con magnitud mayor o igual se consideran infinitos (convención de CPLEX)
+_INFINITY = 1e30
+
+
+class LPReader:
+    """
+    Lector del formato LP de CPLEX por bloques.
+
+    El archivo se lee en bloques de chunk_size caracteres cortados en el
+    último salto de línea; cada bloque pasa una sola vez por el
+    tokenizador y los coeficientes van directo a buffers tipados
+    (array.array) de filas, columnas y valores, sin armar cadenas por
+    restricción. Al final los buffers se convierten sin copia en arreglos
+    de NumPy y en una SparseMatrix.
+
+    Secciones soportadas: objetivo (Maximize/Minimize), Subject To,
+    Bounds, General/Integer y Binary. Las variables pueden tener cualquier
+    nombre válido del formato y se numeran en el orden en que aparecen.
+    """
+
+    def __init__(self, chunk_size: int = 1 << 20):
+        """
+        Inicializar el lector
+
+        Args:
+            chunk_size: Caracteres leídos por bloque
+        """
+        self.chunk_size = chunk_size
+
+    def read(self, source) -> LPModel:
+        """
+        Leer un modelo en formato LP
+
+        Args:
+            source: Ruta del archivo o un objeto con método read()
+
+        Returns:
+            LPModel con el problema leído
+        """
+        self._reset()
+        if hasattr(source, 'read'):
+            self._read_stream(source)
+        else:
+            with open(source, 'r', encoding='utf-8', errors='replace') as stream:
+                self._read_stream(stream)
+        return self._build_model()
+
+    def _reset(self):
+        """Preparar buffers y estado para un archivo nuevo"""
+        self.section = None
+        self.maximize = None
+        self.objective_constant = 0.0
+        self.var_index: Dict[str, int] = {}
+        self.var_names: List[str] = []
+        self.constraint_names: List[str] = []
+        self.obj_cols = array('q')
+        self.obj_vals = array('d')
+        self.rows = array('q')
+        self.cols = array('q')
+        self.vals = array('d')
+        self.rhs = array('d')
+        self.senses = bytearray()
+        self.lower: Dict[int, float] = {}
+        self.upper: Dict[int, float] = {}
+        self.integer = set()
+        self.binary = set()
+        self._line = 0
+        self._reset_row()
+        self._bound = []
+        self._bound_sign = 1.0
+
+    def _reset_row(self):
+        """Limpiar el estado de la expresión en curso"""
+        self._sign = 1.0
+        self._coef = None
+        self._label = None
+        self._row_name = None
+        self._row_started = False
+        self._sense = None
+        self._rhs_sign = 1.0
+        self._constant = 0.0
+
+    def _read_stream(self, stream):
+        """
+        Leer el archivo bloque a bloque sin partir líneas
+
+        Args:
+            stream: Archivo de texto abierto
+        """
+        tail = ''
+        while True:
+            chunk = stream.read(self.chunk_size)
+            if not chunk:
+                break
+            data = tail + chunk
+            cut = data.rfind('\n')
+            if cut < 0:
+                tail = data
+                continue
+            self._feed(data[:cut + 1])
+            tail = data[cut + 1:]
+        if tail:
+            self._feed(tail + '\n')
+        self._end_section()
+
+    def _error(self, message: str, text: str = '', pos: int = 0):
+        """
+        Lanzar un error de formato con el número de línea
+
+        Args:
+            message: Descripción del error
+            text: Bloque que se estaba leyendo
+            pos: Posición del token dentro del bloque
+        """
+        line = self._line + text.count('\n', 0, pos) + 1
+        raise ValueError(f'Formato LP inválido en la línea {line}: {message}')
+
+    def _column(self, name: str) -> int:
+        """
+        Obtener el índice de una variable, agregándola si es nueva
+
+        Args:
+            name: Nombre de la variable
+
+        Returns:
+            Índice de la columna
+        """
+        col = self.var_index.get(name)
+        if col is None:
+            col = len(self.var_names)
+            self.var_index[name] = col
+            self.var_names.append(name)
+        return col
+
+    def _feed(self, text: str):
+        """
+        Procesar un bloque de líneas completas
+
+        Args:
+            text: Bloque de texto
+        """
+        for match in _TOKEN.finditer(text):
+            kind = match.lastgroup
+            if kind == 'comment':
+                continue
+
+            if kind == 'term':
+                sign, coef, name = match.group('tsign', 'tcoef', 'tname')
+                if (self._sense is None and self._label is None and self._coef is None
+                        and self.section in ('objective', 'constraints')):
+                    # Camino rápido: término completo de una expresión
+                    if sign == '-':
+                        self._sign = -self._sign
+                    if coef:
+                        self._coef = _to_float(coef)
+                    self._add_term(name)
+                    continue
+                for kind, token in (('sign', sign), ('number', coef), ('name', name)):
+                    if token:
+                        self._dispatch(kind, token, text, match.start())
+                continue
+
+            token = match.group(kind)
+            if kind == 'keyword':
+                self._end_section(text, match.start())
+                section = _SECTIONS[' '.join(token.lower().split())]
+                if section == 'semi':
+                    self._error('las variables semicontinuas no están soportadas', text, match.start())
+                if section in ('max', 'min'):
+                    self.maximize = section == 'max'
+                    section = 'objective'
+                self.section = section
+                continue
+
+            if kind == 'error':
+                self._error(f"carácter inesperado '{token}'", text, match.start())
+            self._dispatch(kind, token, text, match.start())
+
+        self._line += text.count('\n')
+
+    def _dispatch(self, kind: str, token: str, text: str, pos: int):
+        """
+        Enviar un token al manejador de la sección actual
+
+        Args:
+            kind: Tipo de token
+            token: Texto del token
+            text: Bloque en lectura (para mensajes de error)
+            pos: Posición del token en el bloque
+        """
+        if self.section in ('objective', 'constraints'):
+            self._expression_token(kind, token, text, pos)
+        elif self.section == 'bounds':
+            self._bound_token(kind, token, text, pos)
+        elif self.section in ('general', 'binary'):
+            if kind != 'name':
+                self._error(f"se esperaba un nombre de variable y se encontró '{token}'", text, pos)
+            col = self._column(token)
+            self.integer.add(col)
+            if self.section == 'binary':
+                self.binary.add(col)
+        elif self.section == 'end':
+            self._error('hay contenido después de End', text, pos)
+        else:
+            self._error('falta la sección de la función objetivo', text, pos)
+
+    def _add_term(self, name: str):
+        """
+        Agregar el término pendiente (signo y coeficiente) de una variable
+
+        Args:
+            name: Nombre de la variable
+        """
+        value = self._sign * (1.0 if self._coef is None else self._coef)
+        col = self._column(name)
+        if self.section == 'objective':
+            self.obj_cols.append(col)
+            self.obj_vals.append(value)
+        else:
+            self.rows.append(len(self.rhs))
+            self.cols.append(col)
+            self.vals.append(value)
+        self._sign = 1.0
+        self._coef = None
+        self._row_started = True
+
+    def _flush_pending(self):
+        """Resolver una etiqueta que resultó ser variable y una constante suelta"""
+        if self._label is not None:
+            label, self._label = self._label, None
+            self._add_term(label)
+        if self._coef is not None:
+            self._constant += self._sign * self._coef
+            self._sign = 1.0
+            self._coef = None
+            self._row_started = True
+
+    def _expression_token(self, kind: str, token: str, text: str, pos: int):
+        """
+        Procesar un token de la función objetivo o de una restricción
+
+        Args:
+            kind: Tipo de token
+            token: Texto del token
+            text: Bloque en lectura (para mensajes de error)
+            pos: Posición del token en el bloque
+        """
+        if self._sense is not None:
+            # Lado derecho de una restricción: [signo] número
+            if kind == 'sign':
+                if token == '-':
+                    self._rhs_sign = -self._rhs_sign
+            elif kind == 'number':
+                self._finish_row(self._rhs_sign * _to_float(token))
+            else:
+                self._error(f"se esperaba el lado derecho y se encontró '{token}'", text, pos)
+            return
+
+        if kind == 'name':
+            at_start = (not self._row_started and self._label is None
+                        and self._row_name is None and self._coef is None and self._sign == 1.0)
+            if at_start:
+                # Puede ser la etiqueta de la fila; se decide con el token siguiente
+                self._label = token
+                return
+            if self._label is not None:
+                self._error(f"falta un operador entre '{self._label}' y '{token}'", text, pos)
+            self._add_term(token)
+        elif kind == 'colon':
+            if self._label is None:
+                self._error("':' sin nombre de fila", text, pos)
+            self._row_name, self._label = self._label, None
+        elif kind == 'number':
+            if self._label is not None or self._coef is not None:
+                self._error(f"dos números seguidos ('{token}')", text, pos)
+            self._coef = _to_float(token)
+        elif kind == 'sign':
+            self._flush_pending()
+            if token == '-':
+                self._sign = -self._sign
+        elif kind == 'op':
+            if self.section == 'objective':
+                self._error('la función objetivo no lleva operador de comparación', text, pos)
+            self._flush_pending()
+            if not self._row_started:
+                self._error('restricción sin variables', text, pos)
+            self._sense = _SENSES[token]
+
+    def _finish_row(self, rhs: float):
+        """
+        Cerrar la restricción en curso
+
+        Args:
+            rhs: Lado derecho leído
+        """
+        row = len(self.rhs)
+        self.rhs.append(rhs - self._constant)
+        self.senses.append(ord(self._sense))
+        self.constraint_names.append(self._row_name or f'R{row + 1}')
+        self._reset_row()
+
+    def _end_section(self, text: str = '', pos: int = 0):
+        """
+        Cerrar la expresión o la cota pendiente al cambiar de sección
+
+        Args:
+            text: Bloque en lectura (para mensajes de error)
+            pos: Posición de la palabra clave en el bloque
+        """
+        if self.section == 'objective':
+            self._flush_pending()
+            self.objective_constant += self._constant
+            self._reset_row()
+        elif self.section == 'constraints':
+            if self._row_started or self._label is not None or self._sense is not None:
+                self._error('restricción incompleta al final de la sección', text, pos)
+        elif self.section == 'bounds':
+            self._finish_bound(text, pos)
+
+    def _bound_token(self, kind: str, token: str, text: str, pos: int):
+        """
+        Procesar un token de la sección Bounds
+
+        Una cota se cierra cuando llega un número o nombre que no puede
+        continuarla: "x <= 4", "-1 <= x", "-inf <= x <= 10", "x = 3" o
+        "x free".
+
+        Args:
+            kind: Tipo de token
+            token: Texto del token
+            text: Bloque en lectura (para mensajes de error)
+            pos: Posición del token en el bloque
+        """
+        if kind == 'sign':
+            if token == '-':
+                self._bound_sign = -self._bound_sign
+            return
+        if kind == 'name' and token.lower() == 'free' and len(self._bound) == 1 \
+                and self._bound[0][0] == 'name':
+            col = self._column(self._bound[0][1])
+            self.lower[col] = -np.inf
+            self.upper[col] = np.inf
+            self._bound = []
+            return
+        if kind == 'number':
+            item = ('number', self._bound_sign * _to_float(token))
+            self._bound_sign = 1.0
+        elif kind in ('name', 'op'):
+            item = (kind, token)
+        else:
+            self._error(f"token inesperado en Bounds: '{token}'", text, pos)
+
+        if kind != 'op' and self._bound and self._bound[-1][0] != 'op':
+            self._finish_bound(text, pos)
+        self._bound.append(item)
+
+    def _finish_bound(self, text: str = '', pos: int = 0):
+        """
+        Aplicar la cota acumulada
+
+        Args:
+            text: Bloque en lectura (para mensajes de error)
+            pos: Posición del token en el bloque
+        """
+        bound, self._bound = self._bound, []
+        if not bound:
+            return
+        kinds = [kind for kind, _ in bound]
+        if kinds == ['name', 'op', 'number']:
+            self._apply_bound(bound[0][1], bound[1][1], bound[2][1])
+        elif kinds == ['number', 'op', 'name']:
+            self._apply_bound(bound[2][1], _FLIP[bound[1][1]], bound[0][1])
+        elif kinds == ['number', 'op', 'name', 'op', 'number']:
+            self._apply_bound(bound[2][1], _FLIP[bound[1][1]], bound[0][1])
+            self._apply_bound(bound[2][1], bound[3][1], bound[4][1])
+        else:
+            self._error('cota con formato desconocido', text, pos)
+
+    def _apply_bound(self, name: str, op: str, value: float):
+        """
+        Guardar una cota de variable
+
+        Args:
+            name: Nombre de la variable
+            op: Operador (la variable está a la izquierda)
+            value: Valor de la cota
+        """
+        col = self._column(name)
+        if value >= _INFINITY:
+            value = np.inf
+        elif value <= -_INFINITY:
+            value = -np.inf
+        sense = _SENSES[op]
+        if sense in ('L', 'E'):
+            self.upper[col] = value
+        if sense in ('G', 'E'):
+            self.lower[col] = value
+
+    def _build_model(self) -> LPModel:
+        """
+        Convertir los buffers en arreglos y armar el modelo
+
+        Returns:
+            LPModel con el problema leído
+        """
+        if self.maximize is None:
+            raise ValueError('Formato LP inválido: falta la sección de la función objetivo')
+        n_vars = len(self.var_names)
+        n_rows = len(self.rhs)
+
+        obj_cols = np.frombuffer(self.obj_cols, dtype=np.int64)
+        obj_vals = np.frombuffer(self.obj_vals, dtype=np.float64)
+        c = np.bincount(obj_cols, weights=obj_vals, minlength=n_vars)
+        A = SparseMatrix.from_triplets(np.frombuffer(self.rows, dtype=np.int64),
+                                       np.frombuffer(self.cols, dtype=np.int64),
+                                       np.frombuffer(self.vals, dtype=np.float64),
+                                       (n_rows, n_vars))
+
+        rhs = np.frombuffer(self.rhs, dtype=np.float64)
+        senses = np.frombuffer(bytes(self.senses), dtype=np.uint8)
+        rhs = np.where(rhs >= _INFINITY, np.inf, np.where(rhs <= -_INFINITY, -np.inf, rhs))
+        row_lower = np.where(senses == ord('L'), -np.inf, rhs)
+        row_upper = np.where(senses == ord('G'), np.inf, rhs)
+
+        lower = np.zeros(n_vars)
+        upper = np.full(n_vars, np.inf)
+        for col in self.binary:
+            upper[col] = 1.0
+        for col, value in self.lower.items():
+            lower[col] = value
+        for col, value in self.upper.items():
+            upper[col] = value
+        integer = np.zeros(n_vars, dtype=bool)
+        integer[list(self.integer)] = True
+
+        return LPModel(c, A, row_lower, row_upper, lower, upper,
+                       maximize=self.maximize, objective_constant=self.objective_constant,
+                       variable_names=list(self.var_names),
+                       constraint_names=list(self.constraint_names), integer=integer)
+
+
+_FLIP = {'<=': '>=', '=<': '>=', '<': '>=', '>=': '<=', '=>': '<=', '>': '<=', '=': '='}
+
+
+def _to_float(token: str) -> float:
+    """
+    Convertir un número del formato LP (incluye inf e infinity)
+
+    Args:
+        token: Texto del número
+
+    Returns:
+        Valor como float
+    """
+    if token[0] in 'iI':
+        return np.inf
+    return float(token)
+
+
+def read_lp(source, chunk_size: int = 1 << 20) -> LPModel:
+    """
+    Leer un archivo en formato LP de CPLEX
+
+    Args:
+        source: Ruta del archivo o un objeto con método read()
+        chunk_size: Caracteres leídos por bloque
+
+    Returns:
+        LPModel con el problema leído
+    """
+    return LPReader(chunk_size).read(source)
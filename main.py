@@ -10,10 +10,14 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolb
 from matplotlib.figure import Figure
 import numpy as np
 import re
+from fractions import Fraction
 from gemini_api import GeminiAPI
 from image_processor import ImageProcessor
 from config import Config
 from simplex_solver import SimplexSolver
+from solver_registry import solve_text
+from solve_control import CancellationToken
+from result_cache import ResultCache
 
 class LinearProgrammingGUI:
     def __init__(self):
@@ -29,6 +33,8 @@ class LinearProgrammingGUI:
         self.current_image_path = None
         self.simplex_solver = SimplexSolver()
         self.current_problem_data = None  # Guardar datos del problema analizado
+        self.cancel_token = None  # Cancelación de la resolución en curso
+        self.result_cache = ResultCache()  # Problemas ya resueltos en esta sesión
         
         self.setup_ui()
         self.check_api_key()
@@ -143,6 +149,11 @@ class LinearProgrammingGUI:
                                       command=self.solve_simplex, state="disabled")
         self.simplex_btn.pack(side=tk.LEFT, padx=5)
         
+        # Botón para detener una resolución en curso
+        self.cancel_btn = ttk.Button(simplex_controls, text="Cancelar",
+                                     command=self.cancel_simplex, state="disabled")
+        self.cancel_btn.pack(side=tk.LEFT, padx=5)
+        
         # Label de estado
         self.simplex_status_label = ttk.Label(simplex_controls, text="Carga y analiza una imagen primero")
         self.simplex_status_label.pack(side=tk.LEFT, padx=10)
@@ -867,9 +878,24 @@ class LinearProgrammingGUI:
             messagebox.showerror("Error", "No hay datos del problema para resolver")
             return
         
-        # Ejecutar en hilo separado
+        # Ejecutar en hilo separado (cancelable desde el botón)
+        self.cancel_token = CancellationToken()
+        self.simplex_btn.config(state="disabled")
+        self.cancel_btn.config(state="normal")
         threading.Thread(target=self._solve_simplex_thread, daemon=True).start()
     
+    def cancel_simplex(self):
+        """Pedir que se detenga la resolución en curso"""
+        if self.cancel_token is not None:
+            self.cancel_token.cancel()
+            self.simplex_status_label.config(text="Cancelando...")
+    
+    def _report_simplex_progress(self, info):
+        """Mostrar el progreso del Simplex (se llama desde el hilo del solver)"""
+        text = (f"Resolviendo... iteración {info['iteration']}, Z = {info['objective']:.4f} "
+                f"({info['pivots_per_second']:.0f} pivoteos/s)")
+        self.root.after(0, lambda: self.simplex_status_label.config(text=text))
+    
     def _solve_simplex_thread(self):
         """Hilo para resolver con Simplex"""
         try:
@@ -884,8 +910,11 @@ class LinearProgrammingGUI:
                 self.root.after(0, self._show_error, "Datos del problema incompletos")
                 return
             
-            # Resolver con Simplex
-            result = self.simplex_solver.solve_from_text(objective, restrictions)
+            # Resolver con el motor más adecuado para la forma del problema
+            result = solve_text(objective, restrictions, method='auto',
+                                cancel_token=self.cancel_token,
+                                progress=self._report_simplex_progress,
+                                cache=self.result_cache)
             
             # Mostrar resultado
             self.root.after(0, self._display_simplex_result, result)
@@ -894,6 +923,8 @@ class LinearProgrammingGUI:
             self.root.after(0, self._show_error, f"Error en Simplex: {str(e)}")
         finally:
             self.root.after(0, self._update_progress, False, "Listo")
+            self.root.after(0, lambda: self.cancel_btn.config(state="disabled"))
+            self.root.after(0, lambda: self.simplex_btn.config(state="normal"))
     
     def _display_simplex_result(self, result):
         """Mostrar resultado del método Simplex"""
@@ -917,6 +948,33 @@ class LinearProgrammingGUI:
             self.simplex_status_label.config(text="Problema no acotado")
             return
         
+        if result['status'] == 'infeasible':
+            error_label = ttk.Label(self.simplex_content_frame,
+                                   text=result['message'],
+                                   foreground='orange', font=('Arial', 12, 'bold'))
+            error_label.pack(pady=20)
+            self.simplex_status_label.config(text="Problema infactible")
+            return
+        
+        if result['status'] == 'iteration_limit':
+            error_label = ttk.Label(self.simplex_content_frame,
+                                   text=result['message'],
+                                   foreground='orange', font=('Arial', 12, 'bold'))
+            error_label.pack(pady=20)
+            self.simplex_status_label.config(text="Límite de iteraciones alcanzado")
+            return
+        
+        if result['status'] in ('cancelled', 'time_limit'):
+            text = result['message']
+            if 'objective' in result:
+                text += f" (mejor solución factible: Z = {result['objective']:.4f})"
+            error_label = ttk.Label(self.simplex_content_frame,
+                                   text=text,
+                                   foreground='orange', font=('Arial', 12, 'bold'))
+            error_label.pack(pady=20)
+            self.simplex_status_label.config(text=result['message'])
+            return
+        
         # Mostrar solución óptima
         if result['status'] == 'optimal':
             solution_frame = ttk.LabelFrame(self.simplex_content_frame, 
@@ -943,6 +1001,25 @@ class LinearProgrammingGUI:
                                   font=('Arial', 12))
             vars_label.pack(anchor=tk.W, pady=5)
             
+            # Precios sombra (análisis de sensibilidad)
+            sensitivity = result.get('sensitivity')
+            if sensitivity is not None and len(sensitivity['shadow_prices']) > 0:
+                prices_text = "Precios sombra: " + ", ".join(
+                    f"R{i + 1} = {price:.4f}" for i, price in enumerate(sensitivity['shadow_prices']))
+                prices_label = ttk.Label(solution_frame,
+                                        text=prices_text,
+                                        font=('Arial', 10))
+                prices_label.pack(anchor=tk.W, pady=5)
+            
+            # Motor usado y razón de la elección
+            backend = result.get('backend')
+            if backend is not None:
+                backend_label = ttk.Label(solution_frame,
+                                         text=f"Motor: {backend['method']} ({backend['reason']})"
+                                              + (" - resultado en caché" if result.get('cache', {}).get('hit') else ""),
+                                         font=('Arial', 10))
+                backend_label.pack(anchor=tk.W, pady=5)
+            
             self.simplex_status_label.config(text="Solución óptima encontrada")
         
         # Mostrar iteraciones
@@ -953,16 +1030,17 @@ class LinearProgrammingGUI:
                                         font=('Arial', 12, 'bold'))
             iterations_label.pack(pady=10)
             
-            # Mostrar cada iteración
-            for iter_data in iterations:
-                self._create_iteration_table(iter_data)
+            # Mostrar cada iteración (se reconstruye bajo demanda si hace falta)
+            for iteration_idx in range(len(iterations)):
+                self._create_iteration_table(iterations, iteration_idx)
         
         # Actualizar scroll region
         self.simplex_content_frame.update_idletasks()
         self.simplex_canvas.configure(scrollregion=self.simplex_canvas.bbox('all'))
     
-    def _create_iteration_table(self, iter_data):
+    def _create_iteration_table(self, iterations, iteration_idx):
         """Crear tabla para una iteración del Simplex"""
+        iter_data = iterations.get_iteration(iteration_idx)
         iteration_num = iter_data['iteration']
         
         # Frame para esta iteración
@@ -973,6 +1051,11 @@ class LinearProgrammingGUI:
         # Título
         if iteration_num == 0:
             title = "TABLA INICIAL"
+            if iter_data.get('phase_one', False):
+                title += " - FASE 1 (OBJETIVO EN CERO)"
+            title_color = 'blue'
+        elif iter_data.get('phase_change', False):
+            title = f"FIN DE FASE 1 - SE RESTAURA LA FUNCIÓN OBJETIVO (ITERACIÓN {iteration_num})"
             title_color = 'blue'
         elif iter_data.get('is_optimal', False):
             title = f"ITERACIÓN {iteration_num} - SOLUCIÓN ÓPTIMA"
@@ -989,14 +1072,36 @@ class LinearProgrammingGUI:
         # Información de pivote
         if iter_data['pivot_row'] >= 0 and iter_data['pivot_col'] >= 0:
             pivot_col_name = iter_data['col_names'][iter_data['pivot_col']]
-            pivot_row_name = iter_data['row_names'][iter_data['pivot_row']]
-            pivot_val = iter_data['tableau'][iter_data['pivot_row'], iter_data['pivot_col']]
+            pivot_row_name = iter_data['leaving_name']
+            pivot_val = iter_data['pivot_element']
             
             pivot_info = f"Columna Pivote: {pivot_col_name} | Fila Pivote: {pivot_row_name} | Elemento Pivote: {pivot_val:.4f}"
+            if iter_data.get('row_complement', False):
+                pivot_info += f" | Simplex dual: {pivot_row_name} excedía su cota superior"
             pivot_label = ttk.Label(iter_frame, text=pivot_info,
                                    font=('Arial', 10),
                                    foreground='darkred')
             pivot_label.pack(anchor=tk.W, pady=(0, 10))
+        elif iter_data.get('bound_flip', False):
+            flip_col_name = iter_data['col_names'][iter_data['pivot_col']]
+            flip_info = f"Cambio de cota: {flip_col_name} pasa a su cota opuesta (sin pivoteo)"
+            flip_label = ttk.Label(iter_frame, text=flip_info,
+                                  font=('Arial', 10),
+                                  foreground='darkred')
+            flip_label.pack(anchor=tk.W, pady=(0, 10))
+        elif iter_data.get('perturbation', False):
+            perturb_label = ttk.Label(iter_frame,
+                                     text="Base repetida (ciclo): se perturban o restauran los lados derechos",
+                                     font=('Arial', 10),
+                                     foreground='darkred')
+            perturb_label.pack(anchor=tk.W, pady=(0, 10))
+        
+        # Sin tableau guardado (historial resumido): solo el valor de Z
+        if iter_data['tableau'] is None:
+            objective_label = ttk.Label(iter_frame, text=f"Z = {iter_data['objective']:.4f}",
+                                       font=('Arial', 10))
+            objective_label.pack(anchor=tk.W)
+            return
         
         # Crear tabla
         table_frame = tk.Frame(iter_frame, relief=tk.SOLID, borderwidth=1)
@@ -1060,7 +1165,9 @@ class LinearProgrammingGUI:
                 elif i == n_rows - 1:
                     bg_color = 'lavender'
                 
-                cell = tk.Label(table_frame, text=f"{value:.4f}",
+                # El modo exacto guarda fracciones: se muestran como a/b
+                text = str(value) if isinstance(value, Fraction) else f"{value:.4f}"
+                cell = tk.Label(table_frame, text=text,
                               font=('Arial', 9, font_weight),
                               relief=tk.RIDGE, borderwidth=1,
                               bg=bg_color, fg=fg_color, width=10)
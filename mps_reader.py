@@ -0,0 +1,448 @@
+import mmap
+import os
+import numpy as np
+from array import array
+from typing import Dict, List
+from sparse_matrix import SparseMatrix
+from lp_model import LPModel
+
+
+# Columnas (base 0) de los seis campos del formato MPS fijo
+_FIXED_FIELDS = ((1, 3), (4, 12), (14, 22), (24, 36), (39, 47), (49, 61))
+
+_SECTIONS = {b'NAME', b'OBJSENSE', b'OBJSENS', b'ROWS', b'COLUMNS', b'RHS',
+             b'RANGES', b'BOUNDS', b'ENDATA'}
+
+
+class MPSReader:
+    """
+    Lector de archivos MPS (fijo o libre) mapeados en memoria.
+
+    El archivo se abre con mmap y se recorre línea a línea una sola vez
+    sin decodificar: los nombres se comparan como bytes y los coeficientes
+    de COLUMNS, RHS, RANGES y BOUNDS van directo a buffers tipados
+    (array.array) de índices y valores. Al final los buffers se convierten
+    sin copia en arreglos de NumPy, así un archivo de cientos de MB no
+    crea un objeto de Python por coeficiente.
+
+    En formato libre los campos se separan por espacios (los nombres no
+    pueden tenerlos); en formato fijo se toman por posición de columna.
+    """
+
+    def __init__(self, fixed: bool = False):
+        """
+        Inicializar el lector
+
+        Args:
+            fixed: Leer en formato MPS fijo (campos por posición)
+        """
+        self.fixed = fixed
+
+    def read(self, path: str) -> LPModel:
+        """
+        Leer un modelo en formato MPS
+
+        Args:
+            path: Ruta del archivo
+
+        Returns:
+            LPModel con el problema leído
+        """
+        if os.path.getsize(path) == 0:
+            raise ValueError('Formato MPS inválido: el archivo está vacío')
+        self._reset()
+        with open(path, 'rb') as stream:
+            with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                lines = iter(data.readline, b'')
+                for line in lines:
+                    self._line += 1
+                    self._parse_line(line)
+                    # COLUMNS concentra casi todo el archivo: lazo dedicado
+                    while self.section == b'COLUMNS' and not self.fixed:
+                        line = self._scan_columns(lines)
+                        if not line:
+                            break
+                        self._parse_line(line)
+        return self._build_model()
+
+    def _reset(self):
+        """Preparar buffers y estado para un archivo nuevo"""
+        self.name = ''
+        self.section = None
+        self.maximize = False
+        self.objective_row = None
+        self.row_index: Dict[bytes, int] = {}
+        self.row_names: List[bytes] = []
+        self.senses = bytearray()
+        self.col_index: Dict[bytes, int] = {}
+        self.col_names: List[bytes] = []
+        self.obj_cols = array('q')
+        self.obj_vals = array('d')
+        self.rows = array('q')
+        self.cols = array('q')
+        self.vals = array('d')
+        self.rhs_rows = array('q')
+        self.rhs_vals = array('d')
+        self.range_rows = array('q')
+        self.range_vals = array('d')
+        self.bound_cols = array('q')
+        self.bound_types = bytearray()
+        self.bound_vals = array('d')
+        self.integer_cols = array('q')
+        self.objective_constant = 0.0
+        self._in_integer_block = False
+        self._line = 0
+
+    def _error(self, message: str):
+        """
+        Lanzar un error de formato con el número de línea
+
+        Args:
+            message: Descripción del error
+        """
+        raise ValueError(f'Formato MPS inválido en la línea {self._line}: {message}')
+
+    def _fields(self, line: bytes) -> List[bytes]:
+        """
+        Separar una línea de datos en campos
+
+        Args:
+            line: Línea sin el salto final
+
+        Returns:
+            Lista de campos no vacíos
+        """
+        if not self.fixed:
+            return line.split()
+        fields = (line[start:end].strip() for start, end in _FIXED_FIELDS)
+        return [field for field in fields if field]
+
+    def _parse_line(self, line: bytes):
+        """
+        Procesar una línea del archivo
+
+        Args:
+            line: Línea leída del mapa de memoria
+        """
+        line = line.rstrip(b'\r\n')
+        if not line.strip() or line[:1] == b'*':
+            return
+
+        if line[:1] not in (b' ', b'\t'):
+            # Encabezado de sección (empieza en la primera columna)
+            parts = line.split()
+            header = parts[0].upper()
+            if header not in _SECTIONS:
+                self._error(f"sección desconocida '{header.decode(errors='replace')}'")
+            self.section = header
+            if header == b'NAME' and len(parts) > 1:
+                self.name = b' '.join(parts[1:]).decode(errors='replace')
+            elif header in (b'OBJSENSE', b'OBJSENS') and len(parts) > 1:
+                self._set_sense(parts[1])
+            return
+
+        fields = self._fields(line)
+        section = self.section
+        if section == b'COLUMNS':
+            self._parse_column(fields)
+        elif section == b'ROWS':
+            self._parse_row(fields)
+        elif section == b'RHS':
+            self._parse_values(fields, self.rhs_rows, self.rhs_vals, objective_sign=-1.0)
+        elif section == b'RANGES':
+            self._parse_values(fields, self.range_rows, self.range_vals)
+        elif section == b'BOUNDS':
+            self._parse_bound(fields)
+        elif section in (b'OBJSENSE', b'OBJSENS'):
+            self._set_sense(fields[0])
+        elif section == b'ENDATA':
+            self._error('hay contenido después de ENDATA')
+        else:
+            self._error('datos fuera de una sección')
+
+    def _set_sense(self, word: bytes):
+        """
+        Fijar el sentido del objetivo
+
+        Args:
+            word: MAX, MAXIMIZE, MIN o MINIMIZE
+        """
+        word = word.upper()
+        if word not in (b'MAX', b'MAXIMIZE', b'MIN', b'MINIMIZE'):
+            self._error(f"sentido del objetivo desconocido '{word.decode(errors='replace')}'")
+        self.maximize = word.startswith(b'MAX')
+
+    def _parse_row(self, fields: List[bytes]):
+        """
+        Procesar una línea de ROWS: tipo y nombre
+
+        Args:
+            fields: Campos de la línea
+        """
+        if len(fields) != 2:
+            self._error('se esperaba tipo y nombre de fila')
+        kind, name = fields[0].upper(), fields[1]
+        if kind == b'N':
+            # La primera fila N es el objetivo; las demás se ignoran
+            if self.objective_row is None:
+                self.objective_row = name
+            return
+        if kind not in (b'L', b'G', b'E'):
+            self._error(f"tipo de fila desconocido '{kind.decode(errors='replace')}'")
+        if name in self.row_index:
+            self._error(f"fila repetida '{name.decode(errors='replace')}'")
+        self.row_index[name] = len(self.row_names)
+        self.row_names.append(name)
+        self.senses += kind
+
+    def _column(self, name: bytes) -> int:
+        """
+        Obtener el índice de una columna, agregándola si es nueva
+
+        Args:
+            name: Nombre de la columna
+
+        Returns:
+            Índice de la columna
+        """
+        col = self.col_index.get(name)
+        if col is None:
+            col = len(self.col_names)
+            self.col_index[name] = col
+            self.col_names.append(name)
+        return col
+
+    def _row(self, name: bytes) -> int:
+        """
+        Obtener el índice de una fila declarada en ROWS
+
+        Args:
+            name: Nombre de la fila
+
+        Returns:
+            Índice de la fila o -1 si es el objetivo
+        """
+        if name == self.objective_row:
+            return -1
+        row = self.row_index.get(name)
+        if row is None:
+            self._error(f"fila no declarada '{name.decode(errors='replace')}'")
+        return row
+
+    def _scan_columns(self, lines) -> bytes:
+        """
+        Leer la sección COLUMNS en formato libre hasta el siguiente encabezado
+
+        Las líneas con una sola entrada (columna, fila, valor) se procesan
+        aquí con búsquedas locales; el índice de la columna se reutiliza
+        mientras no cambie el nombre, ya que en MPS cada columna es
+        contigua. Las demás líneas pasan por _parse_column.
+
+        Args:
+            lines: Iterador de líneas del mapa de memoria
+
+        Returns:
+            Línea del siguiente encabezado de sección o b'' al final del archivo
+        """
+        row_index = self.row_index
+        objective_row = self.objective_row
+        rows_append, cols_append, vals_append = self.rows.append, self.cols.append, self.vals.append
+        last_name = None
+        col = -1
+        for line in lines:
+            self._line += 1
+            first = line[:1]
+            if first != b' ' and first != b'\t':
+                if first == b'*' or not line.strip():
+                    continue
+                return line
+            fields = line.split()
+            if len(fields) != 3 or fields[1][:1] == b"'":
+                if fields:
+                    self._parse_column(fields)
+                last_name = None
+                continue
+            name, row_name, value = fields
+            if name != last_name:
+                col = self._column(name)
+                last_name = name
+                if self._in_integer_block:
+                    self.integer_cols.append(col)
+            row = row_index.get(row_name)
+            if row is not None:
+                rows_append(row)
+                cols_append(col)
+                vals_append(float(value))
+            elif row_name == objective_row:
+                self.obj_cols.append(col)
+                self.obj_vals.append(float(value))
+            else:
+                self._error(f"fila no declarada '{row_name.decode(errors='replace')}'")
+        return b''
+
+    def _parse_column(self, fields: List[bytes]):
+        """
+        Procesar una línea de COLUMNS: columna y uno o dos pares fila/valor
+
+        Args:
+            fields: Campos de la línea
+        """
+        if len(fields) >= 3 and fields[1].strip(b"'").upper() == b'MARKER':
+            marker = fields[-1].strip(b"'").upper()
+            self._in_integer_block = marker == b'INTORG'
+            return
+        if len(fields) not in (3, 5):
+            self._error('se esperaba columna y uno o dos pares fila/valor')
+        col = self._column(fields[0])
+        if self._in_integer_block:
+            self.integer_cols.append(col)
+        for k in range(1, len(fields), 2):
+            row = self._row(fields[k])
+            value = float(fields[k + 1])
+            if row < 0:
+                self.obj_cols.append(col)
+                self.obj_vals.append(value)
+            else:
+                self.rows.append(row)
+                self.cols.append(col)
+                self.vals.append(value)
+
+    def _parse_values(self, fields: List[bytes], rows: array, values: array,
+                      objective_sign: float = 0.0):
+        """
+        Procesar una línea de RHS o RANGES: [conjunto] y pares fila/valor
+
+        Args:
+            fields: Campos de la línea
+            rows: Buffer de filas de la sección
+            values: Buffer de valores de la sección
+            objective_sign: Factor con que un valor en la fila objetivo pasa a
+                la constante del objetivo (0 para ignorarlo)
+        """
+        # El nombre del conjunto es opcional en MPS libre
+        start = 1 if len(fields) % 2 == 1 else 0
+        if len(fields) - start not in (2, 4):
+            self._error('se esperaban uno o dos pares fila/valor')
+        for k in range(start, len(fields), 2):
+            row = self._row(fields[k])
+            value = float(fields[k + 1])
+            if row < 0:
+                self.objective_constant += objective_sign * value
+            else:
+                rows.append(row)
+                values.append(value)
+
+    def _parse_bound(self, fields: List[bytes]):
+        """
+        Procesar una línea de BOUNDS: tipo, [conjunto], columna y [valor]
+
+        Args:
+            fields: Campos de la línea
+        """
+        if not fields:
+            return
+        kind = fields[0].upper()
+        if kind in (b'UP', b'LO', b'FX', b'LI', b'UI'):
+            needed = 2
+        elif kind in (b'FR', b'MI', b'PL', b'BV'):
+            needed = 1
+        elif kind == b'SC':
+            self._error('las variables semicontinuas no están soportadas')
+        else:
+            self._error(f"tipo de cota desconocido '{kind.decode(errors='replace')}'")
+
+        # El nombre del conjunto es opcional en MPS libre
+        rest = fields[1:]
+        if len(rest) > needed:
+            rest = rest[1:]
+        if len(rest) < needed:
+            self._error('faltan campos en la cota')
+        col = self._column(rest[0])
+        value = float(rest[1]) if needed == 2 else 0.0
+        self.bound_cols.append(col)
+        self.bound_types += kind[:2]
+        self.bound_vals.append(value)
+
+    def _build_model(self) -> LPModel:
+        """
+        Convertir los buffers en arreglos y armar el modelo
+
+        Returns:
+            LPModel con el problema leído
+        """
+        n_rows = len(self.row_names)
+        n_vars = len(self.col_names)
+
+        obj_cols = np.frombuffer(self.obj_cols, dtype=np.int64)
+        c = np.bincount(obj_cols, weights=np.frombuffer(self.obj_vals, dtype=np.float64),
+                        minlength=n_vars)
+        A = SparseMatrix.from_triplets(np.frombuffer(self.rows, dtype=np.int64),
+                                       np.frombuffer(self.cols, dtype=np.int64),
+                                       np.frombuffer(self.vals, dtype=np.float64),
+                                       (n_rows, n_vars))
+
+        # Lados derechos y rangos
+        rhs = np.zeros(n_rows)
+        rhs[np.frombuffer(self.rhs_rows, dtype=np.int64)] = np.frombuffer(self.rhs_vals, dtype=np.float64)
+        senses = np.frombuffer(bytes(self.senses), dtype=np.uint8)
+        row_lower = np.where(senses == ord('L'), -np.inf, rhs)
+        row_upper = np.where(senses == ord('G'), np.inf, rhs)
+
+        range_rows = np.frombuffer(self.range_rows, dtype=np.int64)
+        ranges = np.frombuffer(self.range_vals, dtype=np.float64)
+        sense = senses[range_rows]
+        width = np.abs(ranges)
+        widen_down = (sense == ord('L')) | ((sense == ord('E')) & (ranges < 0))
+        widen_up = (sense == ord('G')) | ((sense == ord('E')) & (ranges >= 0))
+        row_lower[range_rows[widen_down]] = rhs[range_rows[widen_down]] - width[widen_down]
+        row_upper[range_rows[widen_up]] = rhs[range_rows[widen_up]] + width[widen_up]
+
+        # Cotas de variables, aplicadas en el orden del archivo
+        lower = np.zeros(n_vars)
+        upper = np.full(n_vars, np.inf)
+        integer = np.zeros(n_vars, dtype=bool)
+        integer[np.frombuffer(self.integer_cols, dtype=np.int64)] = True
+        types = bytes(self.bound_types)
+        for k, col in enumerate(self.bound_cols):
+            kind = types[2 * k:2 * k + 2]
+            value = self.bound_vals[k]
+            if kind == b'UP' or kind == b'UI':
+                # Convención usual: una cota superior negativa sin cota
+                # inferior explícita deja la variable libre por abajo
+                if value < 0 and lower[col] == 0:
+                    lower[col] = -np.inf
+                upper[col] = value
+            elif kind == b'LO' or kind == b'LI':
+                lower[col] = value
+            elif kind == b'FX':
+                lower[col] = upper[col] = value
+            elif kind == b'FR':
+                lower[col], upper[col] = -np.inf, np.inf
+            elif kind == b'MI':
+                lower[col] = -np.inf
+            elif kind == b'PL':
+                upper[col] = np.inf
+            elif kind == b'BV':
+                lower[col], upper[col] = 0.0, 1.0
+            if kind in (b'UI', b'LI', b'BV'):
+                integer[col] = True
+
+        return LPModel(c, A, row_lower, row_upper, lower, upper,
+                       maximize=self.maximize, objective_constant=self.objective_constant,
+                       variable_names=[name.decode(errors='replace') for name in self.col_names],
+                       constraint_names=[name.decode(errors='replace') for name in self.row_names],
+                       integer=integer, name=self.name)
+
+
+def read_mps(path: str, fixed: bool = False) -> LPModel:
+    """
+    Leer un archivo en formato MPS
+
+    Args:
+        path: Ruta del archivo
+        fixed: Leer en formato MPS fijo (campos por posición)
+
+    Returns:
+        LPModel con el problema leído
+    """
+    return MPSReader(fixed).read(path)
@@ -0,0 +1,309 @@
+import time
+import numpy as np
+from typing import Dict, Tuple, Optional
+
+
+class Presolver:
+    """
+    Reducciones previas al Simplex para problemas max c·x, A·x <= b, l <= x <= u.
+
+    Aplica hasta que no haya cambios:
+        - filas vacías (se eliminan o prueban infactibilidad)
+        - filas con una sola variable (se convierten en cotas)
+        - filas duplicadas (múltiplos positivos; se conserva la más ajustada)
+        - variables fijas (l = u; se sustituyen en b y en el objetivo)
+        - columnas dominadas (el objetivo y todas las filas empujan la
+          variable hacia la misma cota; se fija en ella)
+
+    Cada reducción queda en el registro y postsolve reconstruye la solución
+    en el espacio original a partir de la solución del problema reducido.
+    """
+
+    def __init__(self, tolerance: float = 1e-10, max_passes: int = 20):
+        """
+        Inicializar el presolve
+
+        Args:
+            tolerance: Tolerancia para considerar un coeficiente como cero
+            max_passes: Número máximo de pasadas sobre el problema
+        """
+        self.tolerance = tolerance
+        self.max_passes = max_passes
+        self.log = []
+        self.counts = {}
+        self.status = None
+
+    def _record(self, action: str, message: str):
+        """
+        Registrar una reducción
+
+        Args:
+            action: Tipo de reducción (clave del conteo)
+            message: Descripción legible
+        """
+        self.counts[action] = self.counts.get(action, 0) + 1
+        self.log.append(message)
+
+    def presolve(self, c: np.ndarray, A: np.ndarray, b: np.ndarray,
+                 lower: Optional[np.ndarray] = None,
+                 upper: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Reducir el problema
+
+        Args:
+            c: Coeficientes de la función objetivo
+            A: Matriz de restricciones (filas "<=")
+            b: Valores del lado derecho
+            lower: Cotas inferiores (por defecto 0)
+            upper: Cotas superiores (por defecto infinito)
+
+        Returns:
+            Tuple con (c, A, b, lower, upper) del problema reducido; si el
+            presolve demuestra infactibilidad o no acotamiento, self.status
+            queda en 'infeasible' o 'unbounded'
+        """
+        start = time.perf_counter()
+        tol = self.tolerance
+        c = np.asarray(c, dtype=float)
+        A = np.atleast_2d(np.asarray(A, dtype=float)).reshape(len(b), len(c))
+        n_rows, n_vars = A.shape
+
+        self.log = []
+        self.counts = {}
+        self.status = None
+        self.original_shape = (n_rows, n_vars)
+        self.offset = 0.0
+        self.fixed_value = np.full(n_vars, np.nan)
+
+        b = np.array(b, dtype=float)
+        lower = np.zeros(n_vars) if lower is None else np.maximum(np.asarray(lower, dtype=float), 0.0)
+        upper = np.full(n_vars, np.inf) if upper is None else np.array(upper, dtype=float)
+        rows = np.ones(n_rows, dtype=bool)
+        cols = np.ones(n_vars, dtype=bool)
+
+        for _ in range(self.max_passes):
+            changed = False
+            sub = A[np.ix_(rows, cols)]
+            row_idx = np.flatnonzero(rows)
+            col_idx = np.flatnonzero(cols)
+            nonzero = np.abs(sub) > tol
+            row_nnz = np.count_nonzero(nonzero, axis=1)
+
+            # Filas vacías: 0 <= b
+            for k in np.flatnonzero(row_nnz == 0):
+                i = row_idx[k]
+                if b[i] < -tol:
+                    self._record('infeasible', f'Fila R{i + 1} vacía con lado derecho {b[i]:g} < 0')
+                    self.status = 'infeasible'
+                    return self._finish(start, c, A, b, lower, upper, rows, cols)
+                rows[i] = False
+                self._record('empty_rows', f'Fila R{i + 1} vacía eliminada')
+                changed = True
+
+            # Filas con una variable: a·xj <= b es una cota
+            for k in np.flatnonzero(row_nnz == 1):
+                i = row_idx[k]
+                j = col_idx[np.flatnonzero(nonzero[k])[0]]
+                coef = A[i, j]
+                value = b[i] / coef
+                if coef > 0:
+                    upper[j] = min(upper[j], value)
+                else:
+                    lower[j] = max(lower[j], value)
+                rows[i] = False
+                self._record('singleton_rows', f'Fila R{i + 1} convertida en cota de x{j + 1}')
+                changed = True
+
+            if np.any(lower > upper + tol):
+                j = int(np.flatnonzero(lower > upper + tol)[0])
+                self._record('infeasible', f'Cotas contradictorias para x{j + 1}')
+                self.status = 'infeasible'
+                return self._finish(start, c, A, b, lower, upper, rows, cols)
+
+            # Filas duplicadas (múltiplos positivos): se conserva el menor b normalizado
+            multi = row_idx[row_nnz >= 2]
+            multi = multi[rows[multi]]
+            if len(multi) > 1:
+                block = A[np.ix_(multi, col_idx)]
+                scale = np.max(np.abs(block), axis=1)
+                normalized = np.round(block / scale[:, np.newaxis], 12)
+                _, group = np.unique(normalized, axis=0, return_inverse=True)
+                group = group.ravel()
+                scaled_b = b[multi] / scale
+                order = np.lexsort((scaled_b, group))
+                first = np.ones(len(order), dtype=bool)
+                first[1:] = group[order][1:] != group[order][:-1]
+                keeper = {}
+                for pos, k in enumerate(order):
+                    if first[pos]:
+                        keeper[group[k]] = multi[k]
+                        continue
+                    i = multi[k]
+                    rows[i] = False
+                    self._record('duplicate_rows',
+                                 f'Fila R{i + 1} duplicada de R{keeper[group[k]] + 1} eliminada')
+                    changed = True
+
+            # Variables fijas y columnas dominadas
+            for j in col_idx:
+                column = A[rows, j]
+                if upper[j] - lower[j] <= tol:
+                    self._fix(j, lower[j], c, A, b, rows, cols)
+                    self._record('fixed_columns', f'x{j + 1} fija en {lower[j]:g}')
+                    changed = True
+                elif c[j] <= 0 and np.all(column >= -tol):
+                    # Subir xj no mejora Z ni afloja ninguna fila
+                    self._fix(j, lower[j], c, A, b, rows, cols)
+                    self._record('dominated_columns', f'x{j + 1} dominada, fija en su cota inferior {lower[j]:g}')
+                    changed = True
+                elif c[j] >= 0 and np.all(column <= tol):
+                    if np.isfinite(upper[j]):
+                        # Subir xj no empeora Z ni ajusta ninguna fila
+                        self._fix(j, upper[j], c, A, b, rows, cols)
+                        self._record('dominated_columns',
+                                     f'x{j + 1} dominada, fija en su cota superior {upper[j]:g}')
+                        changed = True
+                    elif c[j] > tol and np.all(np.abs(column) <= tol):
+                        # Columna vacía: si el resto es factible, xj crece sin límite
+                        self._fix(j, lower[j], c, A, b, rows, cols)
+                        self._record('unbounded', f'x{j + 1} puede crecer sin límite')
+                        self.status = 'unbounded'
+                        changed = True
+
+            if not changed:
+                break
+
+        return self._finish(start, c, A, b, lower, upper, rows, cols)
+
+    def _fix(self, j: int, value: float, c: np.ndarray, A: np.ndarray, b: np.ndarray,
+             rows: np.ndarray, cols: np.ndarray):
+        """
+        Fijar una variable y sustituirla en el lado derecho y en el objetivo
+
+        Args:
+            j: Índice de la variable
+            value: Valor fijo
+            c: Coeficientes de la función objetivo
+            A: Matriz de restricciones
+            b: Lado derecho (se modifica en el lugar)
+            rows: Filas activas
+            cols: Columnas activas (se modifica en el lugar)
+        """
+        self.fixed_value[j] = value
+        self.offset += c[j] * value
+        b[rows] -= A[rows, j] * value
+        cols[j] = False
+
+    def _finish(self, start: float, c: np.ndarray, A: np.ndarray, b: np.ndarray,
+                lower: np.ndarray, upper: np.ndarray, rows: np.ndarray,
+                cols: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Guardar el mapeo y armar el problema reducido
+
+        Returns:
+            Tuple con (c, A, b, lower, upper) del problema reducido
+        """
+        self.kept_rows = np.flatnonzero(rows)
+        self.kept_cols = np.flatnonzero(cols)
+        self.reduced_shape = (len(self.kept_rows), len(self.kept_cols))
+        self.presolve_time = time.perf_counter() - start
+        return (c[self.kept_cols], A[np.ix_(self.kept_rows, self.kept_cols)], b[self.kept_rows],
+                lower[self.kept_cols], upper[self.kept_cols])
+
+    def postsolve(self, solution: np.ndarray, optimal_value: float) -> Tuple[np.ndarray, float]:
+        """
+        Llevar la solución del problema reducido al espacio original
+
+        Args:
+            solution: Solución del problema reducido
+            optimal_value: Valor óptimo del problema reducido
+
+        Returns:
+            Tuple con (solución original, valor óptimo original)
+        """
+        x = self.fixed_value.copy()
+        x[self.kept_cols] = solution
+        return x, optimal_value + self.offset
+
+    def report(self) -> Dict:
+        """
+        Resumen de las reducciones aplicadas
+
+        Returns:
+            Diccionario con tamaños original y reducido, porcentaje de
+            reducción, conteo por tipo, registro y tiempo del presolve
+        """
+        m, n = self.original_shape
+        m_red, n_red = self.reduced_shape
+        return {
+            'original_shape': self.original_shape,
+            'reduced_shape': self.reduced_shape,
+            'row_reduction': 100.0 * (m - m_red) / m if m else 0.0,
+            'column_reduction': 100.0 * (n - n_red) / n if n else 0.0,
+            'counts': dict(self.counts),
+            'log': list(self.log),
+            'presolve_time': self.presolve_time
+        }
+
+
+def solve_with_presolve(solver, c: np.ndarray, A: np.ndarray, b: np.ndarray,
+                        lower: Optional[np.ndarray] = None, upper: Optional[np.ndarray] = None,
+                        compare: bool = False, **options) -> Dict:
+    """
+    Aplicar presolve, resolver el problema reducido y hacer postsolve
+
+    El estado del solver (tableau, historial) queda en el espacio reducido,
+    por eso el resultado no incluye el análisis de sensibilidad; los nombres
+    del historial se cambian a los de las variables originales.
+
+    Args:
+        solver: Instancia de SimplexSolver
+        c: Coeficientes de la función objetivo
+        A: Matriz de restricciones
+        b: Valores del lado derecho
+        lower: Cotas inferiores (por defecto 0)
+        upper: Cotas superiores (por defecto infinito)
+        compare: Resolver también el problema original para medir el tiempo ahorrado
+        **options: Opciones adicionales para solver.solve
+
+    Returns:
+        Diccionario con la solución en el espacio original y 'presolve' con
+        el reporte de reducciones y tiempos
+    """
+    presolver = Presolver()
+    c_red, A_red, b_red, lower_red, upper_red = presolver.presolve(c, A, b, lower, upper)
+    report = presolver.report()
+    n_vars = len(c)
+    names = [f'x{i+1}' for i in range(n_vars)]
+
+    start = time.perf_counter()
+    if presolver.status == 'infeasible':
+        result = {'status': 'infeasible', 'message': 'El presolve demostró que el problema es infactible',
+                  'iterations': []}
+    elif len(c_red) == 0:
+        result = {'status': 'optimal', 'solution': np.zeros(0), 'optimal_value': 0.0,
+                  'iterations': [], 'iteration_count': 0}
+    else:
+        result = solver.solve(c_red, A_red, b_red, lower_red, upper_red, **options)
+        if result['status'] != 'error' and hasattr(result['iterations'], 'rename'):
+            result['iterations'].rename([names[j] for j in presolver.kept_cols])
+    report['solve_time'] = time.perf_counter() - start
+
+    if result['status'] == 'optimal':
+        if presolver.status == 'unbounded':
+            result = {'status': 'unbounded', 'message': 'El problema no está acotado',
+                      'iterations': result['iterations']}
+        else:
+            solution, value = presolver.postsolve(result['solution'], result['optimal_value'])
+            result = dict(result, solution=solution, optimal_value=value, variable_names=names)
+            result.pop('sensitivity', None)
+
+    if compare:
+        start = time.perf_counter()
+        original = type(solver)().solve(c, A, b, lower, upper, **options)
+        report['original_solve_time'] = time.perf_counter() - start
+        report['original_iterations'] = original.get('iteration_count')
+        report['time_saved'] = report['original_solve_time'] - report['presolve_time'] - report['solve_time']
+
+    result['presolve'] = report
+    return result
@@ -0,0 +1,333 @@
+import numpy as np
+from typing import List, Dict
+
+
+class PricingRule:
+    """
+    Regla de selección de la variable entrante (Dantzig).
+
+    Cada regla recibe el tableau y elige una columna con costo reducido
+    negativo; las reglas con pesos los actualizan antes de cada pivoteo.
+    También cuentan cuántas columnas revisan para comparar el costo por
+    iteración entre estrategias.
+    """
+
+    name = 'dantzig'
+
+    # Desempatar la prueba del cociente por el menor índice (regla de Bland)
+    lowest_index_ties = False
+
+    def __init__(self, tolerance: float = 1e-10):
+        """
+        Inicializar la regla
+
+        Args:
+            tolerance: Costo reducido mínimo (en valor absoluto) para entrar
+        """
+        self.tolerance = tolerance
+        self.columns_scanned = 0
+
+    def reset(self, tableau: np.ndarray, basic_vars: List[int]):
+        """
+        Preparar la regla para un nuevo ciclo de pivoteos
+
+        Args:
+            tableau: Tableau inicial de la fase
+            basic_vars: Variables básicas por fila
+        """
+        self.columns_scanned = 0
+
+    def select(self, tableau: np.ndarray) -> int:
+        """
+        Elegir la columna entrante
+
+        Args:
+            tableau: Tableau actual
+
+        Returns:
+            Índice de la columna o -1 si el tableau es óptimo
+        """
+        z_row = tableau[-1, :-1]
+        self.columns_scanned += len(z_row)
+        col = int(np.argmin(z_row))
+        return col if z_row[col] < -self.tolerance else -1
+
+    def update(self, tableau: np.ndarray, basic_vars: List[int], pivot_row: int, pivot_col: int):
+        """
+        Actualizar el estado de la regla antes de pivotear
+
+        Args:
+            tableau: Tableau antes del pivoteo
+            basic_vars: Variables básicas antes del pivoteo
+            pivot_row: Fila pivote
+            pivot_col: Columna pivote
+        """
+        pass
+
+
+class BlandPricing(PricingRule):
+    """
+    Regla de Bland: entra la primera columna con costo reducido negativo y,
+    en la prueba del cociente, sale la variable de menor índice entre las
+    empatadas. Evita los ciclos a cambio de más iteraciones.
+    """
+
+    name = 'bland'
+    lowest_index_ties = True
+
+    def select(self, tableau: np.ndarray) -> int:
+        """
+        Elegir la columna entrante de menor índice
+
+        Args:
+            tableau: Tableau actual
+
+        Returns:
+            Índice de la columna o -1 si el tableau es óptimo
+        """
+        candidates = np.flatnonzero(tableau[-1, :-1] < -self.tolerance)
+        if len(candidates) == 0:
+            self.columns_scanned += tableau.shape[1] - 1
+            return -1
+        self.columns_scanned += int(candidates[0]) + 1
+        return int(candidates[0])
+
+
+class DevexPricing(PricingRule):
+    """
+    Precios Devex (Forrest-Goldfarb): aproxima la norma de cada arista con
+    pesos de referencia que se actualizan con la fila pivote y elige la
+    columna con mayor d_j^2 / w_j.
+    """
+
+    name = 'devex'
+
+    def reset(self, tableau: np.ndarray, basic_vars: List[int]):
+        """
+        Reiniciar el marco de referencia con todos los pesos en 1
+
+        Args:
+            tableau: Tableau inicial de la fase
+            basic_vars: Variables básicas por fila
+        """
+        super().reset(tableau, basic_vars)
+        self.weights = np.ones(tableau.shape[1] - 1)
+
+    def select(self, tableau: np.ndarray) -> int:
+        """
+        Elegir la columna con mayor costo reducido normalizado
+
+        Args:
+            tableau: Tableau actual
+
+        Returns:
+            Índice de la columna o -1 si el tableau es óptimo
+        """
+        z_row = tableau[-1, :-1]
+        self.columns_scanned += len(z_row)
+        negative = z_row < -self.tolerance
+        if not np.any(negative):
+            return -1
+        scores = np.where(negative, z_row * z_row / self.weights, -1.0)
+        return int(np.argmax(scores))
+
+    def update(self, tableau: np.ndarray, basic_vars: List[int], pivot_row: int, pivot_col: int):
+        """
+        Actualizar los pesos de referencia con la fila pivote
+
+        Args:
+            tableau: Tableau antes del pivoteo
+            basic_vars: Variables básicas antes del pivoteo
+            pivot_row: Fila pivote
+            pivot_col: Columna pivote
+        """
+        ratios = tableau[pivot_row, :-1] / tableau[pivot_row, pivot_col]
+        weight_q = self.weights[pivot_col]
+        np.maximum(self.weights, ratios * ratios * weight_q, out=self.weights)
+        leaving = basic_vars[pivot_row]
+        self.weights[leaving] = max(weight_q / tableau[pivot_row, pivot_col] ** 2, 1.0)
+        self.weights[pivot_col] = 1.0
+
+
+class SteepestEdgePricing(PricingRule):
+    """
+    Arista más pronunciada: elige la columna con mayor d_j^2 / gamma_j, con
+    gamma_j = 1 + ||B^-1 a_j||^2. Los pesos se calculan exactos al inicio y
+    se actualizan en cada pivoteo con la fórmula de Goldfarb-Reid, que en
+    el tableau solo necesita un producto de la columna pivote por el tableau.
+    """
+
+    name = 'steepest_edge'
+
+    def reset(self, tableau: np.ndarray, basic_vars: List[int]):
+        """
+        Calcular los pesos exactos de la base inicial
+
+        Args:
+            tableau: Tableau inicial de la fase
+            basic_vars: Variables básicas por fila
+        """
+        super().reset(tableau, basic_vars)
+        body = tableau[:-1, :-1]
+        self.weights = 1.0 + np.einsum('ij,ij->j', body, body)
+
+    def select(self, tableau: np.ndarray) -> int:
+        """
+        Elegir la columna con mayor costo reducido por unidad de arista
+
+        Args:
+            tableau: Tableau actual
+
+        Returns:
+            Índice de la columna o -1 si el tableau es óptimo
+        """
+        z_row = tableau[-1, :-1]
+        self.columns_scanned += len(z_row)
+        negative = z_row < -self.tolerance
+        if not np.any(negative):
+            return -1
+        scores = np.where(negative, z_row * z_row / self.weights, -1.0)
+        return int(np.argmax(scores))
+
+    def update(self, tableau: np.ndarray, basic_vars: List[int], pivot_row: int, pivot_col: int):
+        """
+        Actualizar los pesos con la fórmula de Goldfarb-Reid
+
+        Args:
+            tableau: Tableau antes del pivoteo
+            basic_vars: Variables básicas antes del pivoteo
+            pivot_row: Fila pivote
+            pivot_col: Columna pivote
+        """
+        body = tableau[:-1, :-1]
+        alpha_q = body[:, pivot_col]
+        ratios = body[pivot_row] / alpha_q[pivot_row]
+        cross = alpha_q @ body
+        weight_q = self.weights[pivot_col]
+
+        new_weights = self.weights - 2.0 * ratios * cross + ratios * ratios * weight_q
+        np.maximum(new_weights, 1.0 + ratios * ratios, out=self.weights)
+        self.weights[basic_vars[pivot_row]] = max(weight_q / alpha_q[pivot_row] ** 2, 1.0)
+        self.weights[pivot_col] = 1.0
+
+
+class PartialPricing(PricingRule):
+    """
+    Precios parciales por bloques de columnas: se busca el costo reducido
+    más negativo solo dentro del bloque actual y se pasa al siguiente
+    bloque cuando no hay candidatos. Con candidates > 1 (precios múltiples)
+    se guardan las mejores columnas del bloque y se reutilizan mientras
+    sigan siendo atractivas, sin volver a revisar el bloque.
+    """
+
+    name = 'partial'
+
+    def __init__(self, tolerance: float = 1e-10, block_size: int = 0, candidates: int = 1):
+        """
+        Inicializar la regla
+
+        Args:
+            tolerance: Costo reducido mínimo (en valor absoluto) para entrar
+            block_size: Columnas por bloque (0 = automático, max(32, sqrt(n)))
+            candidates: Columnas guardadas por revisión (precios múltiples)
+        """
+        super().__init__(tolerance)
+        self.block_size = block_size
+        self.candidates = max(1, candidates)
+
+    def reset(self, tableau: np.ndarray, basic_vars: List[int]):
+        """
+        Empezar por el primer bloque
+
+        Args:
+            tableau: Tableau inicial de la fase
+            basic_vars: Variables básicas por fila
+        """
+        super().reset(tableau, basic_vars)
+        n_cols = tableau.shape[1] - 1
+        self._block = self.block_size or max(32, int(np.sqrt(n_cols)))
+        self._start = 0
+        self._queue = []
+
+    def select(self, tableau: np.ndarray) -> int:
+        """
+        Elegir la columna entrante revisando un bloque a la vez
+
+        Args:
+            tableau: Tableau actual
+
+        Returns:
+            Índice de la columna o -1 si ningún bloque tiene candidatos
+        """
+        z_row = tableau[-1, :-1]
+
+        # Candidatos guardados de la revisión anterior
+        while self._queue:
+            col = self._queue.pop(0)
+            self.columns_scanned += 1
+            if z_row[col] < -self.tolerance:
+                return col
+
+        n_cols = len(z_row)
+        for _ in range(0, n_cols, self._block):
+            start = self._start
+            end = min(start + self._block, n_cols)
+            block = z_row[start:end]
+            self.columns_scanned += len(block)
+            self._start = 0 if end >= n_cols else end
+
+            negative = np.flatnonzero(block < -self.tolerance)
+            if len(negative) > 0:
+                best = negative[np.argsort(block[negative], kind='stable')[:self.candidates]]
+                self._queue = [int(col) + start for col in best[1:]]
+                return int(best[0]) + start
+        return -1
+
+
+PRICING_RULES = {
+    'dantzig': PricingRule,
+    'bland': BlandPricing,
+    'devex': DevexPricing,
+    'steepest_edge': SteepestEdgePricing,
+    'partial': PartialPricing
+}
+
+
+def make_pricing(pricing) -> PricingRule:
+    """
+    Obtener una regla de precios a partir de su nombre
+
+    Args:
+        pricing: Nombre de la regla ('dantzig', 'bland', 'devex',
+            'steepest_edge' o 'partial') o una instancia de PricingRule
+
+    Returns:
+        Instancia de la regla
+    """
+    if isinstance(pricing, PricingRule):
+        return pricing
+    if pricing not in PRICING_RULES:
+        raise ValueError(f"Regla de precios no válida: {pricing}. Opciones: {', '.join(PRICING_RULES)}")
+    return PRICING_RULES[pricing]()
+
+
+def pricing_stats(rule: PricingRule, iterations: int, elapsed: float) -> Dict:
+    """
+    Resumir el costo de una regla de precios en un ciclo de pivoteos
+
+    Args:
+        rule: Regla usada
+        iterations: Iteraciones del Simplex primal
+        elapsed: Tiempo total del ciclo en segundos
+
+    Returns:
+        Diccionario con la regla, iteraciones, columnas revisadas y tiempos
+    """
+    per_iteration = elapsed / iterations if iterations else 0.0
+    return {
+        'rule': rule.name,
+        'iterations': iterations,
+        'columns_scanned': rule.columns_scanned,
+        'time': elapsed,
+        'time_per_iteration': per_iteration
+    }
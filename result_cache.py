@@ -0,0 +1,452 @@
+import hashlib
+import hmac
+import importlib
+import os
+import pickle
+import re
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple, Union
+import numpy as np
+from sparse_matrix import SparseMatrix
+from simplex_solver import SimplexSolver
+from iteration_history import IterationHistory
+from solve_control import STOP_STATUSES
+
+# Formato de las entradas; cambiarlo invalida todo lo guardado en disco
+CACHE_FORMAT = 1
+
+# Módulos cuyo código determina el resultado de una resolución
+SOLVER_MODULES = ('simplex_solver', 'pricing', 'iteration_history', 'presolve', 'scaling',
+                  'basis_io', 'revised_simplex', 'interior_point', 'exact_simplex',
+                  'sparse_matrix', 'solver_registry')
+
+# Nombre de los archivos de la caché: solo se leen o borran los que lo cumplen
+FILE_PREFIX = 'simplexcache'
+FILE_PATTERN = re.compile(rf'^{FILE_PREFIX}-([0-9a-f]{{16}})-([0-9a-f]{{64}})\.pkl(?:\.\d+\.tmp)?$')
+
+# Segundos sin cambios tras los que un temporal se considera abandonado (uno
+# más nuevo puede ser la escritura en curso de otro proceso)
+TEMP_FILE_GRACE = 600
+
+# Clave por usuario para firmar las entradas en disco (fuera de la carpeta
+# de la caché, para que quien pueda escribir ahí no pueda falsificarlas)
+SECRET_FILE = os.path.join(os.path.expanduser('~'), '.simplex_result_cache.key')
+
+# Opciones que no cambian el resultado y no forman parte de la clave
+IGNORED_OPTIONS = ('cancel_token', 'progress', 'progress_interval', 'time_limit')
+
+_fingerprint = None
+
+
+def solver_fingerprint() -> str:
+    """
+    Huella del código de los solvers
+
+    Es el hash del código fuente de SOLVER_MODULES, así cualquier cambio
+    en los solvers cambia las claves y las entradas viejas dejan de usarse.
+
+    Returns:
+        Hash hexadecimal (se calcula una sola vez por proceso)
+    """
+    global _fingerprint
+    if _fingerprint is None:
+        digest = hashlib.sha256(f'format={CACHE_FORMAT}'.encode())
+        for name in SOLVER_MODULES:
+            path = getattr(importlib.import_module(name), '__file__', None)
+            digest.update(name.encode())
+            if path is not None and os.path.exists(path):
+                with open(path, 'rb') as f:
+                    digest.update(f.read())
+        _fingerprint = digest.hexdigest()[:16]
+    return _fingerprint
+
+
+def _default_secret() -> bytes:
+    """
+    Leer (o crear) la clave de firma del usuario
+
+    Returns:
+        32 bytes aleatorios guardados en SECRET_FILE con permisos 0600
+    """
+    try:
+        with open(SECRET_FILE, 'rb') as f:
+            secret = f.read()
+        if len(secret) >= 32:
+            return secret
+    except OSError:
+        pass
+    secret = secrets.token_bytes(32)
+    descriptor = os.open(SECRET_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(descriptor, 'wb') as f:
+        f.write(secret)
+    return secret
+
+
+def _remove_file(path: str):
+    """Borrar un archivo si todavía existe"""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _update_digest(digest, value):
+    """
+    Agregar un valor al hash en forma canónica
+
+    Args:
+        digest: Objeto de hashlib
+        value: Arreglo, número, texto, None o contenedor de ellos
+
+    Raises:
+        TypeError: Si el valor no tiene una forma canónica (por ejemplo,
+            una instancia de PricingRule con estado propio)
+    """
+    if value is None or isinstance(value, (bool, str)):
+        digest.update(f'{type(value).__name__}:{value};'.encode())
+    elif isinstance(value, (int, float, np.integer, np.floating)):
+        # 0.0 y -0.0, y 2 y 2.0, dan la misma clave
+        digest.update(f'num:{float(value) + 0.0!r};'.encode())
+    elif isinstance(value, SparseMatrix):
+        digest.update(f'sparse:{value.shape};'.encode())
+        for array in (value.indptr, value.indices, value.data + 0.0):
+            _update_digest(digest, array)
+    elif isinstance(value, np.ndarray):
+        array = np.ascontiguousarray(value, dtype=float) + 0.0
+        digest.update(f'array:{array.shape};'.encode())
+        digest.update(array.tobytes())
+    elif isinstance(value, (list, tuple)):
+        if value and all(isinstance(v, (int, float, np.integer, np.floating)) for v in value):
+            _update_digest(digest, np.asarray(value, dtype=float))
+            return
+        digest.update(f'seq:{len(value)};'.encode())
+        for item in value:
+            _update_digest(digest, item)
+    elif isinstance(value, dict):
+        digest.update(f'dict:{len(value)};'.encode())
+        for k in sorted(value, key=str):
+            digest.update(f'{k}='.encode())
+            _update_digest(digest, value[k])
+    elif isinstance(value, type) or isinstance(value, np.dtype):
+        digest.update(f'dtype:{np.dtype(value).name};'.encode())
+    else:
+        raise TypeError(f'Valor sin forma canónica: {type(value).__name__}')
+
+
+def cache_key(c: np.ndarray, A, b: np.ndarray,
+              lower: Optional[np.ndarray] = None, upper: Optional[np.ndarray] = None,
+              sense: str = 'max', options: Optional[Dict] = None,
+              solver: str = 'tableau') -> Optional[str]:
+    """
+    Calcular la clave canónica de un problema
+
+    Args:
+        c: Coeficientes de la función objetivo
+        A: Matriz de restricciones (densa o SparseMatrix)
+        b: Lado derecho
+        lower: Cotas inferiores (None equivale a 0)
+        upper: Cotas superiores (None equivale a infinito)
+        sense: 'max' o 'min'
+        options: Opciones de la resolución (pricing, history, ...)
+        solver: Nombre del motor que resuelve
+
+    Returns:
+        Hash hexadecimal, o None si alguna opción no puede hashearse (el
+        problema se resuelve sin caché)
+    """
+    c = np.asarray(c, dtype=float)
+    n_vars = len(c)
+    lower = np.zeros(n_vars) if lower is None else np.maximum(np.asarray(lower, dtype=float), 0.0)
+    upper = np.full(n_vars, np.inf) if upper is None else np.asarray(upper, dtype=float)
+    options = {k: v for k, v in (options or {}).items() if k not in IGNORED_OPTIONS}
+    if isinstance(options.get('initial_basis'), (str, os.PathLike)):
+        from basis_io import load_basis
+        options['initial_basis'] = load_basis(options['initial_basis'])
+
+    digest = hashlib.sha256(f'{solver_fingerprint()};{sense};{solver};'.encode())
+    try:
+        for value in (c, A if isinstance(A, SparseMatrix) else np.asarray(A, dtype=float),
+                      np.asarray(b, dtype=float), lower, upper, options):
+            _update_digest(digest, value)
+    except TypeError:
+        return None
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Caché de resultados con direcciones por contenido.
+
+    La clave es el hash canónico de (c, A, b, cotas, sentido, opciones,
+    motor) y de la huella del código de los solvers; los archivos en disco
+    de otra versión se borran al abrir la carpeta. Tiene dos niveles: uno en
+    memoria con reemplazo LRU y uno opcional en disco (un archivo por
+    entrada); ambos se limitan por tamaño en bytes y, al pasarse, se
+    descartan las entradas usadas hace más tiempo.
+
+    En disco solo se tocan los archivos con nombre
+    simplexcache-<huella>-<clave>.pkl, así la carpeta puede compartirse con
+    otros datos. Cada archivo lleva una firma HMAC-SHA256 que se verifica
+    antes de deserializarlo; un archivo con firma inválida se descarta.
+
+    No se guardan los resultados con error ni los de resoluciones
+    canceladas o detenidas por tiempo. En disco el historial se guarda solo
+    como resumen de pivoteos (sin tableaus), para que las instantáneas no
+    se coman el límite de bytes; en memoria se guarda completo. Los
+    resultados se devuelven como copias, así modificarlos no altera la
+    caché.
+    """
+
+    def __init__(self, max_entries: int = 128, max_bytes: int = 64 * 2**20,
+                 directory: Optional[Union[str, os.PathLike]] = None,
+                 max_disk_bytes: int = 256 * 2**20, secret: Optional[bytes] = None):
+        """
+        Crear la caché
+
+        Args:
+            max_entries: Entradas máximas en memoria
+            max_bytes: Bytes máximos en memoria (tamaño serializado)
+            directory: Carpeta del nivel en disco (None para no usarlo)
+            max_disk_bytes: Bytes máximos en disco
+            secret: Clave para firmar las entradas en disco (por defecto la
+                del usuario en SECRET_FILE)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.directory = None if directory is None else os.fspath(directory)
+        self.max_disk_bytes = max_disk_bytes
+        self._memory: 'OrderedDict[str, Tuple[bytes, int]]' = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        # Índice de las entradas en disco (clave -> bytes), del uso más viejo
+        # al más reciente; se llena una vez y se mantiene al escribir y borrar
+        self._disk: 'OrderedDict[str, int]' = OrderedDict()
+        self._disk_bytes = 0
+        self._secret = None
+        if self.directory is not None:
+            self._secret = secret if secret is not None else _default_secret()
+            os.makedirs(self.directory, exist_ok=True)
+            self._load_index()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Buscar un resultado
+
+        Args:
+            key: Clave de cache_key
+
+        Returns:
+            Copia del resultado o None si no está
+        """
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return pickle.loads(entry[0])
+            payload = self._read_disk(key)
+            if payload is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            self._store_memory(key, payload)
+            return pickle.loads(payload)
+
+    def put(self, key: str, result: Dict):
+        """
+        Guardar un resultado (si corresponde guardarlo)
+
+        Args:
+            key: Clave de cache_key
+            result: Resultado del solver
+        """
+        if result.get('status') == 'error' or result.get('status') in STOP_STATUSES:
+            return
+        payload = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        disk_payload = payload
+        history = result.get('iterations')
+        if self.directory is not None and isinstance(history, IterationHistory):
+            disk_payload = pickle.dumps(dict(result, iterations=history.summary_copy()),
+                                        protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._store_memory(key, payload)
+            self._write_disk(key, disk_payload)
+
+    def solve(self, c: np.ndarray, A, b: np.ndarray,
+              lower: Optional[np.ndarray] = None, upper: Optional[np.ndarray] = None,
+              sense: str = 'max', solver: str = 'tableau', solve_fn=None, **options) -> Dict:
+        """
+        Resolver a través de la caché
+
+        Args:
+            c: Coeficientes de la función objetivo
+            A: Matriz de restricciones
+            b: Lado derecho
+            lower: Cotas inferiores
+            upper: Cotas superiores
+            sense: Sentido del problema que representa (solo forma parte de
+                la clave; solve_fn siempre maximiza)
+            solver: Nombre del motor (forma parte de la clave)
+            solve_fn: Función solve(c, A, b, lower, upper, **options); por
+                defecto SimplexSolver().solve
+            **options: Opciones para solve_fn
+
+        Returns:
+            Resultado de solve_fn con 'cache': {'hit', 'key'}
+        """
+        key = cache_key(c, A, b, lower, upper, sense, options, solver)
+        result = None if key is None else self.get(key)
+        hit = result is not None
+        if not hit:
+            if solve_fn is None:
+                solve_fn = SimplexSolver().solve
+            result = solve_fn(c, A, b, lower, upper, **options)
+            if key is not None:
+                self.put(key, result)
+        result['cache'] = {'hit': hit, 'key': key}
+        return result
+
+    def clear(self, disk: bool = True):
+        """
+        Vaciar la caché
+
+        Args:
+            disk: Borrar también las entradas en disco
+        """
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            if disk and self.directory is not None:
+                for key in list(self._disk):
+                    self._remove_disk(key)
+
+    @property
+    def stats(self) -> Dict:
+        """Contadores de aciertos y fallos y ocupación de cada nivel"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'entries': len(self._memory),
+                'bytes': self._memory_bytes,
+                'disk_entries': len(self._disk),
+                'disk_bytes': self._disk_bytes,
+                'version': solver_fingerprint()
+            }
+
+    def _store_memory(self, key: str, payload: bytes):
+        """Guardar en memoria y descartar las entradas LRU que sobren"""
+        if len(payload) > self.max_bytes:
+            return
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_bytes -= old[1]
+        self._memory[key] = (payload, len(payload))
+        self._memory_bytes += len(payload)
+        while len(self._memory) > self.max_entries or self._memory_bytes > self.max_bytes:
+            _, (_, size) = self._memory.popitem(last=False)
+            self._memory_bytes -= size
+
+    def _path(self, key: str) -> str:
+        """Archivo de una entrada en disco"""
+        return os.path.join(self.directory, f'{FILE_PREFIX}-{solver_fingerprint()}-{key}.pkl')
+
+    def _signature(self, payload: bytes) -> bytes:
+        """Firma HMAC-SHA256 de una entrada"""
+        return hmac.new(self._secret, payload, hashlib.sha256).digest()
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        """Leer una entrada del disco, verificar su firma y marcarla como usada"""
+        if self.directory is None or key not in self._disk:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)
+        except OSError:
+            self._forget_disk(key)
+            return None
+        signature, payload = data[:32], data[32:]
+        if not hmac.compare_digest(signature, self._signature(payload)):
+            self._remove_disk(key)
+            return None
+        self._disk.move_to_end(key)
+        return payload
+
+    def _write_disk(self, key: str, payload: bytes):
+        """Escribir una entrada en disco y descartar las más viejas que sobren"""
+        if self.directory is None:
+            return
+        data = self._signature(payload) + payload
+        if len(data) > self.max_disk_bytes:
+            return
+        path = self._path(key)
+        temporary = f'{path}.{os.getpid()}.tmp'
+        try:
+            with open(temporary, 'wb') as f:
+                f.write(data)
+            os.replace(temporary, path)
+        except OSError:
+            return
+        self._forget_disk(key)
+        self._disk[key] = len(data)
+        self._disk_bytes += len(data)
+        while self._disk_bytes > self.max_disk_bytes:
+            self._remove_disk(next(iter(self._disk)))
+
+    def _remove_disk(self, key: str):
+        """Borrar una entrada del disco y del índice"""
+        _remove_file(self._path(key))
+        self._forget_disk(key)
+
+    def _forget_disk(self, key: str):
+        """Quitar una entrada del índice del disco"""
+        size = self._disk.pop(key, None)
+        if size is not None:
+            self._disk_bytes -= size
+
+    def _load_index(self):
+        """
+        Armar el índice del disco con los archivos propios de la caché
+
+        Los archivos de otra versión de los solvers y los temporales sin
+        cambios hace más de TEMP_FILE_GRACE segundos se borran; los
+        temporales más nuevos pueden ser escrituras en curso de otro proceso
+        y se dejan. Los demás archivos de la carpeta no se tocan, y los que
+        otro proceso borre mientras se recorre la carpeta se saltan.
+        """
+        version = solver_fingerprint()
+        now = time.time()
+        entries = []
+        for name in os.listdir(self.directory):
+            match = FILE_PATTERN.match(name)
+            if match is None:
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            if name.endswith('.tmp'):
+                # Puede ser la escritura en curso de otro proceso
+                if now - stat.st_mtime > TEMP_FILE_GRACE:
+                    _remove_file(path)
+                continue
+            if match.group(1) != version:
+                _remove_file(path)
+                continue
+            entries.append((stat.st_mtime, match.group(2), stat.st_size))
+        for _, key, size in sorted(entries):
+            self._disk[key] = size
+            self._disk_bytes += size
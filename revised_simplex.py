@@ -0,0 +1,631 @@
+import os
+import numpy as np
+from typing import List, Dict, Tuple, Optional
+from simplex_solver import SimplexSolver, TOLERANCES
+from sparse_matrix import SparseMatrix
+from iteration_history import IterationHistory
+from pricing import BlandPricing
+from solve_control import STOP_STATUSES, STOP_MESSAGES, make_control
+from basis_io import load_basis
+
+
+class ProductFormInverse:
+    """
+    Representación de la inversa de la base en forma producto (PFI).
+
+    La inversa se guarda como una secuencia de matrices eta dispersas
+    sobre una base refactorizada: B^-1 = E_k ... E_2 E_1 B0^-1. Cada
+    pivoteo agrega una matriz eta y cada cierto número de pivoteos se
+    refactoriza desde cero para limitar el crecimiento del archivo eta y
+    el error numérico acumulado. B0 es la identidad o, con set_base, la
+    identidad con algunas columnas reemplazadas por columnas de A.
+    """
+
+    def __init__(self, n_rows: int, tolerance: float = 1e-10):
+        """
+        Inicializar la factorización con la base identidad (holguras)
+
+        Args:
+            n_rows: Número de filas de la base
+            tolerance: Tolerancia para descartar valores casi cero
+        """
+        self.n_rows = n_rows
+        self.tolerance = tolerance
+        self.etas = []
+        self.base = None
+
+    def reset(self):
+        """Volver a la base identidad"""
+        self.etas = []
+        self.base = None
+
+    def set_base(self, rows: np.ndarray, columns: np.ndarray) -> bool:
+        """
+        Tomar como B0 la identidad con las columnas dadas en las filas rows
+
+        Las columnas unitarias no necesitan factorizarse: B0·x = v se
+        reduce al bloque k x k de las columnas en las filas rows, que se
+        invierte en forma densa, y las demás filas se despejan restando
+        ese bloque ya resuelto.
+
+        Args:
+            rows: Filas (ordenadas) que ocupan las columnas, una por columna
+            columns: Columnas densas (m x k)
+
+        Returns:
+            True si el bloque es invertible; si no, la factorización no cambia
+        """
+        block = columns[rows]
+        try:
+            inverse = np.linalg.inv(block)
+        except np.linalg.LinAlgError:
+            return False
+        probe = np.linspace(1.0, 2.0, len(rows))
+        residual = block @ (inverse @ probe) - probe
+        if not np.all(np.isfinite(inverse)) or np.linalg.norm(residual) > 1e-8 * np.linalg.norm(probe):
+            return False
+        others = np.ones(self.n_rows, dtype=bool)
+        others[rows] = False
+        others = np.flatnonzero(others)
+        self.etas = []
+        self.base = (rows, others, columns[others], inverse)
+        return True
+
+    def add_eta(self, pivot_row: int, alpha: np.ndarray):
+        """
+        Agregar la matriz eta correspondiente a un pivoteo
+
+        Args:
+            pivot_row: Fila pivote
+            alpha: Columna entrante ya transformada (B^-1 a_q)
+        """
+        pivot_val = alpha[pivot_row]
+        idx = np.flatnonzero(np.abs(alpha) > self.tolerance)
+        idx = idx[idx != pivot_row]
+        vals = -alpha[idx] / pivot_val
+        self.etas.append((pivot_row, idx, vals, 1.0 / pivot_val))
+
+    def ftran(self, v: np.ndarray) -> np.ndarray:
+        """
+        Calcular B^-1 v aplicando las etas en orden
+
+        Args:
+            v: Vector denso de tamaño m (no se modifica)
+
+        Returns:
+            Vector B^-1 v
+        """
+        v = v.astype(float, copy=True)
+        if self.base is not None:
+            rows, others, coupling, inverse = self.base
+            x_rows = inverse @ v[rows]
+            v[others] -= coupling @ x_rows
+            v[rows] = x_rows
+        for r, idx, vals, eta_r in self.etas:
+            v_r = v[r]
+            if v_r != 0.0:
+                v[idx] += vals * v_r
+                v[r] = eta_r * v_r
+        return v
+
+    def btran(self, v: np.ndarray) -> np.ndarray:
+        """
+        Calcular v^T B^-1 aplicando las etas en orden inverso
+
+        Args:
+            v: Vector denso de tamaño m (no se modifica)
+
+        Returns:
+            Vector v^T B^-1
+        """
+        v = v.astype(float, copy=True)
+        for r, idx, vals, eta_r in reversed(self.etas):
+            v[r] = v[idx] @ vals + v[r] * eta_r
+        if self.base is not None:
+            rows, others, coupling, inverse = self.base
+            v[rows] = inverse.T @ (v[rows] - coupling.T @ v[others])
+        return v
+
+
+class RevisedSimplexSolver(SimplexSolver):
+    """
+    Método Simplex revisado con la base factorizada en forma producto.
+
+    En lugar de actualizar el tableau completo de (m+1) x (n+m+1) en cada
+    pivoteo, solo se mantiene la factorización de la base, los valores de
+    las variables básicas y se calculan los costos reducidos a partir de
+    los multiplicadores simplex. Las variables de holgura son implícitas:
+    nunca se construye la matriz identidad.
+
+    La matriz de restricciones puede ser densa o una SparseMatrix; en el
+    segundo caso el cálculo de precios y la extracción de columnas solo
+    recorren los elementos distintos de cero.
+
+    Acepta los mismos datos que SimplexSolver.solve: las variables no
+    básicas están en su cota inferior o superior, y una base infactible
+    (lados derechos negativos o una base de partida) se corrige con una
+    fase 1 que minimiza la suma de las infactibilidades de las variables
+    básicas. Devuelve el mismo diccionario de resultado, por lo que
+    solve_from_text y la interfaz gráfica siguen funcionando.
+    """
+
+    sparse_input = True
+
+    def __init__(self, refactor_interval: Optional[int] = None,
+                 dense_refactor_limit: int = 3000):
+        """
+        Inicializar el solver Simplex revisado
+
+        Args:
+            refactor_interval: Número de pivoteos entre refactorizaciones;
+                None lo ajusta al tamaño de la base (ver _refactor_interval)
+            dense_refactor_limit: Máximo de columnas estructurales básicas
+                para refactorizar con la inversa densa de su bloque (usa
+                m·k + k·k números); con más se arma la forma producto
+                columna por columna
+        """
+        super().__init__()
+        self.refactor_interval = refactor_interval
+        self.dense_refactor_limit = dense_refactor_limit
+        self.tolerance = 1e-10
+        self.basic_vars = []
+        self.refactorizations = 0
+
+    def _get_column(self, A, var_idx: int) -> np.ndarray:
+        """
+        Obtener la columna de [A | I] de una variable (estructural u holgura)
+
+        Args:
+            A: Matriz de restricciones (densa o SparseMatrix)
+            var_idx: Índice de la variable
+
+        Returns:
+            Columna densa de tamaño m
+        """
+        n_constraints, n_vars = A.shape
+        if var_idx < n_vars:
+            if isinstance(A, SparseMatrix):
+                return A.column_dense(var_idx)
+            return A[:, var_idx]
+        col = np.zeros(n_constraints)
+        col[var_idx - n_vars] = 1.0
+        return col
+
+    def _refactor_interval(self, factor: ProductFormInverse) -> int:
+        """
+        Pivoteos hasta la próxima refactorización
+
+        Refactorizar con la inversa densa cuesta del orden de k^3 (k
+        columnas estructurales básicas) y cada eta acumulada agrega un
+        costo casi fijo a cada ftran y btran, así que el intervalo que
+        minimiza el costo total crece como k^1.5. Las constantes salen de
+        benchmark_simplex.py --revised: unos 200 pivoteos con k = 1000.
+
+        Args:
+            factor: Factorización recién reconstruida
+
+        Returns:
+            refactor_interval si se fijó; si no, entre 32 y 512 según k
+            (64 si la base es la identidad o se armó columna por columna)
+        """
+        if self.refactor_interval is not None:
+            return self.refactor_interval
+        if factor.base is None:
+            return 64
+        k = len(factor.base[0])
+        return int(np.clip(200 * (k / 1000) ** 1.5, 32, 512))
+
+    def _refactorize(self, factor: ProductFormInverse, A,
+                     basic_vars: List[int]) -> List[int]:
+        """
+        Reconstruir la forma producto de la inversa desde la base actual
+
+        Las holguras básicas se quedan en su propia fila sin generar etas.
+        Si la base está completa y tiene a lo sumo dense_refactor_limit
+        columnas estructurales, esas columnas ocupan las filas sin holgura
+        básica y B0 se factoriza con la inversa densa de su bloque
+        (ProductFormInverse.set_base): una sola operación de BLAS en lugar
+        de un ftran por columna sobre un archivo eta que crece. En otro
+        caso, o si el bloque es singular, las columnas estructurales se
+        pivotean en las filas libres eligiendo el mayor elemento en valor
+        absoluto, y una columna dependiente se reemplaza por la holgura de
+        una fila libre.
+
+        Args:
+            factor: Factorización a reconstruir
+            A: Matriz de restricciones (densa o SparseMatrix)
+            basic_vars: Variables básicas actuales
+
+        Returns:
+            Nueva lista de variables básicas (ordenadas por fila)
+        """
+        n_constraints, n_vars = A.shape
+        factor.reset()
+        self.refactorizations += 1
+
+        new_basic = [-1] * n_constraints
+        assigned = np.zeros(n_constraints, dtype=bool)
+        structural = []
+
+        for var_idx in basic_vars:
+            if var_idx >= n_vars:
+                row = var_idx - n_vars
+                new_basic[row] = var_idx
+                assigned[row] = True
+            else:
+                structural.append(var_idx)
+
+        rows = np.flatnonzero(~assigned)
+        if structural and len(structural) == len(rows) <= self.dense_refactor_limit:
+            columns = np.column_stack([self._get_column(A, var_idx) for var_idx in structural])
+            if factor.set_base(rows, columns):
+                for row, var_idx in zip(rows, structural):
+                    new_basic[row] = var_idx
+                return new_basic
+
+        for var_idx in structural:
+            alpha = factor.ftran(self._get_column(A, var_idx))
+            candidates = np.where(assigned, 0.0, np.abs(alpha))
+            row = int(np.argmax(candidates))
+            if candidates[row] <= self.tolerance:
+                # Columna dependiente: se deja fuera de la base
+                continue
+            factor.add_eta(row, alpha)
+            assigned[row] = True
+            new_basic[row] = var_idx
+
+        # Completar filas sin asignar con su holgura
+        for row in np.flatnonzero(~assigned):
+            new_basic[row] = n_vars + int(row)
+
+        return new_basic
+
+    def solve(self, c: np.ndarray, A, b: np.ndarray,
+              lower: Optional[np.ndarray] = None, upper: Optional[np.ndarray] = None,
+              history: str = 'summary', history_size: int = 10,
+              pricing='dantzig', anti_cycling: str = 'perturbation',
+              max_iterations: Optional[int] = None, dtype=np.float64,
+              cancel_token=None, time_limit: Optional[float] = None,
+              progress=None, progress_interval: float = 0.5,
+              initial_basis=None, n_threads: Optional[int] = None) -> Dict:
+        """
+        Resolver el problema usando el método Simplex revisado
+
+        Mientras alguna variable básica esté fuera de sus cotas se hace la
+        fase 1: los costos valen +1 en las básicas por debajo de su cota
+        inferior, -1 en las que superan la superior y 0 en las demás, y la
+        prueba del cociente detiene el paso cuando una básica llega a una
+        cota (una infactible se detiene al volverse factible). Si ninguna
+        columna reduce la infactibilidad el problema es infactible. Luego
+        sigue la fase 2 con los costos originales.
+
+        Los empates de la prueba del cociente en un paso degenerado se
+        resuelven por el menor índice de variable básica. Como en
+        SimplexSolver, en los pasos degenerados se guarda un hash de cada
+        base; si una base se repite se pasa a la regla de Bland (entra la
+        columna de menor índice), que no cicla.
+
+        Args:
+            c: Coeficientes de la función objetivo
+            A: Matriz de restricciones (densa o SparseMatrix)
+            b: Valores del lado derecho (pueden ser negativos)
+            lower: Cotas inferiores de las variables (por defecto 0)
+            upper: Cotas superiores de las variables (por defecto infinito)
+            history: Modo del historial ('none' o 'summary'); como este método
+                no mantiene tableau, 'ring', 'full' y 'replay' guardan solo el
+                resumen
+            history_size: Se acepta por compatibilidad con SimplexSolver.solve
+            pricing: 'bland' elige la columna de menor índice; las demás
+                reglas de SimplexSolver.solve usan Dantzig, porque sin
+                tableau no hay pesos que actualizar
+            anti_cycling: 'none' desactiva el cambio a Bland; cualquier otro
+                valor de SimplexSolver.solve ('perturbation',
+                'lexicographic') usa Bland, porque sin tableau no se puede
+                perturbar ni comparar filas
+            max_iterations: Límite de pivoteos (por defecto escala con m + n)
+            dtype: Se acepta por compatibilidad; el método revisado trabaja
+                siempre en float64
+            cancel_token: CancellationToken (igual que en SimplexSolver.solve)
+            time_limit: Segundos de reloj disponibles
+            progress: Callback de progreso (igual que en SimplexSolver.solve)
+            progress_interval: Segundos mínimos entre reportes
+            initial_basis: Base de partida (igual que en SimplexSolver.solve);
+                las columnas dependientes se reemplazan por holguras al
+                refactorizar y la fase 1 recupera la factibilidad. El resumen
+                queda en result['warm_start']
+            n_threads: Se acepta por compatibilidad (no hay pivoteo de filas)
+
+        Returns:
+            Diccionario con la solución (mismo formato que SimplexSolver.solve)
+        """
+        if np.dtype(dtype) not in TOLERANCES:
+            raise ValueError(f"Tipo de dato no válido: {np.dtype(dtype)}. Opciones: float64, float32")
+        self._configure(pricing, anti_cycling)
+        control = make_control(cancel_token, time_limit, progress, progress_interval)
+        self.refactorizations = 0
+        self.degenerate_pivots = 0
+        self.cycling_detected = False
+        c = np.asarray(c, dtype=float)
+        if not isinstance(A, SparseMatrix):
+            A = np.atleast_2d(np.asarray(A, dtype=float)).reshape(len(b), len(c))
+        b = np.asarray(b, dtype=float)
+        n_vars = len(c)
+        n_constraints = len(b)
+        n_total = n_vars + n_constraints
+        tol = self.tolerance
+        feasibility_tol = 1e-9
+
+        self.variable_names = [f'x{i+1}' for i in range(n_vars)]
+        self.slack_variable_names = [f's{i+1}' for i in range(n_constraints)]
+        self.iterations = IterationHistory(self.variable_names + self.slack_variable_names,
+                                           history, history_size)
+
+        lower = np.zeros(n_vars) if lower is None else np.maximum(np.asarray(lower, dtype=float), 0.0)
+        upper = np.full(n_vars, np.inf) if upper is None else np.asarray(upper, dtype=float)
+        if np.any(lower > upper + 1e-10):
+            return {
+                'status': 'infeasible',
+                'message': 'Las cotas de alguna variable son contradictorias',
+                'iterations': self.iterations
+            }
+
+        # Cotas de todas las columnas (las holguras van de 0 a infinito)
+        lo = np.concatenate([lower, np.zeros(n_constraints)])
+        up = np.concatenate([np.maximum(upper, lower), np.full(n_constraints, np.inf)])
+        self.column_upper = up - lo
+        self.iterations.set_column_upper(self.column_upper)
+        fixed = self.column_upper <= tol
+
+        # Las no básicas en su cota superior se marcan como complementadas
+        self.complemented = np.zeros(n_total, dtype=bool)
+        complemented = self.complemented
+        factor = ProductFormInverse(n_constraints, tol)
+        basic_vars = list(range(n_vars, n_total))
+        warm_start = None
+        if initial_basis is not None:
+            if isinstance(initial_basis, (str, os.PathLike)):
+                initial_basis = load_basis(initial_basis)
+            requested, at_upper = self._map_basis(initial_basis, n_constraints)
+            complemented[at_upper] = True
+            basic_vars = self._refactorize(factor, A, requested)
+            accepted = len(set(basic_vars) & set(requested))
+            warm_start = {
+                'requested': len(initial_basis['basic_vars']),
+                'accepted': accepted,
+                'at_upper': len(at_upper),
+                'repaired': accepted < len(initial_basis['basic_vars'])
+            }
+        is_basic = np.zeros(n_total, dtype=bool)
+        is_basic[basic_vars] = True
+        complemented[is_basic] = False
+
+        # Valores de las no básicas (0 en las posiciones básicas)
+        x_nonbasic = np.where(complemented, up, lo)
+        x_nonbasic[is_basic] = 0.0
+        x_basic = factor.ftran(self._basic_rhs(A, b, x_nonbasic))
+        costs = np.concatenate([c, np.zeros(n_constraints)])
+
+        if max_iterations is None:
+            max_iterations = max(100, 10 * n_total)
+
+        iteration = 0
+        pivots_since_refactor = 0
+        refactor_interval = self._refactor_interval(factor)
+        status = None
+        z_value = float(costs @ x_nonbasic + costs[basic_vars] @ x_basic)
+        bland = isinstance(self._pricing, BlandPricing)
+        visited = set()
+        phase_one = False
+        self.iterations.record(None, basic_vars, complemented, 0, -1, -1, objective=z_value)
+
+        while iteration < max_iterations:
+            # Fase 1 mientras alguna básica esté fuera de sus cotas
+            lo_basic = lo[basic_vars]
+            up_basic = up[basic_vars]
+            below = x_basic < lo_basic - feasibility_tol
+            above = x_basic > up_basic + feasibility_tol
+            was_phase_one, phase_one = phase_one, bool(np.any(below) or np.any(above))
+            if was_phase_one and not phase_one:
+                self.iterations.record(None, basic_vars, complemented, iteration, -1, -1,
+                                       objective=z_value, phase_change=True)
+
+            if control is not None:
+                status = control.check(iteration, z_value)
+                if status is not None:
+                    break
+            if phase_one:
+                basic_costs = below.astype(float) - above.astype(float)
+            else:
+                basic_costs = costs[basic_vars]
+
+            # Multiplicadores simplex y costos reducidos (maximización)
+            y = factor.btran(basic_costs)
+            reduced = np.empty(n_total)
+            phase_costs = np.zeros(n_vars) if phase_one else c
+            if isinstance(A, SparseMatrix):
+                reduced[:n_vars] = phase_costs - A.rmatvec(y)
+            else:
+                reduced[:n_vars] = phase_costs - y @ A
+            reduced[n_vars:] = -y
+
+            # Una no básica mejora si sube desde su cota inferior con costo
+            # positivo o baja desde la superior con costo negativo
+            gain = np.where(complemented, -reduced, reduced)
+            gain[is_basic | fixed] = 0.0
+            if bland:
+                entering = np.flatnonzero(gain > tol)
+                pivot_col = int(entering[0]) if len(entering) else -1
+            else:
+                pivot_col = int(np.argmax(gain))
+                if gain[pivot_col] <= tol:
+                    pivot_col = -1
+            if pivot_col < 0:
+                status = 'infeasible' if phase_one else 'optimal'
+                if not phase_one:
+                    self.iterations.mark_last_optimal()
+                break
+
+            # Columna entrante transformada y variación de las básicas por
+            # unidad de paso
+            alpha = factor.ftran(self._get_column(A, pivot_col))
+            direction = -1.0 if complemented[pivot_col] else 1.0
+            delta = -direction * alpha
+
+            # Prueba del cociente con cotas: una básica factible se detiene
+            # en la cota hacia la que se mueve, una infactible al volverse
+            # factible y una que se aleja de su cota violada no limita
+            ratios = np.full(n_constraints, np.inf)
+            to_upper = np.zeros(n_constraints, dtype=bool)
+            feasible = ~(below | above)
+            falling = feasible & (delta < -tol)
+            ratios[falling] = (x_basic[falling] - lo_basic[falling]) / -delta[falling]
+            rising = feasible & (delta > tol) & np.isfinite(up_basic)
+            ratios[rising] = (up_basic[rising] - x_basic[rising]) / delta[rising]
+            to_upper[rising] = True
+            recovering = below & (delta > 0)
+            ratios[recovering] = (lo_basic[recovering] - x_basic[recovering]) / delta[recovering]
+            recovering = above & (delta < 0)
+            ratios[recovering] = (x_basic[recovering] - up_basic[recovering]) / -delta[recovering]
+            to_upper[recovering] = True
+            np.maximum(ratios, 0.0, out=ratios)
+
+            pivot_row = int(np.argmin(ratios))
+            theta = ratios[pivot_row]
+            if theta <= tol:
+                # Paso degenerado: entre las filas empatadas sale la
+                # variable básica de menor índice
+                tied = np.flatnonzero(ratios <= theta + tol)
+                pivot_row = int(min(tied, key=lambda row: basic_vars[row]))
+                theta = ratios[pivot_row]
+
+            entering_range = self.column_upper[pivot_col]
+            if entering_range <= theta:
+                if not np.isfinite(entering_range):
+                    status = 'unbounded'
+                    break
+
+                # Cambio de cota: la entrante pasa a su cota opuesta sin pivotear
+                theta = entering_range
+                x_basic += theta * delta
+                complemented[pivot_col] = not complemented[pivot_col]
+                x_nonbasic[pivot_col] = up[pivot_col] if complemented[pivot_col] else lo[pivot_col]
+                z_value = float(costs @ x_nonbasic + costs[basic_vars] @ x_basic)
+                iteration += 1
+                self.iterations.record(None, basic_vars, complemented, iteration, -1, pivot_col,
+                                       objective=z_value, phase_one=phase_one)
+            else:
+                # La saliente queda en la cota donde se detuvo
+                leaving_var = basic_vars[pivot_row]
+                leaves_at_upper = bool(to_upper[pivot_row])
+                entering_value = x_nonbasic[pivot_col] + direction * theta
+                x_basic += theta * delta
+                x_basic[pivot_row] = entering_value
+                factor.add_eta(pivot_row, alpha)
+
+                x_nonbasic[leaving_var] = up[leaving_var] if leaves_at_upper else lo[leaving_var]
+                complemented[leaving_var] = leaves_at_upper
+                x_nonbasic[pivot_col] = 0.0
+                complemented[pivot_col] = False
+                is_basic[leaving_var] = False
+                is_basic[pivot_col] = True
+                basic_vars[pivot_row] = pivot_col
+                z_value = float(costs @ x_nonbasic + costs[basic_vars] @ x_basic)
+
+                iteration += 1
+                pivots_since_refactor += 1
+                self.iterations.record(None, basic_vars, complemented, iteration, pivot_row,
+                                       pivot_col, leaving_var, alpha[pivot_row], objective=z_value,
+                                       leaves_at_upper=leaves_at_upper, phase_one=phase_one)
+
+            # Detección de ciclos: solo se revisan los pasos degenerados
+            if theta > tol:
+                visited.clear()
+            else:
+                self.degenerate_pivots += 1
+                key = hash(np.sort(np.asarray(basic_vars, dtype=np.int64)).tobytes())
+                if key in visited:
+                    self.cycling_detected = True
+                    visited.clear()
+                    bland = bland or self._anti_cycling != 'none'
+                visited.add(key)
+
+            if pivots_since_refactor >= refactor_interval:
+                basic_vars = self._refactorize(factor, A, basic_vars)
+                # Las columnas dependientes que salieron quedan en su cota inferior
+                dropped = is_basic.copy()
+                dropped[basic_vars] = False
+                x_nonbasic[dropped] = lo[dropped]
+                is_basic[:] = False
+                is_basic[basic_vars] = True
+                x_nonbasic[is_basic] = 0.0
+                x_basic = factor.ftran(self._basic_rhs(A, b, x_nonbasic))
+                pivots_since_refactor = 0
+                refactor_interval = self._refactor_interval(factor)
+
+        self.basic_vars = basic_vars
+
+        # Solución completa: no básicas en su cota y básicas de x_B
+        x = x_nonbasic.copy()
+        x[basic_vars] = x_basic
+        solution = x[:n_vars]
+
+        result = {
+            'iterations': self.iterations,
+            'iteration_count': iteration,
+            'refactorizations': self.refactorizations,
+            'degenerate_pivots': self.degenerate_pivots,
+            'cycling_detected': self.cycling_detected
+        }
+        if warm_start is not None:
+            result['warm_start'] = warm_start
+
+        messages = {
+            'unbounded': 'El problema no está acotado',
+            'infeasible': 'El problema no tiene solución factible',
+            'iteration_limit': 'Se alcanzó el número máximo de iteraciones sin llegar al óptimo'
+        }
+        status = status or 'iteration_limit'
+        if status in messages:
+            result['status'], result['message'] = status, messages[status]
+            return result
+
+        z_value = float(c @ solution)
+
+        if status in STOP_STATUSES:
+            # Interrumpido: la última base y, si es factible, su solución
+            result['status'], result['message'] = status, STOP_MESSAGES[status]
+            result['basis'] = self.current_basis()
+            if not phase_one:
+                result['solution'] = solution
+                result['objective'] = z_value
+                result['variable_names'] = self.variable_names
+            return result
+
+        self.optimal_solution = solution
+        self.optimal_value = z_value
+
+        result.update({
+            'status': 'optimal',
+            'solution': solution,
+            'optimal_value': z_value,
+            'variable_names': self.variable_names
+        })
+        return result
+
+    @staticmethod
+    def _basic_rhs(A, b: np.ndarray, x_nonbasic: np.ndarray) -> np.ndarray:
+        """
+        Lado derecho que deben cubrir las básicas: b - A·x_N
+
+        Args:
+            A: Matriz de restricciones (densa o SparseMatrix)
+            b: Lado derecho
+            x_nonbasic: Valores de todas las columnas con 0 en las básicas
+
+        Returns:
+            Vector b - A·x_N (las holguras no básicas valen 0)
+        """
+        x_structural = x_nonbasic[:A.shape[1]]
+        if isinstance(A, SparseMatrix):
+            return b - A.matvec(x_structural)
+        return b - A @ x_structural
@@ -0,0 +1,238 @@
+import time
+import numpy as np
+from typing import Dict, Tuple, Optional
+
+
+class Scaler:
+    """
+    Escalamiento de filas y columnas de la matriz de restricciones.
+
+    Primero se aplican pasadas alternadas de media geométrica (cada fila y
+    columna se divide por sqrt(max|a| · min|a|) de sus no ceros) hasta que
+    el rango de magnitudes deja de mejorar; luego se equilibra para que el
+    mayor elemento de cada fila y de cada columna valga 1. Los factores se
+    redondean a potencias de 2, así escalar y desescalar no agrega errores
+    de redondeo.
+
+    El problema escalado es max (S c)·x', (R A S) x' <= R b con x = S x'.
+    """
+
+    def __init__(self, max_passes: int = 20, tolerance: float = 0.9):
+        """
+        Inicializar el escalamiento
+
+        Args:
+            max_passes: Número máximo de pasadas de media geométrica
+            tolerance: Se detiene cuando el rango mejora menos que este factor
+        """
+        self.max_passes = max_passes
+        self.tolerance = tolerance
+        self.row_scale = None
+        self.col_scale = None
+
+    @staticmethod
+    def _magnitude_range(A: np.ndarray) -> float:
+        """
+        Cociente entre el mayor y el menor elemento no cero en valor absoluto
+
+        Args:
+            A: Matriz
+
+        Returns:
+            max|a_ij| / min|a_ij| sobre los no ceros (1 si no hay)
+        """
+        values = np.abs(A[A != 0])
+        if len(values) == 0:
+            return 1.0
+        return float(values.max() / values.min())
+
+    @staticmethod
+    def _power_of_two(scale: np.ndarray) -> np.ndarray:
+        """
+        Redondear factores de escala a potencias de 2
+
+        Args:
+            scale: Factores positivos
+
+        Returns:
+            Factores redondeados
+        """
+        return np.exp2(np.round(np.log2(scale)))
+
+    def fit(self, A: np.ndarray):
+        """
+        Calcular los factores de escala de filas (R) y columnas (S)
+
+        Args:
+            A: Matriz de restricciones
+        """
+        A = np.abs(np.atleast_2d(np.asarray(A, dtype=float)))
+        n_rows, n_cols = A.shape
+        row_scale = np.ones(n_rows)
+        col_scale = np.ones(n_cols)
+        self.range_before = self._magnitude_range(A)
+
+        nonzero = A > 0
+
+        def geometric(scaled: np.ndarray, axis: int) -> np.ndarray:
+            largest = scaled.max(axis=axis, initial=0.0)
+            smallest = np.where(nonzero, scaled, np.inf).min(axis=axis, initial=np.inf)
+            empty = largest == 0
+            product = np.where(empty, 1.0, largest) * np.where(empty, 1.0, smallest)
+            return np.where(empty, 1.0, 1.0 / np.sqrt(product))
+
+        def equilibrate(scaled: np.ndarray, axis: int) -> np.ndarray:
+            largest = scaled.max(axis=axis, initial=0.0)
+            return np.where(largest > 0, 1.0 / np.where(largest > 0, largest, 1.0), 1.0)
+
+        current = self.range_before
+        for _ in range(self.max_passes):
+            # Media geométrica por filas y luego por columnas
+            row_scale *= geometric(A * row_scale[:, np.newaxis] * col_scale, axis=1)
+            col_scale *= geometric(A * row_scale[:, np.newaxis] * col_scale, axis=0)
+            new_range = self._magnitude_range(A * row_scale[:, np.newaxis] * col_scale)
+            if new_range > self.tolerance * current:
+                break
+            current = new_range
+
+        # Equilibrado: mayor elemento de cada fila y luego de cada columna en 1
+        row_scale *= equilibrate(A * row_scale[:, np.newaxis] * col_scale, axis=1)
+        col_scale *= equilibrate(A * row_scale[:, np.newaxis] * col_scale, axis=0)
+
+        self.row_scale = self._power_of_two(row_scale)
+        self.col_scale = self._power_of_two(col_scale)
+        self.range_after = self._magnitude_range(A * self.row_scale[:, np.newaxis] * self.col_scale)
+
+    def scale(self, c: np.ndarray, A: np.ndarray, b: np.ndarray,
+              lower: Optional[np.ndarray] = None,
+              upper: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray,
+                                                           Optional[np.ndarray], Optional[np.ndarray]]:
+        """
+        Calcular los factores y escalar el problema
+
+        Args:
+            c: Coeficientes de la función objetivo
+            A: Matriz de restricciones
+            b: Valores del lado derecho
+            lower: Cotas inferiores (o None)
+            upper: Cotas superiores (o None)
+
+        Returns:
+            Tuple con (c, A, b, lower, upper) escalados
+        """
+        A = np.atleast_2d(np.asarray(A, dtype=float)).reshape(len(b), len(c))
+        self.fit(A)
+        R, S = self.row_scale, self.col_scale
+        c_scaled = np.asarray(c, dtype=float) * S
+        A_scaled = A * R[:, np.newaxis] * S
+        b_scaled = np.asarray(b, dtype=float) * R
+        lower_scaled = None if lower is None else np.asarray(lower, dtype=float) / S
+        upper_scaled = None if upper is None else np.asarray(upper, dtype=float) / S
+        return c_scaled, A_scaled, b_scaled, lower_scaled, upper_scaled
+
+    def unscale_solution(self, solution: np.ndarray) -> np.ndarray:
+        """
+        Llevar la solución al espacio original (x = S x')
+
+        Args:
+            solution: Solución del problema escalado
+
+        Returns:
+            Solución original
+        """
+        return solution * self.col_scale
+
+    def unscale_sensitivity(self, sensitivity: Dict) -> Dict:
+        """
+        Llevar el análisis de sensibilidad al espacio original
+
+        Args:
+            sensitivity: Reporte de SimplexSolver.sensitivity_report en el
+                problema escalado
+
+        Returns:
+            Reporte con precios sombra, costos reducidos y rangos originales
+        """
+        R, S = self.row_scale, self.col_scale
+        return dict(sensitivity,
+                    shadow_prices=sensitivity['shadow_prices'] * R,
+                    reduced_costs=sensitivity['reduced_costs'] / S,
+                    objective_ranges=sensitivity['objective_ranges'] / S[:, np.newaxis],
+                    rhs_ranges=sensitivity['rhs_ranges'] / R[:, np.newaxis])
+
+
+def primal_residual(A: np.ndarray, b: np.ndarray, solution: np.ndarray,
+                    lower: Optional[np.ndarray] = None, upper: Optional[np.ndarray] = None) -> float:
+    """
+    Mayor violación de A·x <= b y de las cotas en el espacio original
+
+    Args:
+        A: Matriz de restricciones
+        b: Valores del lado derecho
+        solution: Solución a verificar
+        lower: Cotas inferiores (por defecto 0)
+        upper: Cotas superiores (por defecto infinito)
+
+    Returns:
+        Violación máxima (0 si la solución es factible)
+    """
+    A = np.atleast_2d(np.asarray(A, dtype=float)).reshape(len(b), len(solution))
+    lower = np.zeros(len(solution)) if lower is None else np.maximum(lower, 0.0)
+    upper = np.full(len(solution), np.inf) if upper is None else upper
+    violations = [np.max(A @ solution - b, initial=0.0),
+                  np.max(lower - solution, initial=0.0),
+                  np.max(solution - upper, initial=0.0)]
+    return float(max(violations))
+
+
+def solve_scaled(solver, c: np.ndarray, A: np.ndarray, b: np.ndarray,
+                 lower: Optional[np.ndarray] = None, upper: Optional[np.ndarray] = None,
+                 compare: bool = False, **options) -> Dict:
+    """
+    Escalar el problema, resolverlo y desescalar la solución y los duales
+
+    El estado del solver (tableau, historial) queda en el espacio escalado.
+
+    Args:
+        solver: Instancia de SimplexSolver
+        c: Coeficientes de la función objetivo
+        A: Matriz de restricciones
+        b: Valores del lado derecho
+        lower: Cotas inferiores (por defecto 0)
+        upper: Cotas superiores (por defecto infinito)
+        compare: Resolver también sin escalar para comparar iteraciones y residuos
+        **options: Opciones adicionales para solver.solve
+
+    Returns:
+        Diccionario con la solución original y 'scaling' con el rango de
+        magnitudes antes y después, iteraciones y residuo primal
+    """
+    scaler = Scaler()
+    start = time.perf_counter()
+    c_s, A_s, b_s, lower_s, upper_s = scaler.scale(c, A, b, lower, upper)
+    result = solver.solve(c_s, A_s, b_s, lower_s, upper_s, **options)
+
+    if result['status'] == 'optimal':
+        result['solution'] = scaler.unscale_solution(result['solution'])
+        result['sensitivity'] = scaler.unscale_sensitivity(result['sensitivity'])
+
+    stats = {
+        'range_before': scaler.range_before,
+        'range_after': scaler.range_after,
+        'iterations': result.get('iteration_count'),
+        'time': time.perf_counter() - start
+    }
+    if result['status'] == 'optimal':
+        stats['residual'] = primal_residual(A, b, result['solution'], lower, upper)
+
+    if compare:
+        start = time.perf_counter()
+        unscaled = type(solver)().solve(c, A, b, lower, upper, **options)
+        stats['unscaled_status'] = unscaled['status']
+        stats['unscaled_iterations'] = unscaled.get('iteration_count')
+        stats['unscaled_time'] = time.perf_counter() - start
+        if unscaled['status'] == 'optimal':
+            stats['unscaled_residual'] = primal_residual(A, b, unscaled['solution'], lower, upper)
+
+    result['scaling'] = stats
+    return result
@@ -1,6 +1,60 @@
 import numpy as np
 from typing import List, Dict, Tuple, Optional
+import os
 import re
+from sparse_matrix import SparseMatrix
+from iteration_history import IterationHistory
+from pricing import PricingRule, BlandPricing, make_pricing, pricing_stats
+from presolve import solve_with_presolve
+from scaling import solve_scaled
+from solve_control import STOP_STATUSES, STOP_MESSAGES, make_control
+from basis_io import load_basis
+import time
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Elementos del tableau desde los que el pivoteo se reparte entre hilos;
+# por debajo el costo de coordinar los hilos supera la ganancia
+PARALLEL_PIVOT_SIZE = 1 << 20
+
+# Pools de hilos para el pivoteo, uno por cantidad de hilos (se reutilizan
+# entre resoluciones y entre solvers de distintos hilos)
+_pivot_pools: Dict[int, ThreadPoolExecutor] = {}
+_pivot_pools_lock = threading.Lock()
+
+
+def _pivot_pool(n_threads: int) -> ThreadPoolExecutor:
+    """
+    Obtener el pool de hilos compartido para pivotear con n_threads hilos
+    
+    Args:
+        n_threads: Cantidad de hilos
+        
+    Returns:
+        ThreadPoolExecutor reutilizable
+    """
+    with _pivot_pools_lock:
+        pool = _pivot_pools.get(n_threads)
+        if pool is None:
+            pool = ThreadPoolExecutor(n_threads, thread_name_prefix='simplex-pivot')
+            _pivot_pools[n_threads] = pool
+        return pool
+
+
+@atexit.register
+def _shutdown_pivot_pools():
+    """Cerrar los pools de pivoteo al terminar el programa"""
+    with _pivot_pools_lock:
+        for pool in _pivot_pools.values():
+            pool.shutdown(wait=False)
+        _pivot_pools.clear()
+
+# Tolerancias (pivote, factibilidad) según el tipo de dato del tableau
+TOLERANCES = {
+    np.dtype(np.float64): (1e-10, 1e-9),
+    np.dtype(np.float32): (1e-6, 1e-5)
+}
 
 class SimplexSolver:
     """
@@ -8,6 +62,9 @@ class SimplexSolver:
     Solo soporta problemas de MAXIMIZACIÓN.
     """
     
+    # Indica si solve acepta la matriz de restricciones como SparseMatrix
+    sparse_input = False
+    
     def __init__(self):
         """Inicializar el solver Simplex"""
         self.iterations = []
@@ -15,6 +72,19 @@ class SimplexSolver:
         self.optimal_value = None
         self.variable_names = []
         self.slack_variable_names = []
+        self.tableau = None
+        self.basic_vars = []
+        self._in_phase_one = False
+        self._pricing = PricingRule()
+        self._pricing_stats = None
+        self._anti_cycling = 'perturbation'
+        self._perturbed = False
+        self.degenerate_pivots = 0
+        self.cycling_detected = False
+        self._pivot_tolerance, self._feasibility_tolerance = TOLERANCES[np.dtype(np.float64)]
+        self._control = None
+        self._n_threads = None
+        self._parallel_pivot_size = PARALLEL_PIVOT_SIZE
         
     def parse_problem(self, objective: str, restrictions: List[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
@@ -27,17 +97,7 @@ class SimplexSolver:
         Returns:
             Tuple con (coeficientes_objetivo, matriz_restricciones, valores_derecha)
         """
-        # Verificar que sea maximización
-        if 'minimizar' in objective.lower() or 'min' in objective.lower():
-            raise ValueError("Este solver solo soporta problemas de MAXIMIZACIÓN")
-        
-        # Extraer coeficientes de la función objetivo
-        obj_match = re.search(r'Z\s*=\s*(.+)', objective, re.IGNORECASE)
-        if not obj_match:
-            raise ValueError("No se pudo parsear la función objetivo")
-        
-        obj_expr = obj_match.group(1).strip()
-        c = self._parse_expression(obj_expr)
+        c = self._parse_objective(objective)
         n_vars = len(c)
         
         # Parsear restricciones
@@ -45,66 +105,16 @@ class SimplexSolver:
         b = []
         
         for restriction in restrictions:
-            # Limpiar restricción
-            restriction = restriction.strip()
-            
-            # Saltar restricciones de no negatividad
-            if '>= 0' in restriction or '≥ 0' in restriction:
+            parsed = self._parse_restriction(restriction, n_vars)
+            if parsed is None:
                 continue
             
-            # Separar lado izquierdo y derecho
-            for op in ['<=', '>=', '=', '≤', '≥']:
-                if op in restriction:
-                    parts = restriction.split(op)
-                    if len(parts) == 2:
-                        left = parts[0].strip()
-                        right = parts[1].strip()
-                        
-                        # Parsear lado izquierdo
-                        coeffs_left = self._parse_expression(left)
-                        
-                        # Verificar si el lado derecho tiene variables o es solo un número
-                        coeffs_right = self._parse_expression(right)
-                        
-                        if coeffs_right and any(c != 0 for c in coeffs_right):
-                            # Hay variables en el lado derecho, moverlas al lado izquierdo
-                            # Asegurar que ambos lados tengan el mismo tamaño
-                            max_len = max(len(coeffs_left), len(coeffs_right))
-                            while len(coeffs_left) < max_len:
-                                coeffs_left.append(0.0)
-                            while len(coeffs_right) < max_len:
-                                coeffs_right.append(0.0)
-                            
-                            # Restar lado derecho del izquierdo: ax1 + bx2 >= cx1 + dx2 -> (a-c)x1 + (b-d)x2 >= 0
-                            coeffs = [coeffs_left[i] - coeffs_right[i] for i in range(max_len)]
-                            rhs = 0.0
-                        else:
-                            # Lado derecho es solo un número
-                            coeffs = coeffs_left
-                            try:
-                                rhs = float(right)
-                            except ValueError:
-                                continue
-                        
-                        # Asegurar que tenga el mismo número de variables que la función objetivo
-                        while len(coeffs) < n_vars:
-                            coeffs.append(0.0)
-                        coeffs = coeffs[:n_vars]
-                        
-                        # Para >= convertir a <= multiplicando por -1
-                        if op in ['>=', '≥']:
-                            coeffs = [-x for x in coeffs]
-                            rhs = -rhs
-                        
-                        # Solo agregar restricciones válidas con RHS positivo o cero
-                        # (Simplex estándar requiere RHS >= 0)
-                        if rhs >= -1e-10:  # Permitir pequeños errores numéricos
-                            # Si RHS es negativo pequeño, ajustar a 0
-                            if rhs < 0:
-                                rhs = 0.0
-                            A.append(coeffs)
-                            b.append(rhs)
-                        break
+            terms, rhs = parsed
+            coeffs = [0.0] * n_vars
+            for var_idx, coef in terms.items():
+                coeffs[var_idx] = coef
+            A.append(coeffs)
+            b.append(rhs)
         
         # Convertir a arrays numpy
         c_array = np.array(c, dtype=float)
@@ -113,6 +123,247 @@ class SimplexSolver:
         
         return c_array, A_array, b_array
     
+    def parse_sparse_problem(self, objective: str, restrictions: List[str]) -> Tuple[np.ndarray, SparseMatrix, np.ndarray]:
+        """
+        Parsear el problema emitiendo la matriz de restricciones en forma dispersa
+        
+        Igual que parse_problem, pero cada restricción se convierte en
+        tripletas (fila, columna, valor) sin construir filas densas, y la
+        matriz se comprime al final en formato CSC.
+        
+        Args:
+            objective: Función objetivo en formato "Maximizar Z = 3x1 + 2x2"
+            restrictions: Lista de restricciones en formato "2x1 + 1x2 <= 10"
+            
+        Returns:
+            Tuple con (coeficientes_objetivo, matriz_dispersa, valores_derecha)
+        """
+        c = self._parse_objective(objective)
+        n_vars = len(c)
+        
+        rows = []
+        cols = []
+        vals = []
+        b = []
+        
+        for restriction in restrictions:
+            parsed = self._parse_restriction(restriction, n_vars)
+            if parsed is None:
+                continue
+            
+            terms, rhs = parsed
+            row = len(b)
+            for var_idx, coef in terms.items():
+                if coef != 0:
+                    rows.append(row)
+                    cols.append(var_idx)
+                    vals.append(coef)
+            b.append(rhs)
+        
+        A_sparse = SparseMatrix.from_triplets(rows, cols, vals, (len(b), n_vars))
+        return np.array(c, dtype=float), A_sparse, np.array(b, dtype=float)
+    
+    def parse_bounded_problem(self, objective: str, restrictions: List[str],
+                              sparse: bool = False) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Parsear el problema separando las cotas de una sola variable
+        
+        Las restricciones con una sola variable (por ejemplo "1x1 <= 4" o
+        "x2 >= 1") no se agregan como filas: se guardan en los vectores de
+        cotas inferiores y superiores, que el solver maneja con la prueba
+        del cociente para variables acotadas.
+        
+        Las demás filas quedan en forma "<=" aunque su lado derecho sea
+        negativo (el solver las hace factibles con el Simplex dual) y cada
+        igualdad se agrega como dos filas "<=" y ">=".
+        
+        Args:
+            objective: Función objetivo en formato "Maximizar Z = 3x1 + 2x2"
+            restrictions: Lista de restricciones en formato "2x1 + 1x2 <= 10"
+            sparse: Emitir la matriz como SparseMatrix a partir de tripletas,
+                sin construir filas densas (como parse_sparse_problem)
+            
+        Returns:
+            Tuple con (coeficientes_objetivo, matriz_restricciones,
+            valores_derecha, cotas_inferiores, cotas_superiores)
+        """
+        c = self._parse_objective(objective)
+        n_vars = len(c)
+        
+        lower = np.zeros(n_vars)
+        upper = np.full(n_vars, np.inf)
+        A = []
+        b = []
+        triplet_rows = []
+        triplet_cols = []
+        triplet_vals = []
+        
+        for restriction in restrictions:
+            parsed = self._split_restriction(restriction, n_vars)
+            if parsed is None:
+                continue
+            
+            terms, op, rhs = parsed
+            terms = {var_idx: coef for var_idx, coef in terms.items() if coef != 0}
+            
+            if len(terms) == 1:
+                # Cota simple: a*xj (op) rhs
+                var_idx, coef = next(iter(terms.items()))
+                value = rhs / coef
+                if op == '=':
+                    lower[var_idx] = max(lower[var_idx], value)
+                    upper[var_idx] = min(upper[var_idx], value)
+                elif (op in ['<=', '≤']) == (coef > 0):
+                    upper[var_idx] = min(upper[var_idx], value)
+                else:
+                    lower[var_idx] = max(lower[var_idx], value)
+                continue
+            
+            if not terms:
+                continue
+            
+            rows = [(terms, '<=', rhs), (terms, '>=', rhs)] if op == '=' else [(terms, op, rhs)]
+            for row_terms, row_op, row_rhs in rows:
+                row_terms, row_rhs = self._normalize_restriction(row_terms, row_op, row_rhs)
+                if sparse:
+                    for var_idx, coef in row_terms.items():
+                        triplet_rows.append(len(b))
+                        triplet_cols.append(var_idx)
+                        triplet_vals.append(coef)
+                else:
+                    coeffs = [0.0] * n_vars
+                    for var_idx, coef in row_terms.items():
+                        coeffs[var_idx] = coef
+                    A.append(coeffs)
+                b.append(row_rhs)
+        
+        if sparse:
+            A_array = SparseMatrix.from_triplets(triplet_rows, triplet_cols, triplet_vals,
+                                                 (len(b), n_vars))
+        else:
+            A_array = np.array(A, dtype=float).reshape(len(A), n_vars)
+        
+        return np.array(c, dtype=float), A_array, np.array(b, dtype=float), lower, upper
+    
+    def _parse_objective(self, objective: str) -> List[float]:
+        """
+        Extraer los coeficientes de la función objetivo
+        
+        Args:
+            objective: Función objetivo en formato "Maximizar Z = 3x1 + 2x2"
+            
+        Returns:
+            Lista de coeficientes
+        """
+        # Verificar que sea maximización
+        if 'minimizar' in objective.lower() or 'min' in objective.lower():
+            raise ValueError("Este solver solo soporta problemas de MAXIMIZACIÓN")
+        
+        # Extraer coeficientes de la función objetivo
+        obj_match = re.search(r'Z\s*=\s*(.+)', objective, re.IGNORECASE)
+        if not obj_match:
+            raise ValueError("No se pudo parsear la función objetivo")
+        
+        obj_expr = obj_match.group(1).strip()
+        return self._parse_expression(obj_expr)
+    
+    def _parse_restriction(self, restriction: str, n_vars: int) -> Optional[Tuple[Dict[int, float], float]]:
+        """
+        Parsear una restricción y llevarla a la forma "<="
+        
+        El lado derecho puede quedar negativo (por ejemplo "x1 >= 3" da
+        -x1 <= -3); el solver decide si puede resolverlo.
+        
+        Args:
+            restriction: Restricción en formato "2x1 + 1x2 <= 10"
+            n_vars: Número de variables de la función objetivo
+            
+        Returns:
+            Tuple con ({índice_variable: coeficiente}, rhs) o None si es una
+            restricción de no negatividad o no se pudo interpretar
+        """
+        # Saltar restricciones de no negatividad
+        if '>= 0' in restriction or '≥ 0' in restriction:
+            return None
+        
+        parsed = self._split_restriction(restriction, n_vars)
+        if parsed is None:
+            return None
+        
+        return self._normalize_restriction(*parsed)
+    
+    def _split_restriction(self, restriction: str, n_vars: int) -> Optional[Tuple[Dict[int, float], str, float]]:
+        """
+        Separar una restricción en coeficientes, operador y lado derecho
+        
+        Args:
+            restriction: Restricción en formato "2x1 + 1x2 <= 10"
+            n_vars: Número de variables de la función objetivo
+            
+        Returns:
+            Tuple con ({índice_variable: coeficiente}, operador, rhs) o None
+            si no se pudo interpretar
+        """
+        # Limpiar restricción
+        restriction = restriction.strip()
+        
+        # Separar lado izquierdo y derecho
+        for op in ['<=', '>=', '=', '≤', '≥']:
+            if op in restriction:
+                parts = restriction.split(op)
+                if len(parts) == 2:
+                    left = parts[0].strip()
+                    right = parts[1].strip()
+                    
+                    # Parsear lado izquierdo
+                    terms = self._parse_terms(left)
+                    
+                    # Verificar si el lado derecho tiene variables o es solo un número
+                    terms_right = self._parse_terms(right)
+                    
+                    if any(coef != 0 for coef in terms_right.values()):
+                        # Hay variables en el lado derecho, moverlas al lado izquierdo
+                        # Restar lado derecho del izquierdo: ax1 + bx2 >= cx1 + dx2 -> (a-c)x1 + (b-d)x2 >= 0
+                        for var_idx, coef in terms_right.items():
+                            terms[var_idx] = terms.get(var_idx, 0.0) - coef
+                        rhs = 0.0
+                    else:
+                        # Lado derecho es solo un número
+                        try:
+                            rhs = float(right)
+                        except ValueError:
+                            continue
+                    
+                    # Asegurar que tenga el mismo número de variables que la función objetivo
+                    terms = {var_idx: coef for var_idx, coef in terms.items() if var_idx < n_vars}
+                    
+                    return terms, op, rhs
+        
+        return None
+    
+    def _normalize_restriction(self, terms: Dict[int, float], op: str,
+                               rhs: float) -> Tuple[Dict[int, float], float]:
+        """
+        Llevar una restricción ya separada a la forma "<="
+        
+        Ninguna fila se descarta: si el lado derecho queda negativo, el
+        tableau lo resuelve con el Simplex dual y el Simplex revisado
+        devuelve un error explícito.
+        
+        Args:
+            terms: Coeficientes por índice de variable
+            op: Operador de la restricción
+            rhs: Lado derecho
+            
+        Returns:
+            Tuple con (coeficientes, rhs)
+        """
+        # Para >= convertir a <= multiplicando por -1
+        if op in ['>=', '≥']:
+            terms = {var_idx: -coef for var_idx, coef in terms.items()}
+            rhs = -rhs
+        return terms, rhs
+    
     def _parse_expression(self, expr: str) -> List[float]:
         """
         Parsear una expresión lineal como "3x1 + 2x2 - 5x3" o "40x1 + 30x2"
@@ -123,6 +374,31 @@ class SimplexSolver:
         Returns:
             Lista de coeficientes
         """
+        terms = self._parse_terms(expr)
+        
+        if not terms:
+            return []
+        
+        # Determinar número de variables
+        coeffs = [0.0] * (max(terms) + 1)
+        for var_idx, coef in terms.items():
+            coeffs[var_idx] = coef
+        
+        return coeffs
+    
+    def _parse_terms(self, expr: str) -> Dict[int, float]:
+        """
+        Parsear una expresión lineal a pares {índice_variable: coeficiente}
+        
+        Solo se guardan las variables que aparecen en la expresión, por lo
+        que el tamaño no depende del número total de variables.
+        
+        Args:
+            expr: Expresión a parsear
+            
+        Returns:
+            Diccionario con los coeficientes por índice de variable (base 0)
+        """
         # Limpiar expresión y convertir a minúsculas
         expr = expr.replace(' ', '').lower()
         
@@ -131,12 +407,7 @@ class SimplexSolver:
         pattern = r'([+-]?\d+\.?\d*)?x(\d+)'
         matches = re.findall(pattern, expr)
         
-        if not matches:
-            return []
-        
-        # Determinar número de variables
-        max_var = max(int(m[1]) for m in matches)
-        coeffs = [0.0] * max_var
+        terms = {}
         
         # Asignar coeficientes
         for coef_str, var_num in matches:
@@ -151,238 +422,1718 @@ class SimplexSolver:
                 # Convertir el string del coeficiente a float
                 coef = float(coef_str)
             
-            coeffs[var_idx] = coef
+            terms[var_idx] = coef
         
-        return coeffs
+        return terms
     
-    def solve(self, c: np.ndarray, A: np.ndarray, b: np.ndarray) -> Dict:
+    def solve(self, c: np.ndarray, A: np.ndarray, b: np.ndarray,
+              lower: Optional[np.ndarray] = None, upper: Optional[np.ndarray] = None,
+              history: str = 'full', history_size: int = 10,
+              pricing='dantzig', anti_cycling: str = 'perturbation',
+              max_iterations: Optional[int] = None, dtype=np.float64,
+              cancel_token=None, time_limit: Optional[float] = None,
+              progress=None, progress_interval: float = 0.5,
+              initial_basis=None, n_threads: Optional[int] = None) -> Dict:
         """
         Resolver el problema usando el método Simplex
         
+        Las cotas de variables se manejan sin agregar filas: las cotas
+        inferiores se trasladan al lado derecho y las superiores se tratan
+        en la prueba del cociente. Una variable no básica en su cota
+        superior se representa complementada (x' = u - x), con su columna
+        cambiada de signo en el tableau.
+        
         Args:
             c: Coeficientes de la función objetivo
             A: Matriz de restricciones
             b: Valores del lado derecho
+            lower: Cotas inferiores de las variables (por defecto 0)
+            upper: Cotas superiores de las variables (por defecto infinito)
+            history: Modo del historial de iteraciones: 'none', 'summary'
+                (solo pivoteos), 'ring' (últimos history_size tableaus), 'full'
+                o 'replay' (pivoteos y un tableau de control cada history_size
+                pivoteos; las demás iteraciones se reconstruyen bajo demanda)
+            history_size: Tamaño del anillo en 'ring' o intervalo entre
+                tableaus de control en 'replay'
+            pricing: Regla de la variable entrante: 'dantzig', 'bland', 'devex',
+                'steepest_edge', 'partial' o una instancia de PricingRule
+            anti_cycling: Protección al detectar una base repetida:
+                'perturbation' (perturbación acotada), 'lexicographic' o 'none'
+            max_iterations: Límite de iteraciones (por defecto escala con m + n);
+                al alcanzarlo el estado es 'iteration_limit'
+            dtype: Tipo de dato del tableau (np.float64 o np.float32). Con
+                float32 los pivoteos usan la mitad de memoria y una pasada de
+                refinamiento iterativo en float64 pule la solución básica
+                final; si los residuos siguen grandes se resuelve otra vez
+                en float64. El resumen queda en result['precision']
+            cancel_token: CancellationToken que otro hilo puede cancelar; el
+                estado queda 'cancelled'
+            time_limit: Segundos de reloj disponibles; al agotarlos el estado
+                queda 'time_limit'
+            progress: Función que recibe un diccionario con 'iteration',
+                'objective', 'pivots_per_second' y 'elapsed'
+            progress_interval: Segundos mínimos entre dos llamadas a progress
+            initial_basis: Base de partida (diccionario de current_basis o
+                result['basis'], o ruta de un archivo de save_basis). Las
+                columnas dependientes o inválidas se reemplazan por
+                holguras y una base infactible se corrige con el Simplex
+                dual; el resumen queda en result['warm_start']
+            n_threads: Hilos para la eliminación de filas de cada pivoteo
+                (por defecto os.cpu_count()). Solo se usan si el tableau
+                tiene al menos PARALLEL_PIVOT_SIZE elementos; con 1, o en
+                tableaus más chicos, se pivotea en el hilo actual
             
         Returns:
-            Diccionario con la solución y todas las iteraciones
+            Diccionario con la solución y todas las iteraciones; 'pricing_stats'
+            resume iteraciones y costo por iteración de la regla usada. Si la
+            resolución se interrumpe, 'basis' tiene la última base y, si era
+            factible, 'solution' y 'objective' su solución y su valor
         """
+        dtype = np.dtype(dtype)
+        if dtype not in TOLERANCES:
+            raise ValueError(f"Tipo de dato no válido: {dtype}. Opciones: float64, float32")
+        
         # Inicializar
-        self.iterations = []
+        self._configure(pricing, anti_cycling)
+        self._control = make_control(cancel_token, time_limit, progress, progress_interval)
+        self._n_threads = n_threads
         n_vars = len(c)
         n_constraints = len(b)
         
         # Crear nombres de variables
         self.variable_names = [f'x{i+1}' for i in range(n_vars)]
         self.slack_variable_names = [f's{i+1}' for i in range(n_constraints)]
+        self.iterations = IterationHistory(self.variable_names + self.slack_variable_names,
+                                           history, history_size)
+        
+        lower = np.zeros(n_vars) if lower is None else np.maximum(np.asarray(lower, dtype=float), 0.0)
+        upper = np.full(n_vars, np.inf) if upper is None else np.asarray(upper, dtype=float)
+        
+        if np.any(lower > upper + 1e-10):
+            self.tableau = None
+            return {
+                'status': 'infeasible',
+                'message': 'Las cotas de alguna variable son contradictorias',
+                'iterations': self.iterations
+            }
+        
+        # Cota superior de cada columna después de trasladar las cotas inferiores
+        # (las holguras no tienen cota superior)
+        self.column_upper = np.concatenate([np.maximum(upper - lower, 0.0),
+                                            np.full(n_constraints, np.inf)])
+        self.complemented = np.zeros(n_vars + n_constraints, dtype=bool)
+        self.iterations.set_column_upper(self.column_upper)
         
         # Agregar variables de holgura para formar el tableau inicial
-        # Tableau: [A | I | b]
-        #          [c | 0 | 0]
+        # Tableau: [A | I | b - A*l]
+        #          [c | 0 | c*l ]
         
-        tableau = np.zeros((n_constraints + 1, n_vars + n_constraints + 1))
+        tableau = np.zeros((n_constraints + 1, n_vars + n_constraints + 1), dtype=dtype)
         
         # Llenar parte de restricciones
-        tableau[:n_constraints, :n_vars] = A
-        tableau[:n_constraints, n_vars:n_vars+n_constraints] = np.eye(n_constraints)
-        tableau[:n_constraints, -1] = b
+        if n_constraints > 0:
+            tableau[:n_constraints, :n_vars] = A
+            tableau[:n_constraints, n_vars:n_vars+n_constraints] = np.eye(n_constraints)
+            tableau[:n_constraints, -1] = b - A @ lower
         
         # Llenar fila Z (función objetivo)
         tableau[-1, :n_vars] = -c  # Negativo porque estamos en forma estándar
+        tableau[-1, -1] = c @ lower
         
         # Variables básicas iniciales (las de holgura)
         basic_vars = list(range(n_vars, n_vars + n_constraints))
         
-        # Guardar tableau inicial
-        self._save_iteration(tableau.copy(), basic_vars.copy(), -1, -1, 0)
+        # Guardar el problema y la base para poder reoptimizar después
+        self._problem = {
+            'c': np.array(c, dtype=float),
+            'A': np.array(A, dtype=float).reshape(n_constraints, n_vars),
+            'b': np.array(b, dtype=float),
+            'lower': lower,
+            'upper': upper
+        }
+        self.tableau = tableau
+        self.basic_vars = basic_vars
         
-        # Iterar hasta encontrar solución óptima
-        iteration = 0
-        max_iterations = 100
+        warm_start = None
+        if initial_basis is not None:
+            warm_start = self._warm_start(tableau, basic_vars, initial_basis)
         
-        while iteration < max_iterations:
-            # Verificar si es óptimo (todos los coeficientes en fila Z son >= 0)
-            if np.all(tableau[-1, :-1] >= -1e-10):
-                # Solución óptima encontrada
-                break
-            
-            # Seleccionar columna pivote (más negativo en fila Z)
-            pivot_col = np.argmin(tableau[-1, :-1])
-            
-            # Verificar factibilidad (problema no acotado)
-            if np.all(tableau[:-1, pivot_col] <= 0):
-                return {
-                    'status': 'unbounded',
-                    'message': 'El problema no está acotado',
-                    'iterations': self.iterations
-                }
-            
-            # Seleccionar fila pivote (prueba del cociente mínimo)
-            ratios = []
-            for i in range(n_constraints):
-                if tableau[i, pivot_col] > 1e-10:
-                    ratio = tableau[i, -1] / tableau[i, pivot_col]
-                    ratios.append((ratio, i))
-                else:
-                    ratios.append((float('inf'), i))
-            
-            # Encontrar mínimo ratio válido
-            min_ratio = float('inf')
-            pivot_row = -1
-            for ratio, idx in ratios:
-                if 0 <= ratio < min_ratio:
-                    min_ratio = ratio
-                    pivot_row = idx
-            
-            if pivot_row == -1:
-                return {
-                    'status': 'error',
-                    'message': 'No se pudo encontrar fila pivote',
-                    'iterations': self.iterations
-                }
-            
-            # Realizar operación de pivoteo
-            pivot_element = tableau[pivot_row, pivot_col]
-            
-            # Dividir fila pivote por elemento pivote
-            tableau[pivot_row, :] /= pivot_element
-            
-            # Hacer ceros en el resto de la columna pivote
-            for i in range(n_constraints + 1):
-                if i != pivot_row:
-                    factor = tableau[i, pivot_col]
-                    tableau[i, :] -= factor * tableau[pivot_row, :]
-            
-            # Actualizar variable básica
-            basic_vars[pivot_row] = pivot_col
-            
-            # Guardar iteración
-            iteration += 1
-            self._save_iteration(tableau.copy(), basic_vars.copy(), pivot_row, pivot_col, iteration)
+        result = self._run_simplex(tableau, basic_vars, self._iteration_limit(max_iterations))
+        if warm_start is not None:
+            result['warm_start'] = warm_start
+        if dtype == np.float64:
+            return result
         
-        # Extraer solución
-        solution = np.zeros(n_vars)
-        for i, var_idx in enumerate(basic_vars):
-            if var_idx < n_vars:
-                solution[var_idx] = tableau[i, -1]
+        # Pulir en float64 o, si no alcanza la precisión, resolver de nuevo
+        precision = self._refine_solution(result)
+        if precision['fallback'] and result['status'] not in STOP_STATUSES:
+            control = self._control
+            result = self.solve(c, A, b, lower, upper, history=history, history_size=history_size,
+                                pricing=pricing, anti_cycling=anti_cycling,
+                                max_iterations=max_iterations, cancel_token=cancel_token,
+                                time_limit=None if control is None else control.remaining(),
+                                progress=progress, progress_interval=progress_interval,
+                                initial_basis=initial_basis, n_threads=n_threads)
+        else:
+            precision['fallback'] = False
+        result['precision'] = precision
+        return result
+    
+    def update_rhs(self, index: int, value: float):
+        """
+        Cambiar el lado derecho de una restricción del último problema resuelto
         
-        # Valor óptimo
-        z_value = tableau[-1, -1]
+        El tableau final se actualiza con B^-1 (columna de la holgura), así
+        que la base sigue siendo dual factible; llamar a reoptimize() para
+        recuperar la factibilidad primal con el Simplex dual.
         
-        self.optimal_solution = solution
-        self.optimal_value = z_value
+        Args:
+            index: Índice de la restricción (base 0)
+            value: Nuevo valor del lado derecho
+        """
+        self._require_previous_solve()
+        n_vars = len(self.variable_names)
+        delta = value - self._problem['b'][index]
+        self._problem['b'][index] = value
         
-        return {
-            'status': 'optimal',
-            'solution': solution,
-            'optimal_value': z_value,
-            'iterations': self.iterations,
-            'variable_names': self.variable_names
-        }
+        # La columna de la holgura contiene B^-1 e_i y, en la fila Z, el precio sombra
+        self.tableau[:, -1] += delta * self.tableau[:, n_vars + index]
     
-    def _save_iteration(self, tableau: np.ndarray, basic_vars: List[int], 
-                       pivot_row: int, pivot_col: int, iteration_num: int):
+    def add_constraint(self, coeffs: List[float], rhs: float, sense: str = '<='):
         """
-        Guardar información de una iteración
+        Agregar una restricción al último problema resuelto
+        
+        La fila nueva se expresa en términos de la base actual y su holgura
+        entra a la base; si la solución actual la viola, reoptimize() la
+        repara con el Simplex dual.
         
         Args:
-            tableau: Tableau actual
-            basic_vars: Variables básicas actuales
-            pivot_row: Fila pivote (-1 si es inicial)
-            pivot_col: Columna pivote (-1 si es inicial)
-            iteration_num: Número de iteración
+            coeffs: Coeficientes de la restricción (uno por variable)
+            rhs: Lado derecho
+            sense: '<=', '>=' o '=' (la igualdad agrega dos filas)
         """
-        n_vars = len(self.variable_names)
-        n_slack = len(self.slack_variable_names)
+        self._require_previous_solve()
+        coeffs = np.asarray(coeffs, dtype=float)
+        if len(coeffs) != len(self.variable_names):
+            raise ValueError("La restricción debe tener un coeficiente por variable")
+        
+        if sense in ['<=', '≤', '=']:
+            self._append_row(coeffs, rhs)
+        if sense in ['>=', '≥', '=']:
+            self._append_row(-coeffs, -rhs)
+        if sense not in ['<=', '≤', '>=', '≥', '=']:
+            raise ValueError(f"Sentido de restricción no válido: {sense}")
+    
+    def reoptimize(self, history: str = 'full', history_size: int = 10,
+                   pricing='dantzig', anti_cycling: str = 'perturbation',
+                   max_iterations: Optional[int] = None) -> Dict:
+        """
+        Volver a resolver partiendo de la base óptima anterior
         
-        # Crear nombres de columnas
-        col_names = self.variable_names + self.slack_variable_names + ['RHS']
+        Se usa después de update_rhs o add_constraint: el Simplex dual
+        recupera la factibilidad primal (normalmente en pocos pivoteos) y el
+        Simplex primal termina de optimizar si hace falta.
         
-        # Crear nombres de filas
-        row_names = []
-        for var_idx in basic_vars:
-            if var_idx < n_vars:
-                row_names.append(self.variable_names[var_idx])
-            else:
-                row_names.append(self.slack_variable_names[var_idx - n_vars])
-        row_names.append('Z')
-        
-        iteration_data = {
-            'iteration': iteration_num,
-            'tableau': tableau.copy(),
-            'basic_vars': basic_vars.copy(),
-            'pivot_row': pivot_row,
-            'pivot_col': pivot_col,
-            'col_names': col_names,
-            'row_names': row_names,
-            'is_optimal': iteration_num > 0 and np.all(tableau[-1, :-1] >= -1e-10)
-        }
+        Args:
+            history: Modo del historial de iteraciones (igual que en solve)
+            history_size: Tamaño del anillo o intervalo de control (igual que en solve)
+            pricing: Regla de la variable entrante (igual que en solve)
+            anti_cycling: Protección contra ciclos (igual que en solve)
+            max_iterations: Límite de iteraciones (igual que en solve)
+            
+        Returns:
+            Diccionario con la solución, igual que solve
+        """
+        self._require_previous_solve()
+        self._configure(pricing, anti_cycling)
+        self._control = None
+        self.iterations = IterationHistory(self.variable_names + self.slack_variable_names,
+                                           history, history_size)
+        self.iterations.set_column_upper(self.column_upper)
         
-        self.iterations.append(iteration_data)
+        return self._run_simplex(self.tableau, self.basic_vars,
+                                 self._iteration_limit(max_iterations))
     
-    def solve_from_text(self, objective: str, restrictions: List[str]) -> Dict:
+    def _configure(self, pricing, anti_cycling: str):
         """
-        Resolver problema directamente desde formato texto
+        Guardar la regla de precios y la protección contra ciclos
         
         Args:
-            objective: Función objetivo como string
-            restrictions: Lista de restricciones como strings
+            pricing: Nombre o instancia de la regla de precios
+            anti_cycling: 'perturbation', 'lexicographic' o 'none'
+        """
+        if anti_cycling not in ('perturbation', 'lexicographic', 'none'):
+            raise ValueError(f"Protección contra ciclos no válida: {anti_cycling}")
+        self._pricing = make_pricing(pricing)
+        self._anti_cycling = anti_cycling
+    
+    def _iteration_limit(self, max_iterations: Optional[int]) -> int:
+        """
+        Límite de iteraciones para el tableau actual
+        
+        Args:
+            max_iterations: Límite pedido (None para el valor por defecto)
             
         Returns:
-            Diccionario con solución completa
+            El límite pedido o max(100, 10·(m + n))
         """
-        try:
-            # Parsear problema
-            c, A, b = self.parse_problem(objective, restrictions)
-            
-            # Validar que se parseó correctamente
-            if len(c) == 0 or len(A) == 0:
-                return {
-                    'status': 'error',
-                    'message': 'No se pudieron parsear las restricciones correctamente',
-                    'iterations': []
-                }
-            
-            # Resolver
-            return self.solve(c, A, b)
+        if max_iterations is not None:
+            return max_iterations
+        return max(100, 10 * (len(self.basic_vars) + len(self.variable_names)))
+    
+    def _require_previous_solve(self):
+        """Verificar que exista un problema resuelto para modificar"""
+        if getattr(self, 'tableau', None) is None:
+            raise ValueError("No hay un problema resuelto previamente para modificar")
+    
+    def _append_row(self, coeffs: np.ndarray, rhs: float):
+        """
+        Agregar una fila "<=" con su holgura al tableau final
         
-        except Exception as e:
-            return {
-                'status': 'error',
-                'message': f'Error al resolver: {str(e)}',
-                'iterations': []
-            }
+        Args:
+            coeffs: Coeficientes de la restricción
+            rhs: Lado derecho
+        """
+        tableau = self.tableau
+        basic_vars = self.basic_vars
+        n_vars = len(self.variable_names)
+        n_rows = len(basic_vars)
+        n_cols = tableau.shape[1] - 1
+        
+        # Tableau ampliado con una fila y una columna de holgura nuevas
+        expanded = np.zeros((n_rows + 2, n_cols + 2))
+        expanded[:n_rows, :n_cols] = tableau[:n_rows, :n_cols]
+        expanded[:n_rows, -1] = tableau[:n_rows, -1]
+        expanded[-1, :n_cols] = tableau[-1, :n_cols]
+        expanded[-1, -1] = tableau[-1, -1]
+        
+        row = np.zeros(n_cols + 2)
+        row[:n_vars] = coeffs
+        row[n_cols] = 1.0
+        row[-1] = rhs - coeffs @ self._problem['lower']
+        
+        # Columnas complementadas: x = u - x'
+        comp = np.flatnonzero(self.complemented)
+        row[-1] -= row[comp] @ self.column_upper[comp]
+        row[comp] *= -1
+        
+        # Eliminar las variables básicas actuales de la fila nueva
+        row -= row[basic_vars] @ expanded[:n_rows]
+        expanded[n_rows] = row
+        
+        basic_vars.append(n_cols)
+        self.slack_variable_names.append(f's{len(self.slack_variable_names) + 1}')
+        self.column_upper = np.append(self.column_upper, np.inf)
+        self.complemented = np.append(self.complemented, False)
+        self._problem['A'] = np.vstack([self._problem['A'], coeffs])
+        self._problem['b'] = np.append(self._problem['b'], rhs)
+        self.tableau = expanded
     
-    def get_iteration_summary(self, iteration_idx: int) -> str:
+    def _run_simplex(self, tableau: np.ndarray, basic_vars: List[int], max_iterations: int) -> Dict:
         """
-        Obtener resumen de una iteración
+        Ejecutar las fases del método desde un tableau y una base dados
+        
+        Si la base no es primal factible se usa primero el Simplex dual;
+        cuando la fila Z tampoco es dual factible, el dual se ejecuta con el
+        objetivo en cero (fase 1) y luego se restaura la fila Z. El tableau
+        inicial se guarda en el historial después de anular la fila Z.
         
         Args:
-            iteration_idx: Índice de la iteración
+            tableau: Tableau inicial (se modifica en el lugar)
+            basic_vars: Variables básicas por fila (se modifica en el lugar)
+            max_iterations: Límite de iteraciones entre todas las fases
             
         Returns:
-            String con resumen
+            Diccionario con la solución
         """
-        if iteration_idx >= len(self.iterations):
-            return "Iteración no válida"
+        # Reservar los buffers de trabajo una sola vez para todo el ciclo
+        self._prepare_workspace(tableau, basic_vars)
+        self._pricing_stats = None
+        self._perturbed = False
+        self.degenerate_pivots = 0
+        self.cycling_detected = False
+        iteration = 0
         
-        iter_data = self.iterations[iteration_idx]
+        primal_feasible = self._is_primal_feasible(tableau)
+        phase_one = not primal_feasible and bool(np.any(tableau[-1, :-1] < -self._pivot_tolerance))
+        if phase_one:
+            # Objetivo en cero: cualquier base es dual factible
+            tableau[-1, :] = 0.0
+            self._in_phase_one = True
         
-        summary = f"{'='*60}\n"
-        if iter_data['iteration'] == 0:
-            summary += "TABLA INICIAL\n"
-        else:
-            summary += f"ITERACIÓN {iter_data['iteration']}\n"
-        summary += f"{'='*60}\n\n"
+        # Guardar tableau inicial
+        self._save_iteration(tableau, basic_vars, -1, -1, 0)
         
-        if iter_data['pivot_row'] >= 0 and iter_data['pivot_col'] >= 0:
-            col_name = iter_data['col_names'][iter_data['pivot_col']]
-            row_name = iter_data['row_names'][iter_data['pivot_row']]
-            pivot_val = iter_data['tableau'][iter_data['pivot_row'], iter_data['pivot_col']]
+        if not primal_feasible:
+            status, iteration = self._dual_simplex(tableau, basic_vars, iteration, max_iterations)
+            self._in_phase_one = False
+            
+            if status != 'feasible':
+                return self._build_result(status, tableau, basic_vars, iteration)
+            
+            if phase_one and status == 'feasible':
+                self._restore_objective_row(tableau, basic_vars)
+                self._save_iteration(tableau, basic_vars, -1, -1, iteration, phase_change=True)
+        
+        status, iteration = self._primal_simplex(tableau, basic_vars, iteration, max_iterations)
+        
+        if status in STOP_STATUSES:
+            if self._perturbed:
+                self._remove_perturbation(tableau, basic_vars)
+            return self._build_result(status, tableau, basic_vars, iteration)
+        
+        if self._perturbed:
+            # Volver a los lados derechos originales y limpiar con el dual si hace falta
+            self._remove_perturbation(tableau, basic_vars)
+            self._save_iteration(tableau, basic_vars, -1, -1, iteration, perturbation=True)
+            if status == 'optimal' and not self._is_primal_feasible(tableau):
+                status, iteration = self._dual_simplex(tableau, basic_vars, iteration, max_iterations)
+                if status != 'feasible':
+                    return self._build_result(status, tableau, basic_vars, iteration)
+            if status in ('optimal', 'feasible'):
+                status, iteration = self._primal_simplex(tableau, basic_vars, iteration,
+                                                         max_iterations, allow_perturbation=False)
+        
+        return self._build_result(status, tableau, basic_vars, iteration)
+    
+    def _primal_simplex(self, tableau: np.ndarray, basic_vars: List[int],
+                        iteration: int, max_iterations: int,
+                        allow_perturbation: bool = True) -> Tuple[str, int]:
+        """
+        Iteraciones del Simplex primal con variables acotadas
+        
+        La columna entrante la elige la regla de precios configurada; el
+        tiempo del ciclo queda en _pricing_stats. Tras cada pivoteo
+        degenerado se guarda un hash de la base; si una base se repite sin
+        que Z haya mejorado hay un ciclo y se activa la protección elegida
+        en solve: perturbación acotada de los lados derechos (tipo EXPAND)
+        o desempate lexicográfico de la prueba del cociente. Si el ciclo
+        persiste se termina con la regla de Bland.
+        
+        Args:
+            tableau: Tableau primal factible (se modifica en el lugar)
+            basic_vars: Variables básicas por fila
+            iteration: Número de iteración inicial
+            max_iterations: Límite de iteraciones
+            allow_perturbation: Si se puede perturbar (falso al limpiar una
+                perturbación anterior)
+            
+        Returns:
+            Tuple con (estado, número de iteración final)
+        """
+        pricing = self._pricing
+        pricing.reset(tableau, basic_vars)
+        first_iteration = iteration
+        start_time = time.perf_counter()
+        status = 'optimal'
+        tie_rule = 'index' if pricing.lowest_index_ties else None
+        fallback = BlandPricing(pricing.tolerance)
+        visited = set()
+        
+        control = self._control
+        while iteration < max_iterations:
+            if control is not None:
+                stop = control.check(iteration, tableau[-1, -1])
+                if stop is not None:
+                    status = stop
+                    break
+            
+            # Seleccionar columna pivote según la regla de precios
+            pivot_col = fallback.select(tableau) if tie_rule == 'bland' else pricing.select(tableau)
+            
+            # Verificar si es óptimo (ningún costo reducido negativo)
+            if pivot_col < 0:
+                # Solución óptima encontrada
+                break
+            
+            # Seleccionar fila pivote (prueba del cociente para variables acotadas)
+            pivot_row, min_ratio, leaves_at_upper = self._ratio_test(tableau, pivot_col)
+            if pivot_row >= 0 and tie_rule == 'lexicographic':
+                pivot_row, leaves_at_upper = self._lexicographic_row(tableau, pivot_col, min_ratio)
+            elif pivot_row >= 0 and tie_rule is not None:
+                pivot_row, leaves_at_upper = self._lowest_index_row(basic_vars, min_ratio)
+            
+            # La variable entrante llega antes a su propia cota superior
+            entering_upper = self.column_upper[pivot_col]
+            if entering_upper <= min_ratio:
+                if not np.isfinite(entering_upper):
+                    # Verificar factibilidad (problema no acotado)
+                    status = 'unbounded'
+                    break
+                
+                # Cambio de cota: la variable pasa a su cota opuesta sin pivotear
+                self._complement_column(tableau, pivot_col)
+                iteration += 1
+                self._save_iteration(tableau, basic_vars, -1, pivot_col, iteration)
+                step = entering_upper
+            else:
+                # Realizar operación de pivoteo
+                leaving_var = basic_vars[pivot_row]
+                pivot_element = tableau[pivot_row, pivot_col]
+                pricing.update(tableau, basic_vars, pivot_row, pivot_col)
+                self._pivot(tableau, pivot_row, pivot_col)
+                
+                # Actualizar variable básica
+                basic_vars[pivot_row] = pivot_col
+                self._set_basic_upper(pivot_row, pivot_col)
+                
+                # La variable que sale en su cota superior queda complementada
+                if leaves_at_upper:
+                    self._complement_column(tableau, leaving_var)
+                
+                # Guardar iteración
+                iteration += 1
+                self._save_iteration(tableau, basic_vars, pivot_row, pivot_col, iteration,
+                                     leaving_var, pivot_element, leaves_at_upper)
+                step = min_ratio
+            
+            # Detección de ciclos: solo se revisan los pasos degenerados
+            if step > 1e-12:
+                visited.clear()
+                continue
+            self.degenerate_pivots += 1
+            key = self._basis_key(basic_vars)
+            if key in visited:
+                self.cycling_detected = True
+                visited.clear()
+                if allow_perturbation and self._anti_cycling == 'perturbation' and not self._perturbed:
+                    self._perturb(tableau)
+                    self._save_iteration(tableau, basic_vars, -1, -1, iteration, perturbation=True)
+                elif self._anti_cycling == 'lexicographic' and tie_rule is None:
+                    tie_rule = 'lexicographic'
+                elif self._anti_cycling != 'none':
+                    tie_rule = 'bland'
+            visited.add(key)
+        else:
+            # Límite de iteraciones: solo es óptimo si ya no hay columna
+            # entrante. Se mira la fila Z directamente: select movería el
+            # cursor de los precios parciales y contaría columnas de más
+            if np.any(tableau[-1, :-1] < -pricing.tolerance):
+                status = 'limit'
+        
+        pricing.columns_scanned += fallback.columns_scanned
+        self._pricing_stats = pricing_stats(pricing, iteration - first_iteration,
+                                            time.perf_counter() - start_time)
+        return status, iteration
+    
+    def _basis_key(self, basic_vars: List[int]) -> int:
+        """
+        Hash de la base actual (variables básicas y columnas complementadas)
+        
+        Args:
+            basic_vars: Variables básicas por fila
+            
+        Returns:
+            Hash que identifica la base
+        """
+        basis = np.sort(np.asarray(basic_vars, dtype=np.int64))
+        return hash(basis.tobytes() + np.packbits(self.complemented).tobytes())
+    
+    def _lexicographic_row(self, tableau: np.ndarray, pivot_col: int,
+                           min_ratio: float) -> Tuple[int, bool]:
+        """
+        Desempatar la prueba del cociente con la regla lexicográfica
+        
+        Entre las filas empatadas se elige la de menor vector
+        (fila de B^-1) / a_iq, comparado columna por columna.
+        
+        Args:
+            tableau: Tableau actual
+            pivot_col: Columna entrante
+            min_ratio: Cociente mínimo de la última prueba
+            
+        Returns:
+            Tuple con (fila_pivote, sale_en_cota_superior)
+        """
+        n_vars = len(self.variable_names)
+        n_rows = len(self._ratios)
+        rows = np.flatnonzero(self._ratios <= min_ratio + 1e-12)
+        keys = tableau[rows, n_vars:n_vars + n_rows] / tableau[rows, pivot_col][:, np.newaxis]
+        
+        for j in range(n_rows):
+            if len(rows) == 1:
+                break
+            best = keys[:, j].min()
+            keep = keys[:, j] <= best + 1e-12
+            rows = rows[keep]
+            keys = keys[keep]
+        
+        row = int(rows[0])
+        return row, bool(self._upper_rows[row])
+    
+    def _perturb(self, tableau: np.ndarray):
+        """
+        Perturbación acotada de las variables básicas degeneradas
+        
+        Las básicas en 0 se alejan de su cota inferior y las básicas en su
+        cota superior se alejan de ella en un valor aleatorio de [tau, 2tau]
+        (como en EXPAND). Se deshace con _remove_perturbation.
+        
+        Args:
+            tableau: Tableau a modificar en el lugar
+        """
+        rhs = tableau[:-1, -1]
+        tau = 1e-7 * max(1.0, float(np.max(np.abs(rhs), initial=0.0)))
+        delta = tau * (1.0 + np.random.default_rng(0).random(len(rhs)))
+        at_lower = rhs <= 1e-9
+        at_upper = (rhs >= self._basic_upper - 1e-9) & (self._basic_upper > 2 * delta)
+        rhs[at_lower] += delta[at_lower]
+        rhs[at_upper] -= delta[at_upper]
+        self._perturbed = True
+    
+    def _remove_perturbation(self, tableau: np.ndarray, basic_vars: List[int]):
+        """
+        Recalcular los lados derechos y la fila Z con los datos originales
+        
+        Las columnas de holgura del tableau son B^-1, así que x_B = B^-1 b'
+        con b' el lado derecho ya trasladado por las cotas.
+        
+        Args:
+            tableau: Tableau a modificar en el lugar
+            basic_vars: Variables básicas por fila
+        """
+        n_vars = len(self.variable_names)
+        n_rows = len(basic_vars)
+        A = self._problem['A']
+        shifted = self._problem['lower'].copy()
+        comp = self.complemented[:n_vars]
+        shifted[comp] += self.column_upper[:n_vars][comp]
+        rhs = self._problem['b'] - A @ shifted
+        tableau[:-1, -1] = tableau[:-1, n_vars:n_vars + n_rows] @ rhs
+        self._restore_objective_row(tableau, basic_vars)
+        self._perturbed = False
+    
+    def _lowest_index_row(self, basic_vars: List[int], min_ratio: float) -> Tuple[int, bool]:
+        """
+        Desempatar la prueba del cociente por la variable básica de menor índice
+        
+        Args:
+            basic_vars: Variables básicas por fila
+            min_ratio: Cociente mínimo de la última prueba
+            
+        Returns:
+            Tuple con (fila_pivote, sale_en_cota_superior)
+        """
+        ties = np.flatnonzero(self._ratios <= min_ratio + 1e-12)
+        row = int(ties[np.argmin(np.asarray(basic_vars)[ties])])
+        return row, bool(self._upper_rows[row])
+    
+    def _dual_simplex(self, tableau: np.ndarray, basic_vars: List[int],
+                      iteration: int, max_iterations: int) -> Tuple[str, int]:
+        """
+        Iteraciones del Simplex dual hasta recuperar la factibilidad primal
+        
+        En cada paso sale la variable básica más infactible: si está bajo
+        cero sale a su cota inferior; si supera su cota superior primero se
+        complementa (la fila cambia de signo) y luego sale. La columna
+        entrante mantiene la fila Z no negativa (prueba del cociente dual).
+        
+        Args:
+            tableau: Tableau dual factible (se modifica en el lugar)
+            basic_vars: Variables básicas por fila
+            iteration: Número de iteración inicial
+            max_iterations: Límite de iteraciones
+            
+        Returns:
+            Tuple con ('feasible' | 'infeasible' | 'limit' | 'cancelled' |
+            'time_limit', número de iteración)
+        """
+        n_rows = len(basic_vars)
+        control = self._control
+        
+        while iteration < max_iterations:
+            if n_rows == 0:
+                return 'feasible', iteration
+            
+            rhs = tableau[:-1, -1]
+            below = -rhs
+            above = rhs - self._basic_upper
+            violation = np.maximum(below, above)
+            pivot_row = int(np.argmax(violation))
+            if violation[pivot_row] <= self._feasibility_tolerance:
+                return 'feasible', iteration
+            if control is not None:
+                stop = control.check(iteration, tableau[-1, -1])
+                if stop is not None:
+                    return stop, iteration
+            
+            # Variable básica por encima de su cota: se complementa y la fila cambia de signo
+            row_complement = bool(above[pivot_row] > below[pivot_row])
+            if row_complement:
+                self._complement_column(tableau, basic_vars[pivot_row])
+                tableau[pivot_row] *= -1
+            
+            pivot_col = self._dual_ratio_test(tableau, pivot_row)
+            if pivot_col < 0:
+                return 'infeasible', iteration
+            
+            leaving_var = basic_vars[pivot_row]
+            pivot_element = tableau[pivot_row, pivot_col]
+            self._pivot(tableau, pivot_row, pivot_col)
+            basic_vars[pivot_row] = pivot_col
+            self._set_basic_upper(pivot_row, pivot_col)
+            
+            iteration += 1
+            self._save_iteration(tableau, basic_vars, pivot_row, pivot_col, iteration,
+                                 leaving_var, pivot_element, row_complement=row_complement)
+        
+        return 'limit', iteration
+    
+    def _dual_ratio_test(self, tableau: np.ndarray, pivot_row: int) -> int:
+        """
+        Prueba del cociente del Simplex dual sobre una fila con rhs negativo
+        
+        Entre las columnas empatadas en el cociente mínimo se elige la de
+        mayor coeficiente en valor absoluto (más estable numéricamente).
+        
+        Args:
+            tableau: Tableau actual
+            pivot_row: Fila de la variable que sale
+            
+        Returns:
+            Columna entrante o -1 si la fila demuestra que no hay solución factible
+        """
+        row = tableau[pivot_row, :-1]
+        candidates = np.flatnonzero(row < -self._pivot_tolerance)
+        if len(candidates) == 0:
+            return -1
+        
+        ratios = np.maximum(tableau[-1, candidates], 0.0) / -row[candidates]
+        ties = candidates[ratios <= ratios.min() + 1e-12]
+        return int(ties[np.argmax(np.abs(row[ties]))])
+    
+    def _is_primal_feasible(self, tableau: np.ndarray) -> bool:
+        """
+        Verificar que las variables básicas estén dentro de sus cotas
+        
+        Args:
+            tableau: Tableau actual
+            
+        Returns:
+            True si 0 <= x_B <= u_B
+        """
+        rhs = tableau[:-1, -1]
+        tol = self._feasibility_tolerance
+        return bool(np.all(rhs >= -tol) and np.all(rhs <= self._basic_upper + tol))
+    
+    def _install_basis(self, tableau: np.ndarray, basic_vars: List[int], basis: List[int]):
+        """
+        Llevar el tableau inicial (base de holguras) a otra base
+
+        En lugar de pivotear columna por columna se multiplica por B^-1 con
+        una sola factorización, y la fila Z se recalcula para la base nueva.
+
+        Args:
+            tableau: Tableau inicial (se modifica en el lugar)
+            basic_vars: Variables básicas por fila (se modifica en el lugar)
+            basis: Variable básica de cada fila en la base nueva
+        """
+        n_rows = len(basic_vars)
+        basis = [int(j) for j in basis]
+        B = tableau[:n_rows, basis]
+        tableau[:n_rows] = np.linalg.solve(B, tableau[:n_rows])
+        tableau[:n_rows, basis] = np.eye(n_rows)
+        basic_vars[:] = basis
+        tableau[-1] = self._objective_row(tableau, basic_vars, self._problem['c'])
+
+    def _warm_start(self, tableau: np.ndarray, basic_vars: List[int], basis) -> Dict:
+        """
+        Llevar el tableau inicial a una base guardada, reparándola si hace falta
+        
+        Si el problema cambió de tamaño, las columnas se ubican por su papel
+        (estructural j o holgura de la fila i) y se descartan las que ya no
+        existen. Las columnas básicas se aceptan en orden mientras sean
+        linealmente independientes y la base se completa con holguras; las
+        variables en cota superior se complementan si siguen siendo no
+        básicas y acotadas. La factibilidad la recupera después _run_simplex.
+        
+        Args:
+            tableau: Tableau inicial (se modifica en el lugar)
+            basic_vars: Variables básicas por fila (se modifica en el lugar)
+            basis: Diccionario de base o ruta de un archivo de save_basis
+            
+        Returns:
+            Diccionario con 'requested', 'accepted', 'at_upper' y 'repaired'
+        """
+        if isinstance(basis, (str, os.PathLike)):
+            basis = load_basis(basis)
+        n_vars = len(self.variable_names)
+        n_rows = len(basic_vars)
+        requested, at_upper = self._map_basis(basis, n_rows)
+        
+        # Variables no básicas en su cota superior: x = u - x'
+        for col in at_upper:
+            tableau[:, -1] -= self.column_upper[col] * tableau[:, col]
+            tableau[:, col] *= -1
+            self.complemented[col] = True
+        
+        order = requested + list(range(n_vars, n_vars + n_rows))
+        chosen = self._independent_columns(tableau[:n_rows, :-1], order, n_rows)
+        self._install_basis(tableau, basic_vars, chosen)
+        accepted = len(set(chosen) & set(requested))
+        return {
+            'requested': len(basis['basic_vars']),
+            'accepted': accepted,
+            'at_upper': len(at_upper),
+            'repaired': accepted < len(basis['basic_vars'])
+        }
+    
+    def _map_basis(self, basis: Dict, n_rows: int) -> Tuple[List[int], List[int]]:
+        """
+        Ubicar las columnas de una base guardada en el problema actual
+        
+        Las columnas se ubican por su papel (estructural j o holgura de la
+        fila i), así que la base sirve aunque el problema haya cambiado de
+        tamaño; las que ya no existen se descartan. De 'at_upper' quedan
+        solo las estructurales no básicas con cota superior finita.
+        
+        Args:
+            basis: Diccionario de base (current_basis o result['basis'])
+            n_rows: Número de restricciones del problema actual
+            
+        Returns:
+            Tuple con (variables básicas pedidas, variables en cota superior)
+        """
+        n_vars = len(self.variable_names)
+        old_vars = basis.get('n_vars', -1)
+        if old_vars < 0:
+            old_vars = n_vars
+        
+        def remap(j: int) -> int:
+            j = int(j)
+            if j < old_vars:
+                return j if j < n_vars else -1
+            row = j - old_vars
+            return n_vars + row if row < n_rows else -1
+        
+        requested = [j for j in dict.fromkeys(remap(j) for j in basis['basic_vars']) if j >= 0]
+        at_upper = [j for j in dict.fromkeys(remap(j) for j in basis.get('at_upper', []))
+                    if 0 <= j < n_vars and j not in requested and np.isfinite(self.column_upper[j])]
+        return requested, at_upper
+    
+    @staticmethod
+    def _independent_columns(matrix: np.ndarray, order: List[int], count: int) -> List[int]:
+        """
+        Elegir columnas linealmente independientes en un orden de preferencia
+        
+        Gram-Schmidt con reortogonalización: cada columna se acepta si su
+        componente fuera del espacio de las ya elegidas no es despreciable.
+        
+        Args:
+            matrix: Matriz cuyas columnas se eligen (m x N)
+            order: Índices de columna en orden de preferencia
+            count: Número de columnas a elegir
+            
+        Returns:
+            Índices elegidos (a lo sumo count)
+        """
+        Q = np.zeros((matrix.shape[0], count))
+        chosen = []
+        for j in order:
+            column = matrix[:, j].astype(float)
+            norm = np.linalg.norm(column)
+            if norm == 0.0:
+                continue
+            k = len(chosen)
+            v = column - Q[:, :k] @ (Q[:, :k].T @ column)
+            v -= Q[:, :k] @ (Q[:, :k].T @ v)
+            residual = np.linalg.norm(v)
+            if residual > 1e-7 * norm:
+                Q[:, k] = v / residual
+                chosen.append(int(j))
+                if len(chosen) == count:
+                    break
+        return chosen
+    
+    def _restore_objective_row(self, tableau: np.ndarray, basic_vars: List[int]):
+        """
+        Reconstruir la fila Z para la base actual (al terminar la fase 1)
+        
+        Args:
+            tableau: Tableau a modificar en el lugar
+            basic_vars: Variables básicas por fila
+        """
+        tableau[-1] = self._objective_row(tableau, basic_vars, self._problem['c'])
+    
+    def _objective_row(self, tableau: np.ndarray, basic_vars: List[int], c: np.ndarray) -> np.ndarray:
+        """
+        Calcular la fila Z de un vector de costos para la base actual
+        
+        Args:
+            tableau: Tableau actual (solo se leen las filas de restricciones)
+            basic_vars: Variables básicas por fila
+            c: Coeficientes de la función objetivo
+            
+        Returns:
+            Fila Z con costos reducidos y valor objetivo en la última posición
+        """
+        z_row = np.zeros(tableau.shape[1])
+        z_row[:len(c)] = -c
+        z_row[-1] = c @ self._problem['lower']
+        
+        # Columnas complementadas: x = u - x'
+        comp = np.flatnonzero(self.complemented)
+        z_row[-1] -= z_row[comp] @ self.column_upper[comp]
+        z_row[comp] *= -1
+        
+        # Anular los costos de las variables básicas
+        z_row -= z_row[basic_vars] @ tableau[:-1]
+        return z_row
+    
+    def _extract_solution(self, tableau: np.ndarray, basic_vars: List[int]) -> np.ndarray:
+        """
+        Obtener los valores de las variables de decisión desde el tableau
+        
+        Args:
+            tableau: Tableau actual
+            basic_vars: Variables básicas por fila
+            
+        Returns:
+            Valores de las variables originales (con cotas y complementos deshechos)
+        """
+        values = np.zeros(tableau.shape[1] - 1)
+        values[basic_vars] = tableau[:-1, -1]
+        values = np.where(self.complemented, self.column_upper - values, values)
+        return self._problem['lower'] + values[:len(self.variable_names)]
+    
+    def _refine_solution(self, result: Dict, max_steps: int = 5, tolerance: float = 1e-9) -> Dict:
+        """
+        Refinamiento iterativo en float64 de la base final de un solve en float32
+        
+        Las columnas de holgura del tableau final son B^-1 en float32. Los
+        residuos b' - B x_B y c_B - B^T y se calculan en float64 con los datos
+        originales y se corrigen con ese B^-1 (refinamiento de precisión
+        mixta) hasta que son menores que la tolerancia. Si la base refinada
+        es primal y dual factible, el tableau se pasa a float64 con la
+        columna del lado derecho y la fila Z pulidas y se rearma el
+        resultado; si no, hay que resolver de nuevo en float64.
+        
+        Args:
+            result: Resultado del Simplex en float32
+            max_steps: Máximo de pasos de refinamiento
+            tolerance: Residuo relativo aceptado en float64
+            
+        Returns:
+            Diccionario con 'dtype', 'refinement_steps', 'primal_residual',
+            'dual_residual' y 'fallback' (True si hay que resolver en float64)
+        """
+        precision = {'dtype': str(self.tableau.dtype), 'refinement_steps': 0,
+                     'primal_residual': float('nan'), 'dual_residual': float('nan'),
+                     'fallback': True}
+        if result['status'] != 'optimal':
+            # Un estado distinto de óptimo se confirma en float64
+            return precision
+        
+        tableau = self.tableau
+        basic_vars = np.asarray(self.basic_vars, dtype=int)
+        n_vars = len(self.variable_names)
+        n_rows = len(basic_vars)
+        problem = self._problem
+        
+        # Sistema del tableau en float64: [A | I] con columnas complementadas cambiadas de signo
+        full = np.hstack([problem['A'], np.eye(n_rows)])
+        sign = np.where(self.complemented, -1.0, 1.0)
+        full *= sign
+        costs = np.concatenate([problem['c'], np.zeros(n_rows)]) * sign
+        comp = np.flatnonzero(self.complemented)
+        rhs = problem['b'] - problem['A'] @ problem['lower'] + full[:, comp] @ self.column_upper[comp]
+        
+        B = full[:, basic_vars]
+        B_inv = tableau[:-1, n_vars:n_vars + n_rows].astype(np.float64)
+        x_B = tableau[:-1, -1].astype(np.float64)
+        y = tableau[-1, n_vars:n_vars + n_rows].astype(np.float64)
+        rhs_scale = 1.0 + np.max(np.abs(rhs), initial=0.0)
+        cost_scale = 1.0 + np.max(np.abs(costs), initial=0.0)
+        for step in range(max_steps + 1):
+            primal = np.max(np.abs(rhs - B @ x_B), initial=0.0) / rhs_scale
+            dual = np.max(np.abs(costs[basic_vars] - B.T @ y), initial=0.0) / cost_scale
+            if (primal <= tolerance and dual <= tolerance) or step == max_steps:
+                break
+            x_B += B_inv @ (rhs - B @ x_B)
+            y += B_inv.T @ (costs[basic_vars] - B.T @ y)
+        precision.update({'refinement_steps': step, 'primal_residual': float(primal),
+                          'dual_residual': float(dual)})
+        
+        # La base debe seguir siendo factible y óptima con los valores refinados
+        reduced = full.T @ y - costs
+        reduced[basic_vars] = 0.0
+        upper = self.column_upper[basic_vars]
+        feasible = bool(np.all(x_B >= -tolerance * rhs_scale)
+                        and np.all(x_B <= upper + tolerance * rhs_scale))
+        optimal = bool(np.all(reduced >= -tolerance * cost_scale))
+        if primal > tolerance or dual > tolerance or not feasible or not optimal:
+            return precision
+        
+        refined = tableau.astype(np.float64)
+        refined[:-1, -1] = x_B
+        refined[-1, :-1] = reduced
+        refined[-1, -1] = (problem['c'] @ problem['lower']
+                           + np.concatenate([problem['c'], np.zeros(n_rows)])[comp] @ self.column_upper[comp]
+                           + costs[basic_vars] @ x_B)
+        self._pivot_tolerance, self._feasibility_tolerance = TOLERANCES[refined.dtype]
+        result.update(self._build_result('optimal', refined, list(self.basic_vars),
+                                         result['iteration_count']))
+        precision['fallback'] = False
+        return precision
+    
+    def current_basis(self) -> Dict:
+        """
+        Base actual: variables básicas por fila y variables no básicas en su
+        cota superior (columnas complementadas)
+        
+        Returns:
+            Diccionario con 'basic_vars' y 'at_upper' (índices de columna) y
+            la forma del problema en 'n_vars' y 'n_constraints'
+        """
+        at_upper = self.complemented.copy()
+        at_upper[self.basic_vars] = False
+        return {
+            'basic_vars': [int(j) for j in self.basic_vars],
+            'at_upper': [int(j) for j in np.flatnonzero(at_upper)],
+            'n_vars': len(self.variable_names),
+            'n_constraints': len(self.basic_vars)
+        }
+    
+    def _build_result(self, status: str, tableau: np.ndarray, basic_vars: List[int],
+                      iteration: int) -> Dict:
+        """
+        Armar el diccionario de resultado a partir del tableau final
+        
+        Args:
+            status: Estado final ('optimal', 'unbounded', 'infeasible', 'limit',
+                'cancelled' o 'time_limit')
+            tableau: Tableau final
+            basic_vars: Variables básicas por fila
+            iteration: Número de iteraciones realizadas
+            
+        Returns:
+            Diccionario con la solución
+        """
+        self.tableau = tableau
+        self.basic_vars = basic_vars
+        
+        # Datos comunes a todos los estados
+        result = {
+            'iterations': self.iterations,
+            'iteration_count': iteration,
+            'pricing_stats': self._pricing_stats,
+            'degenerate_pivots': self.degenerate_pivots,
+            'cycling_detected': self.cycling_detected
+        }
+        
+        messages = {
+            'unbounded': ('unbounded', 'El problema no está acotado'),
+            'infeasible': ('infeasible', 'El problema no tiene solución factible'),
+            'limit': ('iteration_limit', 'Se alcanzó el número máximo de iteraciones sin llegar al óptimo')
+        }
+        if status in messages:
+            result['status'], result['message'] = messages[status]
+            return result
+        
+        if status in STOP_STATUSES:
+            # Resolución interrumpida: la última base y, si es factible, su solución
+            result['status'], result['message'] = status, STOP_MESSAGES[status]
+            result['basis'] = self.current_basis()
+            if not self._in_phase_one and self._is_primal_feasible(tableau):
+                result['solution'] = self._extract_solution(tableau, basic_vars)
+                result['objective'] = float(tableau[-1, -1])
+                result['variable_names'] = self.variable_names
+            return result
+        
+        # Extraer solución
+        solution = self._extract_solution(tableau, basic_vars)
+        
+        # Valor óptimo
+        z_value = tableau[-1, -1]
+        
+        self.optimal_solution = solution
+        self.optimal_value = z_value
+        
+        result.update({
+            'status': 'optimal',
+            'solution': solution,
+            'optimal_value': z_value,
+            'variable_names': self.variable_names,
+            'sensitivity': self.sensitivity_report()
+        })
+        return result
+    
+    def sensitivity_report(self) -> Dict:
+        """
+        Análisis de sensibilidad a partir del tableau óptimo
+        
+        Todo se obtiene de la base final sin volver a resolver: los precios
+        sombra son la fila Z en las columnas de holgura, los costos
+        reducidos la fila Z en las columnas estructurales, y los rangos
+        salen de cocientes entre la fila Z (costos) o la columna B^-1 e_i
+        (lados derechos) y los valores básicos. Los rangos indican hasta
+        dónde puede moverse un solo dato sin que cambie la base óptima.
+        
+        Returns:
+            Diccionario con 'shadow_prices' (m,), 'reduced_costs' (n,),
+            'objective_ranges' (n, 2) y 'rhs_ranges' (m, 2) con los límites
+            [inferior, superior] de cada c_j y b_i, y 'basic' (n,) que
+            indica las variables básicas
+        """
+        self._require_previous_solve()
+        tableau = self.tableau
+        n_vars = len(self.variable_names)
+        n_rows = len(self.basic_vars)
+        basic_vars = np.asarray(self.basic_vars, dtype=int)
+        z_row = tableau[-1, :-1]
+        body = tableau[:-1, :-1]
+        rhs = tableau[:-1, -1]
+        comp = self.complemented
+        c = self._problem['c']
+        b = self._problem['b']
+        
+        # Signo de cada columna respecto de la variable original (x' = u - x)
+        sign = np.where(comp, -1.0, 1.0)
+        
+        is_basic = np.zeros(len(z_row), dtype=bool)
+        is_basic[basic_vars] = True
+        
+        shadow_prices = z_row[n_vars:n_vars + n_rows].copy()
+        reduced_costs = -sign[:n_vars] * z_row[:n_vars]
+        reduced_costs[is_basic[:n_vars]] = 0.0
+        
+        # Costos de variables no básicas: solo puede moverse hacia el lado
+        # que las vuelve atractivas, hasta agotar su costo reducido
+        objective_ranges = np.empty((n_vars, 2))
+        objective_ranges[:, 0] = np.where(comp[:n_vars], c - z_row[:n_vars], -np.inf)
+        objective_ranges[:, 1] = np.where(comp[:n_vars], np.inf, c + z_row[:n_vars])
+        
+        # Costos de variables básicas: c_j + d cambia la fila Z en d veces su
+        # fila; cada columna no básica debe seguir con costo reducido >= 0
+        structural_rows = np.flatnonzero(basic_vars < n_vars)
+        if len(structural_rows) > 0:
+            nonbasic = np.flatnonzero(~is_basic)
+            rows = body[np.ix_(structural_rows, nonbasic)]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                ratios = -z_row[nonbasic] / rows
+            low = np.max(np.where(rows > 1e-10, ratios, -np.inf), axis=1, initial=-np.inf)
+            high = np.min(np.where(rows < -1e-10, ratios, np.inf), axis=1, initial=np.inf)
+            
+            # Una variable básica complementada tiene costo -c_j en el tableau
+            var_idx = basic_vars[structural_rows]
+            var_sign = sign[var_idx]
+            low, high = np.where(var_sign > 0, low, -high), np.where(var_sign > 0, high, -low)
+            objective_ranges[var_idx, 0] = c[var_idx] + low
+            objective_ranges[var_idx, 1] = c[var_idx] + high
+        
+        # Lados derechos: x_B + t * B^-1 e_i debe quedar en [0, u_B]
+        rhs_ranges = np.empty((n_rows, 2))
+        if n_rows > 0:
+            beta = body[:, n_vars:n_vars + n_rows]
+            room_down = rhs[:, np.newaxis]
+            room_up = (self.column_upper[basic_vars] - rhs)[:, np.newaxis]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                low = np.where(beta > 1e-10, -room_down / beta,
+                               np.where(beta < -1e-10, room_up / beta, -np.inf))
+                high = np.where(beta > 1e-10, room_up / beta,
+                                np.where(beta < -1e-10, -room_down / beta, np.inf))
+            rhs_ranges[:, 0] = b + np.max(low, axis=0)
+            rhs_ranges[:, 1] = b + np.min(high, axis=0)
+        
+        return {
+            'shadow_prices': shadow_prices,
+            'reduced_costs': reduced_costs,
+            'objective_ranges': objective_ranges,
+            'rhs_ranges': rhs_ranges,
+            'basic': is_basic[:n_vars].copy()
+        }
+    
+    def parametric_rhs(self, c: np.ndarray, A: np.ndarray, b: np.ndarray, direction: np.ndarray,
+                       lambda_end: float, lambda_start: float = 0.0,
+                       lower: Optional[np.ndarray] = None, upper: Optional[np.ndarray] = None,
+                       max_iterations: int = 100) -> Dict:
+        """
+        Curva del valor óptimo para b(λ) = b + λ·d con λ entre dos valores
+        
+        Se resuelve una sola vez en λ inicial y luego se avanza sobre λ: la
+        solución básica cambia linealmente (B^-1 d) hasta que una variable
+        básica toca una de sus cotas; en ese punto de quiebre un pivoteo del
+        Simplex dual cambia la base y se continúa. El valor óptimo es lineal
+        por tramos con pendiente y·d entre quiebres.
+        
+        Args:
+            c: Coeficientes de la función objetivo
+            A: Matriz de restricciones
+            b: Lado derecho base
+            direction: Dirección d de cambio del lado derecho
+            lambda_end: Valor final del parámetro
+            lambda_start: Valor inicial del parámetro
+            lower: Cotas inferiores de las variables (por defecto 0)
+            upper: Cotas superiores de las variables (por defecto infinito)
+            max_iterations: Límite de pivoteos durante el recorrido
+            
+        Returns:
+            Diccionario con 'breakpoints' (valores de λ), 'values' (Z en cada
+            quiebre), 'slopes' (pendiente de cada tramo), 'solutions' (x en
+            cada quiebre) y 'pivots'; 'status' es 'optimal' si se llegó a
+            lambda_end o el motivo por el que se detuvo el recorrido
+        """
+        b = np.asarray(b, dtype=float)
+        direction = np.asarray(direction, dtype=float)
+        result = self.solve(c, A, b + lambda_start * direction, lower, upper, history='none')
+        if result['status'] != 'optimal':
+            return result
+        
+        tableau = self.tableau
+        basic_vars = self.basic_vars
+        n_vars = len(self.variable_names)
+        n_rows = len(basic_vars)
+        sign = 1.0 if lambda_end >= lambda_start else -1.0
+        step_direction = sign * direction
+        
+        def rhs_gradient():
+            # Derivada del lado derecho (y de Z) respecto de λ: B^-1 d
+            return tableau[:, n_vars:n_vars + n_rows] @ step_direction
+        
+        return self._parametric_walk(tableau, basic_vars, lambda_start, lambda_end, sign,
+                                     rhs_gradient, self._rhs_step, self._dual_pivot,
+                                     max_iterations, 'b', b, direction)
+    
+    def parametric_cost(self, c: np.ndarray, A: np.ndarray, b: np.ndarray, direction: np.ndarray,
+                        lambda_end: float, lambda_start: float = 0.0,
+                        lower: Optional[np.ndarray] = None, upper: Optional[np.ndarray] = None,
+                        max_iterations: int = 100) -> Dict:
+        """
+        Curva del valor óptimo para c(λ) = c + λ·e con λ entre dos valores
+        
+        Se resuelve una sola vez en λ inicial; los costos reducidos cambian
+        linealmente con λ hasta que uno se anula. En ese punto de quiebre la
+        columna correspondiente entra con un pivoteo del Simplex primal. El
+        valor óptimo es lineal por tramos con pendiente e·x entre quiebres.
+        
+        Args:
+            c: Coeficientes base de la función objetivo
+            A: Matriz de restricciones
+            b: Valores del lado derecho
+            direction: Dirección e de cambio de los costos
+            lambda_end: Valor final del parámetro
+            lambda_start: Valor inicial del parámetro
+            lower: Cotas inferiores de las variables (por defecto 0)
+            upper: Cotas superiores de las variables (por defecto infinito)
+            max_iterations: Límite de pivoteos durante el recorrido
+            
+        Returns:
+            Diccionario con el mismo formato que parametric_rhs
+        """
+        c = np.asarray(c, dtype=float)
+        direction = np.asarray(direction, dtype=float)
+        result = self.solve(c + lambda_start * direction, A, b, lower, upper, history='none')
+        if result['status'] != 'optimal':
+            return result
+        
+        tableau = self.tableau
+        basic_vars = self.basic_vars
+        sign = 1.0 if lambda_end >= lambda_start else -1.0
+        step_direction = sign * direction
+        
+        def cost_gradient():
+            # Derivada de la fila Z respecto de λ para la base actual
+            return self._objective_row(tableau, basic_vars, step_direction)
+        
+        return self._parametric_walk(tableau, basic_vars, lambda_start, lambda_end, sign,
+                                     cost_gradient, self._cost_step, self._primal_pivot,
+                                     max_iterations, 'c', c, direction)
+    
+    def _parametric_walk(self, tableau: np.ndarray, basic_vars: List[int],
+                         lambda_start: float, lambda_end: float, sign: float,
+                         gradient_fn, step_fn, pivot_fn, max_iterations: int,
+                         data_key: str, base: np.ndarray, direction: np.ndarray) -> Dict:
+        """
+        Recorrido común del análisis paramétrico
+        
+        Args:
+            tableau: Tableau óptimo en λ inicial (se modifica en el lugar)
+            basic_vars: Variables básicas por fila
+            lambda_start: Valor inicial del parámetro
+            lambda_end: Valor final del parámetro
+            sign: Sentido del recorrido (+1 o -1)
+            gradient_fn: Derivada respecto de λ de la columna RHS ('b') o de
+                la fila Z ('c') para la base actual
+            step_fn: Paso máximo antes del próximo quiebre y fila o columna que lo causa
+            pivot_fn: Cambio de base en el quiebre; devuelve el estado o None
+            max_iterations: Límite de pivoteos
+            data_key: Dato del problema que depende de λ ('b' o 'c')
+            base: Valor del dato en λ = 0
+            direction: Dirección de cambio del dato
+            
+        Returns:
+            Diccionario con la curva del valor óptimo
+        """
+        current = lambda_start
+        breakpoints = [current]
+        values = [tableau[-1, -1]]
+        solutions = [self._extract_solution(tableau, basic_vars)]
+        target = tableau[:, -1] if data_key == 'b' else tableau[-1]
+        pivots = 0
+        status = 'optimal'
+        
+        while True:
+            gradient = gradient_fn()
+            remaining = abs(lambda_end - current)
+            step, index = step_fn(tableau, basic_vars, gradient)
+            step = min(step, remaining)
+            
+            target += step * gradient
+            current = lambda_end if step >= remaining else current + sign * step
+            
+            # Registrar el quiebre (los pasos degenerados no agregan puntos)
+            if step > 1e-12:
+                breakpoints.append(current)
+                values.append(tableau[-1, -1])
+                solutions.append(self._extract_solution(tableau, basic_vars))
+            if step >= remaining:
+                break
+            
+            if pivots >= max_iterations:
+                status = 'iteration_limit'
+                break
+            
+            pivot_status = pivot_fn(tableau, basic_vars, index, gradient)
+            pivots += 1
+            if pivot_status is not None:
+                status = pivot_status
+                break
+        
+        # El problema guardado queda en el último λ alcanzado
+        self._problem[data_key] = base + current * direction
+        
+        breakpoints = np.array(breakpoints)
+        values = np.array(values)
+        widths = np.diff(breakpoints)
+        slopes = np.divide(np.diff(values), widths, out=np.zeros_like(widths), where=widths != 0)
+        
+        messages = {
+            'optimal': 'Recorrido paramétrico completo',
+            'infeasible': f'El problema es infactible más allá de λ = {current:.6g}',
+            'unbounded': f'El problema no está acotado más allá de λ = {current:.6g}',
+            'iteration_limit': 'Se alcanzó el número máximo de iteraciones'
+        }
+        
+        return {
+            'status': status,
+            'message': messages[status],
+            'breakpoints': breakpoints,
+            'values': values,
+            'slopes': slopes,
+            'solutions': np.array(solutions),
+            'pivots': pivots,
+            'variable_names': self.variable_names
+        }
+    
+    def _rhs_step(self, tableau: np.ndarray, basic_vars: List[int],
+                  gradient: np.ndarray) -> Tuple[float, int]:
+        """
+        Paso máximo sobre λ antes de que una variable básica salga de sus cotas
+        
+        Args:
+            tableau: Tableau actual
+            basic_vars: Variables básicas por fila
+            gradient: Derivada de la columna RHS respecto de λ
+            
+        Returns:
+            Tuple con (paso, fila que limita o -1)
+        """
+        rhs = tableau[:-1, -1]
+        slope = gradient[:-1]
+        steps = np.full(len(rhs), np.inf)
+        np.divide(-rhs, slope, out=steps, where=slope < -1e-10)
+        np.divide(self._basic_upper - rhs, slope, out=steps, where=slope > 1e-10)
+        if len(steps) == 0:
+            return float('inf'), -1
+        row = int(np.argmin(steps))
+        return max(float(steps[row]), 0.0), row
+    
+    def _cost_step(self, tableau: np.ndarray, basic_vars: List[int],
+                   gradient: np.ndarray) -> Tuple[float, int]:
+        """
+        Paso máximo sobre λ antes de que un costo reducido se vuelva negativo
+        
+        Args:
+            tableau: Tableau actual
+            basic_vars: Variables básicas por fila
+            gradient: Derivada de la fila Z respecto de λ
+            
+        Returns:
+            Tuple con (paso, columna que limita o -1)
+        """
+        z_row = tableau[-1, :-1]
+        slope = gradient[:-1]
+        steps = np.full(len(z_row), np.inf)
+        np.divide(z_row, -slope, out=steps, where=slope < -1e-10)
+        steps[basic_vars] = np.inf
+        col = int(np.argmin(steps))
+        return max(float(steps[col]), 0.0), col
+    
+    def _dual_pivot(self, tableau: np.ndarray, basic_vars: List[int], pivot_row: int,
+                    gradient: np.ndarray) -> Optional[str]:
+        """
+        Pivoteo del Simplex dual en la fila que alcanzó una cota
+        
+        Args:
+            tableau: Tableau actual
+            basic_vars: Variables básicas por fila
+            pivot_row: Fila cuya variable básica sale
+            gradient: Derivada de la columna RHS respecto de λ
+            
+        Returns:
+            None si hubo pivoteo o 'infeasible' si no hay columna entrante
+        """
+        # Sube hasta su cota superior: complementar para que salga como en su cota inferior
+        if gradient[pivot_row] > 0:
+            self._complement_column(tableau, basic_vars[pivot_row])
+            tableau[pivot_row] *= -1
+        
+        # La fila queda con rhs = 0 y debe volverse negativa más allá del quiebre
+        pivot_col = self._dual_ratio_test(tableau, pivot_row)
+        if pivot_col < 0:
+            return 'infeasible'
+        self._pivot(tableau, pivot_row, pivot_col)
+        basic_vars[pivot_row] = pivot_col
+        self._set_basic_upper(pivot_row, pivot_col)
+        return None
+    
+    def _primal_pivot(self, tableau: np.ndarray, basic_vars: List[int], pivot_col: int,
+                      gradient: np.ndarray) -> Optional[str]:
+        """
+        Pivoteo del Simplex primal con la columna cuyo costo reducido se anuló
+        
+        Args:
+            tableau: Tableau actual
+            basic_vars: Variables básicas por fila
+            pivot_col: Columna entrante
+            gradient: Derivada de la fila Z respecto de λ (no se usa)
+            
+        Returns:
+            None si hubo pivoteo o cambio de cota, 'unbounded' si la columna no tiene límite
+        """
+        pivot_row, min_ratio, leaves_at_upper = self._ratio_test(tableau, pivot_col)
+        entering_upper = self.column_upper[pivot_col]
+        if entering_upper <= min_ratio:
+            if not np.isfinite(entering_upper):
+                return 'unbounded'
+            self._complement_column(tableau, pivot_col)
+            return None
+        
+        leaving_var = basic_vars[pivot_row]
+        self._pivot(tableau, pivot_row, pivot_col)
+        basic_vars[pivot_row] = pivot_col
+        self._set_basic_upper(pivot_row, pivot_col)
+        if leaves_at_upper:
+            self._complement_column(tableau, leaving_var)
+        return None
+    
+    def _prepare_workspace(self, tableau: np.ndarray, basic_vars: List[int]):
+        """
+        Reservar los buffers que reutilizan la prueba del cociente y el pivoteo
+        
+        Así ninguna iteración crea arreglos temporales del tamaño del tableau.
+        
+        Args:
+            tableau: Tableau sobre el que se va a iterar
+            basic_vars: Variables básicas iniciales
+        """
+        n_rows = tableau.shape[0] - 1
+        # Bloque de filas para la actualización de rango 1 (~512 KB, cabe en caché)
+        self._block_rows = max(1, min(tableau.shape[0], (1 << 16) // tableau.shape[1]))
+        # Con tableaus grandes la eliminación se reparte en franjas de filas
+        # entre hilos (NumPy libera el GIL en las operaciones de arreglos);
+        # cada hilo usa su propia parte del buffer
+        n_threads = self._n_threads or os.cpu_count() or 1
+        if tableau.size < self._parallel_pivot_size:
+            n_threads = 1
+        self._pivot_threads = max(1, min(n_threads, tableau.shape[0] // self._block_rows))
+        self._work = np.empty((self._pivot_threads, self._block_rows, tableau.shape[1]),
+                              dtype=tableau.dtype)
+        self._col_buffer = np.empty(tableau.shape[0], dtype=tableau.dtype)
+        self._row_buffer = np.empty(tableau.shape[1], dtype=tableau.dtype)
+        self._ratios = np.empty(n_rows, dtype=tableau.dtype)
+        self._positive = np.empty(n_rows, dtype=bool)
+        self._upper_rows = np.empty(n_rows, dtype=bool)
+        self._basic_upper = self.column_upper[basic_vars].astype(tableau.dtype)
+        self._basic_has_upper = np.isfinite(self._basic_upper)
+        
+        # En float32 el ruido de redondeo exige tolerancias más amplias
+        self._pivot_tolerance, self._feasibility_tolerance = TOLERANCES[tableau.dtype]
+        self._pricing.tolerance = max(self._pricing.tolerance, self._pivot_tolerance)
+    
+    def _set_basic_upper(self, row: int, var_idx: int):
+        """
+        Actualizar la cota superior de la variable básica de una fila
+        
+        Args:
+            row: Fila que cambió de variable básica
+            var_idx: Nueva variable básica
+        """
+        self._basic_upper[row] = self.column_upper[var_idx]
+        self._basic_has_upper[row] = np.isfinite(self._basic_upper[row])
+    
+    def _ratio_test(self, tableau: np.ndarray, pivot_col: int) -> Tuple[int, float, bool]:
+        """
+        Prueba del cociente mínimo para variables acotadas, vectorizada
+        
+        Una variable básica puede bajar hasta 0 (columna positiva) o subir
+        hasta su cota superior (columna negativa). Ambos casos se calculan
+        con operaciones enmascaradas sobre buffers preasignados.
+        
+        Args:
+            tableau: Tableau actual
+            pivot_col: Columna entrante
+            
+        Returns:
+            Tuple con (fila_pivote, cociente_mínimo, sale_en_cota_superior);
+            la fila es -1 y el cociente infinito si ninguna fila limita
+        """
+        n_rows = tableau.shape[0] - 1
+        if n_rows == 0:
+            return -1, float('inf'), False
+        
+        col = tableau[:-1, pivot_col]
+        rhs = tableau[:-1, -1]
+        ratios = self._ratios
+        
+        np.greater(col, self._pivot_tolerance, out=self._positive)
+        np.less(col, -self._pivot_tolerance, out=self._upper_rows)
+        np.logical_and(self._upper_rows, self._basic_has_upper, out=self._upper_rows)
+        
+        # Filas que bajan a 0: rhs / a
+        ratios.fill(np.inf)
+        np.divide(rhs, col, out=ratios, where=self._positive)
+        
+        # Filas que suben a su cota: (u - rhs) / -a = (rhs - u) / a
+        np.subtract(rhs, self._basic_upper, out=ratios, where=self._upper_rows)
+        np.divide(ratios, col, out=ratios, where=self._upper_rows)
+        
+        # Los cocientes negativos solo aparecen por redondeo (rhs = -0.0 tras
+        # el Simplex dual); equivalen a un paso degenerado
+        np.maximum(ratios, 0.0, out=ratios)
+        
+        pivot_row = int(np.argmin(ratios))
+        min_ratio = float(ratios[pivot_row])
+        if not np.isfinite(min_ratio):
+            return -1, min_ratio, False
+        
+        return pivot_row, min_ratio, bool(self._upper_rows[pivot_row])
+    
+    def _pivot(self, tableau: np.ndarray, pivot_row: int, pivot_col: int):
+        """
+        Realizar la operación de pivoteo sobre el tableau
+        
+        La eliminación se hace como una actualización de rango 1
+        (T -= col * fila_pivote) escrita sobre un buffer preasignado. El
+        tableau se recorre en bloques de filas del tamaño del buffer para
+        que el producto intermedio quede en caché, y se saltan los bloques
+        donde la columna pivote es cero. En tableaus grandes las filas se
+        reparten en franjas contiguas, una por hilo del pool.
+        
+        Args:
+            tableau: Tableau a modificar en el lugar
+            pivot_row: Fila pivote
+            pivot_col: Columna pivote
+        """
+        row = tableau[pivot_row]
+        
+        # Dividir fila pivote por elemento pivote
+        np.divide(row, tableau[pivot_row, pivot_col], out=row)
+        
+        # Hacer ceros en el resto de la columna pivote
+        col = self._col_buffer
+        np.copyto(col, tableau[:, pivot_col])
+        col[pivot_row] = 0.0
+        
+        n_rows = tableau.shape[0]
+        n_threads = self._pivot_threads
+        if n_threads == 1:
+            self._eliminate_rows(tableau, row, col, 0, n_rows, self._work[0])
+            return
+        
+        # Los hilos leen una copia de la fila pivote, que otra franja reescribe
+        row = self._row_buffer
+        np.copyto(row, tableau[pivot_row])
+        bounds = np.linspace(0, n_rows, n_threads + 1).astype(int)
+        pool = _pivot_pool(n_threads)
+        futures = [pool.submit(self._eliminate_rows, tableau, row, col,
+                               bounds[k], bounds[k + 1], self._work[k])
+                   for k in range(n_threads)]
+        for future in futures:
+            future.result()
+    
+    def _eliminate_rows(self, tableau: np.ndarray, row: np.ndarray, col: np.ndarray,
+                        first: int, last: int, work: np.ndarray):
+        """
+        Restar col * fila_pivote a las filas first..last-1 del tableau
+        
+        Args:
+            tableau: Tableau a modificar en el lugar
+            row: Fila pivote ya normalizada
+            col: Columna pivote (con cero en la fila pivote)
+            first: Primera fila de la franja
+            last: Fila siguiente a la última de la franja
+            work: Buffer de (bloque, columnas) para el producto intermedio
+        """
+        block = work.shape[0]
+        for start in range(first, last, block):
+            end = min(start + block, last)
+            col_block = col[start:end]
+            if not col_block.any():
+                continue
+            product = work[:end - start]
+            np.multiply(col_block[:, np.newaxis], row[np.newaxis, :], out=product)
+            np.subtract(tableau[start:end], product, out=tableau[start:end])
+    
+    def _complement_column(self, tableau: np.ndarray, col: int):
+        """
+        Pasar una variable no básica de una cota a la otra
+        
+        Se sustituye x por u - x: el lado derecho absorbe u veces la columna
+        y la columna cambia de signo.
+        
+        Args:
+            tableau: Tableau a modificar en el lugar
+            col: Columna de la variable no básica
+        """
+        np.multiply(tableau[:, col], self.column_upper[col], out=self._col_buffer)
+        tableau[:, -1] -= self._col_buffer
+        tableau[:, col] *= -1
+        self.complemented[col] = not self.complemented[col]
+    
+    def _save_iteration(self, tableau: np.ndarray, basic_vars: List[int], 
+                       pivot_row: int, pivot_col: int, iteration_num: int,
+                       leaving_var: int = -1, pivot_element: float = float('nan'),
+                       leaves_at_upper: bool = False, row_complement: bool = False,
+                       phase_change: bool = False, perturbation: bool = False):
+        """
+        Guardar información de una iteración en el historial
+        
+        El historial decide según su modo si copia el tableau; aquí no se
+        hace ninguna copia.
+        
+        Args:
+            tableau: Tableau actual
+            basic_vars: Variables básicas actuales
+            pivot_row: Fila pivote (-1 si es inicial o cambio de cota)
+            pivot_col: Columna pivote (-1 si es inicial)
+            iteration_num: Número de iteración
+            leaving_var: Variable que salió de la base (-1 si no hubo pivoteo)
+            pivot_element: Elemento pivote antes de pivotear
+            leaves_at_upper: Si la variable que salió quedó en su cota superior
+            row_complement: Si la variable que salió (Simplex dual) superaba su
+                cota superior y se complementó antes de pivotear
+            phase_change: Si la entrada marca el fin de la fase 1 (fila Z restaurada)
+            perturbation: Si la entrada aplica o retira la perturbación de los
+                lados derechos (no es un pivoteo)
+        """
+        is_optimal = False
+        if self.iterations.mode != 'none' and iteration_num > 0 and not self._in_phase_one:
+            is_optimal = bool(np.all(tableau[-1, :-1] >= -self._pivot_tolerance)) and \
+                self._is_primal_feasible(tableau)
+        
+        self.iterations.record(tableau, basic_vars, self.complemented, iteration_num,
+                               pivot_row, pivot_col, leaving_var, pivot_element, is_optimal,
+                               leaves_at_upper=leaves_at_upper, row_complement=row_complement,
+                               phase_change=phase_change, phase_one=self._in_phase_one,
+                               perturbation=perturbation)
+    
+    def solve_from_text(self, objective: str, restrictions: List[str],
+                        history: str = 'full', history_size: int = 10,
+                        pricing='dantzig', presolve: bool = False,
+                        scaling: bool = False) -> Dict:
+        """
+        Resolver problema directamente desde formato texto
+        
+        Args:
+            objective: Función objetivo como string
+            restrictions: Lista de restricciones como strings
+            history: Modo del historial de iteraciones ('none', 'summary', 'ring',
+                'full' o 'replay')
+            history_size: Tamaño del anillo en 'ring' o intervalo entre
+                tableaus de control en 'replay'
+            pricing: Regla de la variable entrante (solo el tableau denso)
+            presolve: Reducir el problema antes de resolverlo (solo el
+                tableau denso); el reporte queda en result['presolve']
+            scaling: Escalar filas y columnas antes de armar el tableau (solo
+                el tableau denso y sin presolve); la comparación queda en
+                result['scaling']
+            
+        Returns:
+            Diccionario con solución completa
+        """
+        try:
+            # Parsear problema (en forma dispersa si el solver la soporta)
+            c, A, b, lower, upper = self.parse_bounded_problem(objective, restrictions,
+                                                               sparse=self.sparse_input)
+            bounds = {'lower': lower, 'upper': upper, 'pricing': pricing}
+            
+            # Validar que se parseó correctamente (las cotas cuentan como restricciones)
+            has_bounds = bool(np.any(np.isfinite(upper)) or np.any(lower > 0))
+            if len(c) == 0 or (len(A) == 0 and not has_bounds):
+                return {
+                    'status': 'error',
+                    'message': 'No se pudieron parsear las restricciones correctamente',
+                    'iterations': []
+                }
+            
+            # Resolver
+            if presolve and not self.sparse_input:
+                return solve_with_presolve(self, c, A, b, history=history,
+                                           history_size=history_size, **bounds)
+            if scaling and not self.sparse_input:
+                return solve_scaled(self, c, A, b, history=history,
+                                    history_size=history_size, **bounds)
+            return self.solve(c, A, b, history=history, history_size=history_size, **bounds)
+        
+        except Exception as e:
+            return {
+                'status': 'error',
+                'message': f'Error al resolver: {str(e)}',
+                'iterations': []
+            }
+    
+    def get_iteration_summary(self, iteration_idx: int) -> str:
+        """
+        Obtener resumen de una iteración
+        
+        Args:
+            iteration_idx: Índice de la iteración
+            
+        Returns:
+            String con resumen
+        """
+        if iteration_idx >= len(self.iterations):
+            return "Iteración no válida"
+        
+        iter_data = self.iterations.get_iteration(iteration_idx)
+        
+        summary = f"{'='*60}\n"
+        if iter_data['iteration'] == 0:
+            summary += "TABLA INICIAL\n"
+        elif iter_data.get('phase_change'):
+            summary += f"FIN DE FASE 1 (ITERACIÓN {iter_data['iteration']})\n"
+        else:
+            summary += f"ITERACIÓN {iter_data['iteration']}\n"
+        summary += f"{'='*60}\n\n"
+        
+        if iter_data['pivot_row'] >= 0 and iter_data['pivot_col'] >= 0:
+            col_name = iter_data['col_names'][iter_data['pivot_col']]
+            row_name = iter_data['leaving_name']
+            pivot_val = iter_data['pivot_element']
             
             summary += f"Columna Pivote: {col_name} (columna {iter_data['pivot_col']})\n"
             summary += f"Fila Pivote: {row_name} (fila {iter_data['pivot_row']})\n"
             summary += f"Elemento Pivote: {pivot_val:.4f}\n\n"
+            if iter_data.get('row_complement'):
+                summary += f"Simplex dual: {row_name} excedía su cota superior y se complementó\n\n"
+        elif iter_data.get('bound_flip'):
+            col_name = iter_data['col_names'][iter_data['pivot_col']]
+            summary += f"Cambio de cota: {col_name} pasa a su cota opuesta (sin pivoteo)\n\n"
+        elif iter_data.get('phase_change'):
+            summary += "Se alcanzó una solución factible; se restaura la función objetivo\n\n"
+        elif iter_data.get('perturbation'):
+            summary += "Base repetida (ciclo): se perturban o restauran los lados derechos\n\n"
         
         if iter_data['is_optimal']:
             summary += "*** SOLUCIÓN ÓPTIMA ALCANZADA ***\n\n"
@@ -0,0 +1,131 @@
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+# Estados con los que termina una resolución interrumpida
+STOP_STATUSES = ('cancelled', 'time_limit')
+
+STOP_MESSAGES = {
+    'cancelled': 'Se canceló la resolución',
+    'time_limit': 'Se alcanzó el límite de tiempo'
+}
+
+
+class CancellationToken:
+    """
+    Señal de cancelación que se comparte entre el hilo que resuelve y el
+    que quiere detenerlo (por ejemplo, el botón de la interfaz gráfica).
+
+    El solver la consulta una vez por iteración, así que la cancelación
+    surte efecto en el siguiente pivoteo.
+    """
+
+    def __init__(self):
+        """Crear el token sin cancelar"""
+        self._event = threading.Event()
+
+    def cancel(self):
+        """Pedir que el solver se detenga"""
+        self._event.set()
+
+    def reset(self):
+        """Volver a dejar el token sin cancelar para reutilizarlo"""
+        self._event.clear()
+
+    @property
+    def cancelled(self) -> bool:
+        """Si se pidió la cancelación"""
+        return self._event.is_set()
+
+
+class SolveControl:
+    """
+    Cancelación, límite de tiempo y reporte de progreso de una resolución.
+
+    check se llama al comienzo de cada iteración: devuelve 'cancelled' o
+    'time_limit' si hay que detenerse y, como mucho una vez cada
+    progress_interval segundos, llama al callback de progreso con un
+    diccionario con 'iteration', 'objective', 'pivots_per_second' y
+    'elapsed'.
+    """
+
+    def __init__(self, cancel_token: Optional[CancellationToken] = None,
+                 time_limit: Optional[float] = None,
+                 progress: Optional[Callable[[Dict], None]] = None,
+                 progress_interval: float = 0.5):
+        """
+        Crear el control
+
+        Args:
+            cancel_token: Token de cancelación
+            time_limit: Segundos de reloj disponibles desde ahora
+            progress: Función que recibe el diccionario de progreso
+            progress_interval: Segundos mínimos entre dos reportes
+        """
+        self.cancel_token = cancel_token
+        self.progress = progress
+        self.progress_interval = progress_interval
+        self.start = time.perf_counter()
+        self.deadline = None if time_limit is None else self.start + time_limit
+        self._last_report = self.start
+        self._last_iteration = 0
+
+    def check(self, iteration: int, objective: float) -> Optional[str]:
+        """
+        Verificar si hay que detenerse y reportar el progreso
+
+        Args:
+            iteration: Iteración actual
+            objective: Valor actual de la función objetivo
+
+        Returns:
+            'cancelled', 'time_limit' o None para seguir
+        """
+        if self.cancel_token is not None and self.cancel_token.cancelled:
+            return 'cancelled'
+        now = time.perf_counter()
+        if self.deadline is not None and now >= self.deadline:
+            return 'time_limit'
+        if self.progress is not None and now - self._last_report >= self.progress_interval:
+            elapsed = now - self._last_report
+            self.progress({
+                'iteration': iteration,
+                'objective': float(objective),
+                'pivots_per_second': (iteration - self._last_iteration) / elapsed,
+                'elapsed': now - self.start
+            })
+            self._last_report = now
+            self._last_iteration = iteration
+        return None
+
+    def remaining(self) -> Optional[float]:
+        """
+        Segundos que quedan hasta el límite
+
+        Returns:
+            Segundos restantes (no negativos) o None si no hay límite
+        """
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.perf_counter())
+
+
+def make_control(cancel_token: Optional[CancellationToken] = None,
+                 time_limit: Optional[float] = None,
+                 progress: Optional[Callable[[Dict], None]] = None,
+                 progress_interval: float = 0.5) -> Optional[SolveControl]:
+    """
+    Crear un SolveControl solo si se pidió alguna de sus funciones
+
+    Args:
+        cancel_token: Token de cancelación
+        time_limit: Segundos de reloj disponibles
+        progress: Callback de progreso
+        progress_interval: Segundos mínimos entre reportes
+
+    Returns:
+        SolveControl o None (sin costo por iteración)
+    """
+    if cancel_token is None and time_limit is None and progress is None:
+        return None
+    return SolveControl(cancel_token, time_limit, progress, progress_interval)
@@ -0,0 +1,318 @@
+import inspect
+import time
+import numpy as np
+from typing import Callable, Dict, List, Optional, Tuple
+from sparse_matrix import SparseMatrix
+from simplex_solver import SimplexSolver
+from revised_simplex import RevisedSimplexSolver
+from interior_point import InteriorPointSolver
+from exact_simplex import ExactSimplexSolver
+from lp_model import LPModel
+
+# Umbrales de la selección automática. Son valores por defecto heurísticos
+# ajustados con `python benchmark_simplex.py --backends` (un núcleo, NumPy
+# con BLAS de referencia); conviene repetir esa medición en otra máquina
+SMALL_PROBLEM_SIZE = 32000      # m·n hasta el cual el tableau denso gana siempre
+SPARSE_MAX_DENSITY = 0.012      # densidad hasta la que el Simplex disperso gana...
+SPARSE_MIN_ROWS = 300           # ...desde estas filas (y sin ser muy ancho)
+INTERIOR_MIN_DENSITY = 0.004    # densidades desde las que el punto interior gana...
+INTERIOR_MAX_DENSITY = 0.5      # ...hasta esta, en problemas no pequeños
+WIDE_RATIO = 10                 # n / m desde el que el punto interior gana aunque A sea densa
+DENSE_TABLEAU_LIMIT = 25_000_000  # elementos de m·(n+m) desde los que el tableau no cabe cómodo
+
+
+class Backend:
+    """
+    Motor de resolución registrado.
+
+    Describe qué solver usar y qué estructura de problema soporta, para que
+    la selección automática solo considere motores capaces de resolverlo.
+    """
+
+    def __init__(self, name: str, factory: Callable[[], SimplexSolver],
+                 sparse_input: bool = False, supports_bounds: bool = True,
+                 supports_negative_rhs: bool = True, description: str = ''):
+        """
+        Crear la descripción del motor
+
+        Args:
+            name: Nombre con el que se elige (method='...')
+            factory: Función sin argumentos que crea una instancia del solver
+            sparse_input: Si recibe la matriz como SparseMatrix
+            supports_bounds: Si maneja cotas de variables distintas de [0, inf)
+            supports_negative_rhs: Si maneja lados derechos negativos
+            description: Descripción breve
+        """
+        self.name = name
+        self.factory = factory
+        self.sparse_input = sparse_input
+        self.supports_bounds = supports_bounds
+        self.supports_negative_rhs = supports_negative_rhs
+        self.description = description
+
+    def accepts(self, has_bounds: bool, negative_rhs: bool) -> bool:
+        """
+        Indicar si el motor puede resolver un problema con esta estructura
+
+        Args:
+            has_bounds: El problema tiene cotas de variables
+            negative_rhs: El problema tiene algún lado derecho negativo
+
+        Returns:
+            True si el motor lo soporta
+        """
+        return ((self.supports_bounds or not has_bounds)
+                and (self.supports_negative_rhs or not negative_rhs))
+
+
+BACKENDS: Dict[str, Backend] = {}
+
+
+def register_backend(backend: Backend):
+    """
+    Registrar (o reemplazar) un motor de resolución
+
+    Args:
+        backend: Descripción del motor
+    """
+    BACKENDS[backend.name] = backend
+
+
+register_backend(Backend('tableau', SimplexSolver,
+                         description='Simplex de tableau denso con cotas y fase 1 dual'))
+register_backend(Backend('revised', RevisedSimplexSolver,
+                         description='Simplex revisado con la matriz densa'))
+register_backend(Backend('sparse', RevisedSimplexSolver, sparse_input=True,
+                         description='Simplex revisado con la matriz dispersa'))
+register_backend(Backend('interior_point', InteriorPointSolver, supports_bounds=False,
+                         description='Punto interior de Mehrotra con crossover'))
+register_backend(Backend('exact', ExactSimplexSolver, supports_bounds=False,
+                         description='Simplex exacto con pivoteo entero de Bareiss'))
+
+
+def problem_profile(A, b: np.ndarray, lower: Optional[np.ndarray],
+                    upper: Optional[np.ndarray]) -> Dict:
+    """
+    Resumir la forma de un problema max c·x, A·x <= b, lower <= x <= upper
+
+    Args:
+        A: Matriz de restricciones (densa o SparseMatrix)
+        b: Lado derecho
+        lower: Cotas inferiores (None equivale a 0)
+        upper: Cotas superiores (None equivale a infinito)
+
+    Returns:
+        Diccionario con 'shape', 'nnz', 'density', 'has_bounds' y
+        'negative_rhs'
+    """
+    n_rows, n_cols = A.shape
+    nnz = A.nnz if isinstance(A, SparseMatrix) else int(np.count_nonzero(A))
+    has_bounds = ((lower is not None and bool(np.any(np.asarray(lower) > 0)))
+                  or (upper is not None and bool(np.any(np.isfinite(upper)))))
+    return {
+        'shape': (n_rows, n_cols),
+        'nnz': nnz,
+        'density': nnz / max(n_rows * n_cols, 1),
+        'has_bounds': has_bounds,
+        'negative_rhs': bool(np.any(np.asarray(b) < 0))
+    }
+
+
+def choose_backend(profile: Dict) -> Tuple[str, str]:
+    """
+    Elegir un motor para un problema con reglas heurísticas
+
+    Las reglas salen de benchmark_simplex.py --backends; son valores por
+    defecto razonables, no garantizan el motor más rápido en toda máquina.
+    En orden:
+    - problemas pequeños: el tableau denso (sin costo de factorización y
+      con el historial completo de iteraciones);
+    - tableau demasiado grande para la memoria: el Simplex disperso, que
+      guarda solo los no ceros;
+    - cotas de variables: el tableau (el punto interior no las maneja);
+    - muy disperso, con unas cuantas centenas de filas y no mucho más
+      ancho que alto: el Simplex disperso, que hace los mismos pivoteos
+      que el tableau pero calcula precios solo sobre los no ceros;
+    - densidad intermedia o muchas más columnas que filas: el punto
+      interior, cuyo número de iteraciones casi no crece con el tamaño
+      mientras el Simplex necesita cada vez más pivoteos;
+    - en otro caso (denso y casi cuadrado, o muy disperso), el tableau.
+
+    El Simplex revisado con A densa no se elige automáticamente: en las
+    mediciones (benchmark_simplex.py --revised) solo supera al tableau en
+    problemas densos casi cuadrados de unos cientos de filas, donde el
+    punto interior y el tableau quedan cerca.
+
+    Args:
+        profile: Resultado de problem_profile
+
+    Returns:
+        Tuple con (nombre del motor, razón de la elección)
+    """
+    n_rows, n_cols = profile['shape']
+    density = profile['density']
+    has_bounds = profile['has_bounds']
+
+    if n_rows * n_cols <= SMALL_PROBLEM_SIZE:
+        return 'tableau', f'problema pequeño ({n_rows}x{n_cols}): el tableau denso'
+    if n_rows * (n_rows + n_cols) >= DENSE_TABLEAU_LIMIT:
+        return 'sparse', f'el tableau denso ({n_rows}x{n_rows + n_cols}) ocupa demasiada memoria'
+    if has_bounds:
+        return 'tableau', 'el problema tiene cotas de variables'
+    if (density <= SPARSE_MAX_DENSITY and n_rows >= SPARSE_MIN_ROWS
+            and n_cols < WIDE_RATIO * n_rows):
+        return 'sparse', f'muy disperso ({density:.3f}) en un problema de {n_rows}x{n_cols}'
+    if INTERIOR_MIN_DENSITY <= density <= INTERIOR_MAX_DENSITY:
+        return 'interior_point', f'densidad intermedia ({density:.3f}) en un problema de {n_rows}x{n_cols}'
+    if n_cols >= WIDE_RATIO * n_rows:
+        return 'interior_point', f'muchas más columnas que filas ({n_rows}x{n_cols})'
+    return 'tableau', f'problema de {n_rows}x{n_cols} con densidad {density:.3f}'
+
+
+def _accepted_options(solver: SimplexSolver, options: Dict) -> Tuple[Dict, List[str]]:
+    """
+    Separar las opciones que acepta solver.solve
+
+    Args:
+        solver: Instancia del solver
+        options: Opciones pedidas
+
+    Returns:
+        Tuple con (opciones aceptadas, nombres de las ignoradas)
+    """
+    parameters = inspect.signature(solver.solve).parameters
+    accepted = {k: v for k, v in options.items() if k in parameters}
+    return accepted, sorted(set(options) - set(accepted))
+
+
+def _call_solver(backend: Backend, solver: SimplexSolver, c: np.ndarray, A, b: np.ndarray,
+                 lower: Optional[np.ndarray], upper: Optional[np.ndarray],
+                 options: Dict) -> Tuple[Dict, List[str]]:
+    """
+    Llamar a solver.solve con las opciones que acepta
+
+    Args:
+        backend: Motor elegido
+        solver: Instancia del solver
+        c: Coeficientes de la función objetivo
+        A: Matriz de restricciones
+        b: Lado derecho
+        lower: Cotas inferiores
+        upper: Cotas superiores
+        options: Opciones adicionales para solve
+
+    Returns:
+        Tuple con (resultado, nombres de las opciones ignoradas)
+    """
+    accepted, ignored = _accepted_options(solver, options)
+    if isinstance(A, SparseMatrix) and not backend.sparse_input:
+        A = A.to_dense()
+    elif backend.sparse_input and not isinstance(A, SparseMatrix):
+        A = SparseMatrix.from_dense(np.asarray(A, dtype=float))
+    if backend.supports_bounds:
+        return solver.solve(c, A, b, lower, upper, **accepted), ignored
+    return solver.solve(c, A, b, **accepted), ignored
+
+
+def solve(model, method: str = 'auto', cache=None, **options) -> Dict:
+    """
+    Resolver un problema eligiendo el motor por su forma
+
+    Args:
+        model: LPModel o tuple (c, A, b) / (c, A, b, lower, upper) de un
+            problema de maximización con A·x <= b; A puede ser densa o
+            SparseMatrix
+        method: 'auto' o el nombre de un motor registrado ('tableau',
+            'revised', 'sparse', 'interior_point', 'exact'); 'exact' nunca se
+            elige automáticamente
+        cache: ResultCache opcional; un problema ya resuelto con el mismo
+            motor y las mismas opciones se devuelve sin volver a resolverlo
+            (result['cache'])
+        **options: Opciones para solver.solve (history, max_iterations,
+            pricing, ...); las que el motor elegido no acepta se ignoran y
+            quedan listadas en result['backend']
+
+    Returns:
+        Diccionario del solver con 'backend': motor, razón de la elección,
+        forma y densidad del problema, opciones ignoradas y tiempo
+    """
+    if method != 'auto' and method not in BACKENDS:
+        raise ValueError(f"Motor no válido: {method}. Opciones: auto, {', '.join(BACKENDS)}")
+
+    if isinstance(model, LPModel):
+        invalid = model.check_bounds()
+        if invalid is not None:
+            return invalid
+        c, A, b, lower, upper = model.to_standard_form(sparse=True)
+    else:
+        c, A, b, *bounds = model
+        lower, upper = (list(bounds) + [None, None])[:2]
+        c = np.asarray(c, dtype=float)
+        b = np.asarray(b, dtype=float)
+        if not isinstance(A, SparseMatrix):
+            A = np.asarray(A, dtype=float).reshape(len(b), len(c))
+
+    profile = problem_profile(A, b, lower, upper)
+    if method == 'auto':
+        name, reason = choose_backend(profile)
+    else:
+        name, reason = method, 'elegido por el usuario'
+    backend = BACKENDS[name]
+    if not backend.accepts(profile['has_bounds'], profile['negative_rhs']):
+        return {
+            'status': 'error',
+            'message': f"El motor '{name}' no soporta cotas de variables ni lados derechos negativos",
+            'iterations': []
+        }
+
+    start = time.perf_counter()
+    solver = backend.factory()
+    if cache is None:
+        result, ignored = _call_solver(backend, solver, c, A, b, lower, upper, options)
+    else:
+        accepted, ignored = _accepted_options(solver, options)
+        result = cache.solve(
+            c, A, b, lower, upper, solver=name,
+            solve_fn=lambda *problem, **kw: _call_solver(backend, solver, *problem, kw)[0],
+            **accepted)
+    elapsed = time.perf_counter() - start
+    if isinstance(model, LPModel):
+        result = model.recover_result(result)
+    result['backend'] = dict(profile, method=name, reason=reason,
+                             ignored_options=ignored, time=elapsed)
+    return result
+
+
+def solve_text(objective: str, restrictions: List[str], method: str = 'auto', **options) -> Dict:
+    """
+    Resolver un problema en formato texto eligiendo el motor
+
+    Args:
+        objective: Función objetivo como string
+        restrictions: Lista de restricciones como strings
+        method: 'auto' o el nombre de un motor registrado
+        **options: Opciones para solver.solve
+
+    Returns:
+        Diccionario con la solución completa (ver solve)
+    """
+    try:
+        # Las restricciones se leen como tripletas: el perfil se calcula sin
+        # matriz densa y el motor disperso la recibe tal cual (los motores
+        # densos la expanden en _call_solver)
+        c, A, b, lower, upper = SimplexSolver().parse_bounded_problem(objective, restrictions,
+                                                                      sparse=True)
+        if len(c) == 0 or (A.shape[0] == 0 and not np.any(np.isfinite(upper))
+                           and not np.any(lower > 0)):
+            return {
+                'status': 'error',
+                'message': 'No se pudieron parsear las restricciones correctamente',
+                'iterations': []
+            }
+        return solve((c, A, b, lower, upper), method=method, **options)
+    except Exception as e:
+        return {
+            'status': 'error',
+            'message': f'Error al resolver: {str(e)}',
+            'iterations': []
+        }
@@ -0,0 +1,168 @@
+import numpy as np
+from typing import Tuple, Sequence
+
+
+class SparseMatrix:
+    """
+    Matriz dispersa en formato comprimido por columnas (CSC).
+
+    Solo guarda los elementos distintos de cero, por lo que la memoria
+    crece con nnz y no con m·n. Además de los arreglos CSC se guarda la
+    columna de cada elemento para poder calcular productos y^T A con una
+    sola pasada vectorizada sobre los no ceros.
+    """
+
+    def __init__(self, shape: Tuple[int, int], indptr: np.ndarray,
+                 indices: np.ndarray, data: np.ndarray):
+        """
+        Crear la matriz a partir de sus arreglos CSC
+
+        Args:
+            shape: Dimensiones (filas, columnas)
+            indptr: Inicio de cada columna en indices/data (tamaño n + 1)
+            indices: Fila de cada elemento no cero
+            data: Valor de cada elemento no cero
+        """
+        self.shape = (int(shape[0]), int(shape[1]))
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.data = np.asarray(data, dtype=float)
+        self._col_of_nnz = np.repeat(np.arange(self.shape[1]), np.diff(self.indptr))
+
+    @classmethod
+    def from_triplets(cls, rows: Sequence[int], cols: Sequence[int],
+                      vals: Sequence[float], shape: Tuple[int, int]) -> 'SparseMatrix':
+        """
+        Construir la matriz desde tripletas de coordenadas (COO)
+
+        Los elementos repetidos se suman y los ceros explícitos se descartan.
+
+        Args:
+            rows: Fila de cada elemento
+            cols: Columna de cada elemento
+            vals: Valor de cada elemento
+            shape: Dimensiones (filas, columnas)
+
+        Returns:
+            SparseMatrix en formato CSC
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        vals = np.asarray(vals, dtype=float)
+        n_rows, n_cols = shape
+
+        if len(vals) > 0:
+            # Ordenar por columna y luego por fila, sumando duplicados
+            keys = cols * max(n_rows, 1) + rows
+            order = np.argsort(keys, kind='stable')
+            keys = keys[order]
+            unique_keys, start = np.unique(keys, return_index=True)
+            summed = np.add.reduceat(vals[order], start)
+            keep = summed != 0.0
+            unique_keys = unique_keys[keep]
+            summed = summed[keep]
+            cols = unique_keys // max(n_rows, 1)
+            rows = unique_keys % max(n_rows, 1)
+            vals = summed
+
+        indptr = np.zeros(n_cols + 1, dtype=np.int64)
+        np.cumsum(np.bincount(cols, minlength=n_cols), out=indptr[1:])
+        return cls(shape, indptr, rows, vals)
+
+    @classmethod
+    def from_dense(cls, A: np.ndarray) -> 'SparseMatrix':
+        """
+        Construir la matriz dispersa desde un arreglo denso
+
+        Args:
+            A: Matriz densa
+
+        Returns:
+            SparseMatrix equivalente
+        """
+        A = np.atleast_2d(np.asarray(A, dtype=float))
+        rows, cols = np.nonzero(A)
+        return cls.from_triplets(rows, cols, A[rows, cols], A.shape)
+
+    @property
+    def nnz(self) -> int:
+        """Número de elementos distintos de cero"""
+        return len(self.data)
+
+    def __len__(self) -> int:
+        """Número de filas (igual que len() de un arreglo denso)"""
+        return self.shape[0]
+
+    def column(self, j: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Obtener los no ceros de una columna
+
+        Args:
+            j: Índice de la columna
+
+        Returns:
+            Tuple con (filas, valores)
+        """
+        start, end = self.indptr[j], self.indptr[j + 1]
+        return self.indices[start:end], self.data[start:end]
+
+    def column_dense(self, j: int) -> np.ndarray:
+        """
+        Obtener una columna como vector denso de tamaño m
+
+        Args:
+            j: Índice de la columna
+
+        Returns:
+            Vector denso con la columna
+        """
+        col = np.zeros(self.shape[0])
+        rows, vals = self.column(j)
+        col[rows] = vals
+        return col
+
+    def matvec(self, x: np.ndarray) -> np.ndarray:
+        """
+        Calcular A x recorriendo solo los no ceros
+
+        Args:
+            x: Vector de tamaño n
+
+        Returns:
+            Vector de tamaño m
+        """
+        return np.bincount(self.indices, weights=self.data * x[self._col_of_nnz],
+                           minlength=self.shape[0])
+
+    def rmatvec(self, y: np.ndarray) -> np.ndarray:
+        """
+        Calcular y^T A recorriendo solo los no ceros
+
+        Args:
+            y: Vector de tamaño m
+
+        Returns:
+            Vector de tamaño n
+        """
+        return np.bincount(self._col_of_nnz, weights=self.data * y[self.indices],
+                           minlength=self.shape[1])
+
+    def to_dense(self) -> np.ndarray:
+        """
+        Convertir a arreglo denso
+
+        Returns:
+            Matriz densa de tamaño m x n
+        """
+        A = np.zeros(self.shape)
+        A[self.indices, self._col_of_nnz] = self.data
+        return A
+
+    def to_triplets(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Obtener los no ceros como tripletas de coordenadas (COO)
+
+        Returns:
+            Tuple con (filas, columnas, valores)
+        """
+        return self.indices, self._col_of_nnz, self.data